@@ -1,7 +1,17 @@
-from django.contrib import admin
+import tempfile
+
+from django.contrib import admin, messages
 from django.contrib.auth.admin import UserAdmin
+from django.contrib.admin.views.main import ORDER_VAR, ChangeList
+from django.db.models import Case, FloatField, Value, When
+from django.db.models.functions import Length, Substr
+from django.http import FileResponse, StreamingHttpResponse
 from django.utils.html import format_html
-from .models import RecruitmentSettings, Question, Applicant, Application, Answer
+from . import exports
+from .models import RecruitmentSettings, Question, Applicant, Application, Answer, PhotoJob, OutboundEmail, StatusChange
+from .transitions import transition_applications
+from .search import MAX_RESULTS, search_applications
+from .recruitment import registry
 
 @admin.register(RecruitmentSettings)
 class RecruitmentSettingsAdmin(admin.ModelAdmin):
@@ -10,7 +20,7 @@ class RecruitmentSettingsAdmin(admin.ModelAdmin):
     readonly_fields = ['created_at', 'updated_at']
 
     def has_add_permission(self, request):
-        if RecruitmentSettings.objects.filter(is_active=True).exists():
+        if registry.has_active():
             return False
         return super().has_add_permission(request)
 
@@ -22,13 +32,14 @@ class QuestionAdmin(admin.ModelAdmin):
 
 @admin.register(Applicant)
 class ApplicantAdmin(UserAdmin):
-    list_display = ('email', 'name', 'phone_number', 'university', 'major', 'grade', 'academic_status', 'is_active')
+    list_display = ('profile_picture_preview', 'email', 'name', 'phone_number', 'university', 'major', 'grade', 'academic_status', 'is_active')
+    readonly_fields = ('profile_picture_detail', 'photo_status')
     search_fields = ('email', 'name', 'phone_number')
     ordering = ('-date_joined',)
     
     fieldsets = (
         (None, {'fields': ('email', 'password')}),
-        ('개인정보', {'fields': ('name', 'phone_number', 'birth_date')}),
+        ('개인정보', {'fields': ('name', 'phone_number', 'birth_date', 'photo', 'profile_picture_detail', 'photo_status')}),
         ('학적정보', {'fields': ('university', 'major', 'grade', 'academic_status')}),
         ('권한', {'fields': ('is_active', 'is_staff', 'is_superuser', 'groups', 'user_permissions')}),
         ('중요 일자', {'fields': ('last_login', 'date_joined')}),
@@ -42,11 +53,22 @@ class ApplicantAdmin(UserAdmin):
     )
 
     def profile_picture_preview(self, obj):
-        if obj.profile_picture:
-            return format_html('<img src="{}" style="max-width: 200px; max-height: 200px;" />', obj.profile_picture.url)
-        return "No picture uploaded"
+        url = obj.get_photo_rendition_url('thumbnail')
+        if url:
+            return format_html('<img src="{}" width="60" height="80" loading="lazy" />', url)
+        return obj.get_photo_status_display() if obj.photo else "No picture uploaded"
     profile_picture_preview.short_description = '프로필 사진 미리보기'
 
+    def profile_picture_detail(self, obj):
+        url = obj.get_photo_rendition_url('detail')
+        if url:
+            return format_html(
+                '<img src="{}" width="108" height="144" /> <a href="{}" target="_blank">인쇄용 보기</a>',
+                url, obj.get_photo_rendition_url('print')
+            )
+        return self.profile_picture_preview(obj)
+    profile_picture_detail.short_description = '프로필 사진'
+
 class AnswerInline(admin.TabularInline):
     model = Answer
     extra = 0
@@ -57,8 +79,85 @@ class AnswerInline(admin.TabularInline):
     def has_add_permission(self, request, obj=None):
         return False
 
+class StatusChangeInline(admin.TabularInline):
+    model = StatusChange
+    extra = 0
+    fields = ['from_status', 'to_status', 'changed_by', 'created_at']
+    readonly_fields = fields
+    can_delete = False
+    max_num = 0
+
+class SearchRankChangeList(ChangeList):
+    def get_ordering(self, request, queryset):
+        # 정렬을 따로 고르지 않았다면 검색 관련도 순으로 보여줍니다
+        if 'search_rank' in queryset.query.annotations and ORDER_VAR not in self.params:
+            return ['-search_rank', '-pk']
+        return super().get_ordering(request, queryset)
+
+
+class FullTextSearchMixin:
+    """
+    관리자 검색창을 LIKE 검색 대신 지원서 전문 검색(applications.search)으로 처리합니다.
+    search_application_field는 모델에서 지원서 ID를 가리키는 필드입니다.
+    """
+    search_application_field = 'pk'
+
+    def get_search_results(self, request, queryset, search_term):
+        search_term = search_term.strip()
+        if not search_term:
+            return queryset, False
+        # 하나 더 가져와 관련도 상위 MAX_RESULTS건에서 잘렸는지 확인합니다
+        results = search_applications(search_term, limit=MAX_RESULTS + 1)
+        if len(results) > MAX_RESULTS:
+            results = results[:MAX_RESULTS]
+            messages.warning(
+                request, f'검색 결과가 너무 많아 관련도가 높은 지원서 {MAX_RESULTS}건만 표시합니다. 검색어를 더 구체적으로 입력해주세요.'
+            )
+        queryset = queryset.filter(**{f'{self.search_application_field}__in': [pk for pk, _ in results]})
+        if results:
+            queryset = queryset.annotate(search_rank=Case(
+                *[When(**{self.search_application_field: pk}, then=Value(score)) for pk, score in results],
+                default=Value(0.0),
+                output_field=FloatField(),
+            ))
+        return queryset, False
+
+    def get_changelist(self, request, **kwargs):
+        return SearchRankChangeList
+
+
+def make_transition_action(to_status, label):
+    def action(modeladmin, request, queryset):
+        changed, skipped = transition_applications(queryset, to_status, changed_by=request.user)
+        message = f'{changed}건을 {label}(으)로 변경했습니다.'
+        if skipped:
+            message += f' 현재 상태에서 바꿀 수 없는 {skipped}건은 건너뛰었습니다.'
+        modeladmin.message_user(request, message)
+    action.__name__ = f'transition_to_{to_status}'
+    action.short_description = f'선택한 지원서를 {label}(으)로 변경'
+    return action
+
+@admin.action(description='선택한 지원서를 CSV로 내보내기')
+def export_csv(modeladmin, request, queryset):
+    response = StreamingHttpResponse(exports.iter_csv(queryset), content_type='text/csv; charset=utf-8')
+    response['Content-Disposition'] = f'attachment; filename="{exports.export_filename("csv")}"'
+    return response
+
+@admin.action(description='선택한 지원서를 엑셀(XLSX)로 내보내기')
+def export_xlsx(modeladmin, request, queryset):
+    # XLSX는 압축 파일이라 끝까지 쓴 뒤에 보낼 수 있으므로 임시 파일에 만들어 스트리밍합니다
+    file = tempfile.TemporaryFile()
+    exports.write_xlsx(queryset, file)
+    file.seek(0)
+    return FileResponse(
+        file,
+        as_attachment=True,
+        filename=exports.export_filename('xlsx'),
+        content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    )
+
 @admin.register(Application)
-class ApplicationAdmin(admin.ModelAdmin):
+class ApplicationAdmin(FullTextSearchMixin, admin.ModelAdmin):
     list_display = [
         'applicant_name',
         'applicant_email',
@@ -70,13 +169,20 @@ class ApplicationAdmin(admin.ModelAdmin):
         'created_at'
     ]
     list_filter = ['status', 'recruitment_settings']
+    list_select_related = ['applicant', 'recruitment_settings']
     search_fields = ['applicant__email', 'applicant__name', 'applicant__phone_number']
+    search_help_text = '이름, 이메일, 전화번호, 학교, 전공, 답변 내용으로 검색합니다.'
     readonly_fields = [
         'created_at', 'updated_at', 'submitted_at',
         'applicant_details', 'get_interview_preferences',
         'get_interview_schedule'
     ]
-    inlines = [AnswerInline]
+    inlines = [AnswerInline, StatusChangeInline]
+    actions = [
+        make_transition_action(status, label)
+        for status, label in Application.STATUS_CHOICES
+        if status not in ('draft', 'submitted')
+    ] + [export_csv, export_xlsx]
     fieldsets = (
         ('지원자 정보', {
             'fields': ('applicant_details',)
@@ -99,6 +205,17 @@ class ApplicationAdmin(admin.ModelAdmin):
         }),
     )
 
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        # 한 건씩 수정한 상태 변경도 기록을 남깁니다
+        if change and 'status' in form.changed_data:
+            StatusChange.objects.create(
+                application=obj,
+                from_status=form.initial['status'],
+                to_status=obj.status,
+                changed_by=request.user
+            )
+
     def applicant_name(self, obj):
         return obj.applicant.name
     applicant_name.short_description = '이름'
@@ -149,10 +266,23 @@ class ApplicationAdmin(admin.ModelAdmin):
     applicant_details.short_description = '지원자 상세 정보'
 
 @admin.register(Answer)
-class AnswerAdmin(admin.ModelAdmin):
+class AnswerAdmin(FullTextSearchMixin, admin.ModelAdmin):
     list_display = ['get_applicant_name', 'get_question_text', 'get_answer_preview']
     list_filter = ['application__recruitment_settings', 'question']
     search_fields = ['application__applicant__email', 'application__applicant__name', 'answer_text']
+    search_application_field = 'application_id'
+    search_help_text = '이름, 이메일, 전화번호, 학교, 전공, 답변 내용으로 검색합니다.'
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request).select_related('application__applicant', 'question')
+        if request.resolver_match and request.resolver_match.url_name.endswith('_changelist'):
+            # 목록에서는 긴 답변/질문 전문 대신 DB에서 잘라낸 미리보기만 가져옵니다
+            queryset = queryset.annotate(
+                answer_preview=Substr('answer_text', 1, 100),
+                answer_length=Length('answer_text'),
+                question_preview=Substr('question__question_text', 1, 50),
+            ).defer('answer_text', 'question__question_text')
+        return queryset
 
     def get_applicant_name(self, obj):
         return obj.application.applicant.name
@@ -160,10 +290,28 @@ class AnswerAdmin(admin.ModelAdmin):
     get_applicant_name.admin_order_field = 'application__applicant__name'
 
     def get_question_text(self, obj):
+        if hasattr(obj, 'question_preview'):
+            return obj.question_preview
         return obj.question.question_text[:50]
     get_question_text.short_description = '질문'
     get_question_text.admin_order_field = 'question__question_text'
 
     def get_answer_preview(self, obj):
+        if hasattr(obj, 'answer_preview'):
+            return obj.answer_preview + '...' if obj.answer_length > 100 else obj.answer_preview
         return obj.answer_text[:100] + '...' if len(obj.answer_text) > 100 else obj.answer_text
     get_answer_preview.short_description = '답변 미리보기'
+
+@admin.register(PhotoJob)
+class PhotoJobAdmin(admin.ModelAdmin):
+    list_display = ['applicant', 'photo', 'status', 'attempts', 'available_at', 'updated_at']
+    list_filter = ['status']
+    list_select_related = ['applicant']
+    readonly_fields = ['applicant', 'photo', 'attempts', 'last_error', 'created_at', 'updated_at']
+
+@admin.register(OutboundEmail)
+class OutboundEmailAdmin(admin.ModelAdmin):
+    list_display = ['to_email', 'subject', 'status', 'attempts', 'created_at', 'sent_at']
+    list_filter = ['status']
+    search_fields = ['to_email', 'subject']
+    readonly_fields = ['applicant', 'to_email', 'subject', 'body', 'html_body', 'dedupe_key', 'attempts', 'last_error', 'created_at', 'updated_at', 'sent_at']
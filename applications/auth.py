@@ -1,19 +1,44 @@
+from django.conf import settings
 from django.contrib.auth.backends import ModelBackend
-from django.db.models import Q
+from django.core.cache import cache
 from .models import Applicant
 
+# 매 요청 request.user로 읽어 오는 필드. 사진, 프로필, 토큰 필드는 필요할 때 따로 조회합니다.
+AUTH_USER_FIELDS = [
+    'id', 'password', 'last_login', 'is_superuser', 'username', 'first_name', 'last_name',
+    'is_staff', 'is_active', 'name', 'email', 'is_email_verified',
+]
+
+
+def user_cache_key(user_id):
+    return f'applications:auth:user:{user_id}'
+
+
+def invalidate_user_cache(user_id):
+    cache.delete(user_cache_key(user_id))
+
+
 class EmailBackend(ModelBackend):
     def authenticate(self, request, username=None, password=None, **kwargs):
         try:
             # 로그인은 이메일을 기준으로만 조회합니다
-            user = Applicant.objects.get(Q(email=username))
+            user = Applicant.objects.only(*AUTH_USER_FIELDS).get(email=username)
+            # 해시 설정이 바뀌었으면 check_password가 새 설정으로 다시 해시해 저장합니다
             if user.check_password(password):
                 return user
         except Applicant.DoesNotExist:
             return None
 
     def get_user(self, user_id):
-        try:
-            return Applicant.objects.get(pk=user_id)
-        except Applicant.DoesNotExist:
-            return None 
\ No newline at end of file
+        # 세션마다 매 요청 조회하지 않도록 공유 캐시에 잠시 두며, 지원자가 저장되면 커밋 후 시그널로 지웁니다
+        timeout = getattr(settings, 'AUTH_USER_CACHE_TIMEOUT', 0)
+        if not timeout:
+            return Applicant.objects.only(*AUTH_USER_FIELDS).filter(pk=user_id).first()
+        key = user_cache_key(user_id)
+        user = cache.get(key)
+        if user is None:
+            user = Applicant.objects.only(*AUTH_USER_FIELDS).filter(pk=user_id).first()
+            if user is None:
+                return None
+            cache.set(key, user, timeout)
+        return user
@@ -0,0 +1,27 @@
+from django.conf import settings
+from django.core.checks import Error, Tags, register
+
+# 프로세스마다 따로 값을 갖는 캐시. gunicorn 워커가 여럿이면 서로 다른 값을 보게 됩니다.
+PROCESS_LOCAL_CACHES = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+
+def is_shared_cache(alias='default'):
+    return settings.CACHES.get(alias, {}).get('BACKEND') not in PROCESS_LOCAL_CACHES
+
+
+@register(Tags.caches, deploy=True)
+def check_shared_cache(app_configs, **kwargs):
+    # 세션, 로그인 사용자, 요청 제한, 모집/질문 캐시는 워커끼리 같은 캐시를 봐야 합니다
+    aliases = {'default', getattr(settings, 'SESSION_CACHE_ALIAS', 'default')}
+    return [
+        Error(
+            f"CACHES['{alias}']가 프로세스마다 따로 동작하는 캐시({settings.CACHES[alias]['BACKEND']})입니다.",
+            hint='REDIS_URL을 설정하거나 DatabaseCache를 쓰고 python manage.py createcachetable을 실행하세요.',
+            id='applications.E001',
+        )
+        for alias in sorted(aliases)
+        if alias in settings.CACHES and not is_shared_cache(alias)
+    ]
@@ -0,0 +1,140 @@
+import csv
+import datetime
+
+from django.utils import timezone
+from openpyxl import Workbook
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+
+from .models import Answer, Application, Question
+
+CHUNK_SIZE = 2000
+
+# 지원서 한 건이 한 행이 되며, 이 필드들 뒤에 질문별 답변 열이 붙습니다
+EXPORT_FIELDS = [
+    'id',
+    'recruitment_settings__title',
+    'status',
+    'submitted_at',
+    'applicant__name',
+    'applicant__email',
+    'applicant__phone_number',
+    'applicant__birth_date',
+    'applicant__university',
+    'applicant__major',
+    'applicant__grade',
+    'applicant__academic_status',
+    'interview_sat_morning',
+    'interview_sat_afternoon',
+    'interview_sun_morning',
+    'interview_sun_afternoon',
+    'interview_date',
+    'interview_start_time',
+    'interview_location',
+]
+
+# 스프레드시트에서 수식으로 해석되는 값은 앞에 '를 붙여 문자열로 둡니다
+FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+
+def get_export_field(lookup):
+    model = Application
+    *relations, name = lookup.split('__')
+    for relation in relations:
+        model = model._meta.get_field(relation).related_model
+    return model._meta.get_field(name)
+
+
+def format_value(value, choices=None):
+    if value is None:
+        return ''
+    if choices:
+        return choices.get(value, value)
+    if isinstance(value, bool):
+        return 'O' if value else ''
+    if isinstance(value, datetime.datetime):
+        return timezone.localtime(value).strftime('%Y-%m-%d %H:%M')
+    if isinstance(value, datetime.time):
+        return value.strftime('%H:%M')
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def export_questions(applications):
+    # 선택된 지원서가 속한 모집 기수의 질문들을 기수, 순서대로 한 열씩 배치합니다
+    return list(
+        Question.objects.filter(
+            recruitment_settings__in=applications.values('recruitment_settings')
+        ).order_by('recruitment_settings_id', 'order', 'pk').values_list('pk', 'question_text')
+    )
+
+
+def export_header(questions):
+    fields = [str(get_export_field(lookup).verbose_name) for lookup in EXPORT_FIELDS]
+    return fields + [question_text for _, question_text in questions]
+
+
+def export_rows(applications, questions, chunk_size=CHUNK_SIZE):
+    """
+    지원서와 답변을 각각 지원서 ID 순으로 읽으면서 한 번에 맞물려(merge join)
+    답변을 질문 열로 펼칩니다. 두 쿼리 모두 chunk_size 단위로 가져오므로
+    지원서 수와 관계없이 메모리에는 한 묶음만 올라갑니다.
+    """
+    columns = {question_id: index for index, (question_id, _) in enumerate(questions)}
+    choices = []
+    for lookup in EXPORT_FIELDS:
+        field = get_export_field(lookup)
+        choices.append(dict(field.flatchoices) if field.choices else None)
+
+    applications = applications.order_by('pk')
+    answers = (
+        Answer.objects.filter(application__in=applications.values('pk'))
+        .order_by('application_id')
+        .values_list('application_id', 'question_id', 'answer_text')
+        .iterator(chunk_size=chunk_size)
+    )
+    answer = next(answers, None)
+
+    for values in applications.values_list(*EXPORT_FIELDS).iterator(chunk_size=chunk_size):
+        application_id = values[0]
+        cells = [''] * len(questions)
+        while answer is not None and answer[0] <= application_id:
+            if answer[0] == application_id and answer[1] in columns:
+                cells[columns[answer[1]]] = format_value(answer[2])
+            answer = next(answers, None)
+        yield [format_value(value, field_choices) for value, field_choices in zip(values, choices)] + cells
+
+
+class Echo:
+    # csv.writer가 쓴 한 줄을 그대로 돌려받기 위한 버퍼
+    def write(self, value):
+        return value
+
+
+def iter_csv(applications, chunk_size=CHUNK_SIZE):
+    writer = csv.writer(Echo())
+    questions = export_questions(applications)
+    # 엑셀에서 한글이 깨지지 않도록 BOM을 붙입니다
+    yield '\ufeff' + writer.writerow(export_header(questions))
+    for row in export_rows(applications, questions, chunk_size):
+        yield writer.writerow(row)
+
+
+def write_xlsx(applications, file, chunk_size=CHUNK_SIZE):
+    # write_only 모드는 행을 임시 파일로 흘려보내므로 메모리 사용량이 일정합니다
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet('지원서')
+    questions = export_questions(applications)
+    sheet.append(export_header(questions))
+    for row in export_rows(applications, questions, chunk_size):
+        sheet.append([
+            ILLEGAL_CHARACTERS_RE.sub('', value) if isinstance(value, str) else value
+            for value in row
+        ])
+    workbook.save(file)
+
+
+def export_filename(extension):
+    return f'applications-{timezone.localdate():%Y%m%d}.{extension}'
@@ -1,6 +1,8 @@
 from django import forms
 from django.contrib.auth.forms import UserCreationForm, PasswordResetForm, AuthenticationForm
 from django.core.exceptions import ValidationError
+from django.utils.html import conditional_escape
+from django.utils.safestring import mark_safe
 from .models import Applicant, Application, Answer, Question
 import re
 
@@ -87,7 +89,45 @@ class CustomPasswordResetForm(PasswordResetForm):
             raise ValidationError('입력하신 이메일로 등록된 계정을 찾을 수 없습니다.')
         return email
 
+class PrecompiledTextarea(forms.Textarea):
+    """
+    처음 그린 HTML을 값 앞뒤로 나눠 보관하고, 같은 이름/속성이면 값만 이스케이프해 끼워 넣습니다.
+    위젯은 폼 인스턴스마다 얕게 복사되므로 보관한 틀은 같은 폼 클래스끼리 공유됩니다.
+    """
+    VALUE_MARKER = '\x00value\x00'
+
+    def __init__(self, attrs=None):
+        super().__init__(attrs)
+        self._compiled = {}
+
+    def render(self, name, value, attrs=None, renderer=None):
+        key = (name, tuple(sorted((attrs or {}).items())), type(renderer))
+        parts = self._compiled.get(key)
+        if parts is None:
+            html = super().render(name, self.VALUE_MARKER, attrs, renderer)
+            parts = self._compiled[key] = tuple(html.split(self.VALUE_MARKER, 1))
+        value = self.format_value(value)
+        return mark_safe(parts[0] + (conditional_escape(value) if value else '') + parts[1])
+
 class DynamicAnswerForm(forms.Form):
+    @classmethod
+    def for_schema(cls, schema):
+        # 질문 목록 버전마다 한 번만 필드를 만들어 선언된 필드로 가진 폼 클래스를 돌려줍니다
+        fields = {
+            spec.field_name: forms.CharField(
+                label=spec.label,
+                widget=PrecompiledTextarea(attrs={
+                    'class': 'form-control',
+                    'rows': 5,
+                    'maxlength': spec.max_length
+                }),
+                required=spec.required,
+                max_length=spec.max_length
+            )
+            for spec in schema.specs
+        }
+        return type(f'DynamicAnswerForm_{schema.version}', (cls,), {**fields, 'schema': schema})
+
     def __init__(self, *args, questions=None, **kwargs):
         super().__init__(*args, **kwargs)
         if questions:
@@ -0,0 +1,44 @@
+from django.conf import settings
+from django.contrib.auth import hashers
+
+
+def hasher_option(name, default):
+    return getattr(settings, 'PASSWORD_HASHER_OPTIONS', {}).get(name, default)
+
+
+class PBKDF2PasswordHasher(hashers.PBKDF2PasswordHasher):
+    """
+    PASSWORD_HASHER_OPTIONS로 강도를 조절할 수 있는 해시들입니다.
+    알고리즘 이름은 Django 기본 해시와 같아 기존 비밀번호를 그대로 확인하며,
+    설정과 다른 강도로 저장된 비밀번호는 다음 로그인 때 새 설정으로 다시 해시됩니다.
+    """
+
+    @property
+    def iterations(self):
+        return hasher_option('PBKDF2_ITERATIONS', hashers.PBKDF2PasswordHasher.iterations)
+
+
+class ScryptPasswordHasher(hashers.ScryptPasswordHasher):
+    @property
+    def work_factor(self):
+        return hasher_option('SCRYPT_WORK_FACTOR', hashers.ScryptPasswordHasher.work_factor)
+
+    @property
+    def maxmem(self):
+        # OpenSSL 기본 한도(32MB)를 넘는 work factor도 쓸 수 있도록 필요한 만큼 잡습니다
+        return 256 * self.block_size * self.work_factor
+
+
+class Argon2PasswordHasher(hashers.Argon2PasswordHasher):
+    # argon2-cffi 패키지가 설치되어 있어야 합니다
+    @property
+    def time_cost(self):
+        return hasher_option('ARGON2_TIME_COST', hashers.Argon2PasswordHasher.time_cost)
+
+    @property
+    def memory_cost(self):
+        return hasher_option('ARGON2_MEMORY_COST', hashers.Argon2PasswordHasher.memory_cost)
+
+    @property
+    def parallelism(self):
+        return hasher_option('ARGON2_PARALLELISM', hashers.Argon2PasswordHasher.parallelism)
@@ -0,0 +1,308 @@
+import io
+import json
+import random
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+import pillow_heif
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection, connections
+from django.test import Client, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from PIL import Image
+
+from . import metrics
+from .models import Applicant, Application, Question, RecruitmentSettings, answer_hash
+from .photos import process_pending_photos
+from .questions import question_schemas
+from .recruitment import registry
+
+PASSWORD = 'Benchmark-pass-2024!'
+
+# 벤치마크 데이터의 id는 운영 데이터와 겹치므로 운영 캐시(Redis/DB 캐시)에 쓰거나 비우지 않도록
+# 이 프로세스만 쓰는 메모리 캐시로 바꿔 실행합니다
+ISOLATED_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'benchmark',
+    },
+}
+
+
+@contextmanager
+def isolated_cache():
+    with override_settings(CACHES=ISOLATED_CACHES):
+        cache.clear()
+        try:
+            yield
+        finally:
+            # 프로세스 로컬 모집 사본에 벤치마크 데이터가 남지 않게 합니다
+            registry.invalidate()
+            cache.clear()
+
+# 지원자가 실제로 거치는 순서대로 나열한 단계와 정상 응답 코드
+STEPS = [
+    ('signup_form', 200),
+    ('signup', 302),
+    ('verify_email', 302),
+    ('answer_questions', 200),
+    ('autosave', 200),
+    ('submit', 302),
+    ('application_complete', 200),
+    ('view_application', 200),
+]
+
+WORDS = (
+    '저는 피로그래밍 활동을 통해 웹 개발 역량을 키우고 싶습니다 프로젝트 협업 경험 동아리 '
+    '팀원들과 함께 문제를 해결하며 배운 점이 많았습니다 특히 백엔드 데이터베이스 설계와 '
+    '배포 과정에서 어려움을 겪었지만 끝까지 포기하지 않고 완성했습니다 앞으로도 꾸준히 '
+    '성장하는 개발자가 되겠습니다'
+).split()
+
+
+def korean_text(rng, length):
+    words = []
+    size = 0
+    while size < length:
+        word = rng.choice(WORDS)
+        words.append(word)
+        size += len(word) + 1
+    return ' '.join(words)[:length]
+
+
+def photo_upload(rng, index, heic_ratio):
+    image = Image.new('RGB', (900, 1200), tuple(rng.randrange(256) for _ in range(3)))
+    buffer = io.BytesIO()
+    if rng.random() < heic_ratio:
+        pillow_heif.from_pillow(image).save(buffer, quality=80)
+        return SimpleUploadedFile(f'photo{index}.heic', buffer.getvalue(), content_type='image/heic')
+    image.save(buffer, 'JPEG', quality=85)
+    return SimpleUploadedFile(f'photo{index}.jpg', buffer.getvalue(), content_type='image/jpeg')
+
+
+def seed_recruitment(questions, max_length):
+    now = timezone.now()
+    recruitment = RecruitmentSettings.objects.create(
+        title='부하 테스트 모집',
+        description='',
+        application_start_date=now - timezone.timedelta(days=1),
+        application_end_date=now + timezone.timedelta(days=7),
+        interview_start_date=now + timezone.timedelta(days=8),
+        interview_end_date=now + timezone.timedelta(days=9),
+    )
+    Question.objects.bulk_create(
+        Question(
+            recruitment_settings=recruitment,
+            question_text=f'{order}. 지원 동기와 관련 경험을 자세히 적어주세요.',
+            max_length=max_length,
+            order=order,
+        )
+        for order in range(1, questions + 1)
+    )
+    # bulk_create는 시그널을 보내지 않으므로 캐시를 직접 비웁니다
+    question_schemas.invalidate(recruitment.id)
+    registry.invalidate()
+    return recruitment
+
+
+def percentile(values, percent):
+    # nearest-rank 방식
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = max(0, -(-len(ordered) * percent // 100) - 1)
+    return ordered[int(index)]
+
+
+class FunnelRecorder:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.samples = {name: [] for name, _ in STEPS}
+        self.errors = {name: 0 for name, _ in STEPS}
+
+    def add(self, step, elapsed_ms, queries, ok):
+        with self._lock:
+            self.samples[step].append((elapsed_ms, queries))
+            if not ok:
+                self.errors[step] += 1
+
+    def summary(self, elapsed):
+        steps = {}
+        total = 0
+        for step, samples in self.samples.items():
+            latencies = [sample[0] for sample in samples]
+            total += len(samples)
+            steps[step] = {
+                'requests': len(samples),
+                'errors': self.errors[step],
+                'mean_ms': round(sum(latencies) / len(latencies), 2) if latencies else None,
+                'p50_ms': round(percentile(latencies, 50), 2) if latencies else None,
+                'p95_ms': round(percentile(latencies, 95), 2) if latencies else None,
+                'p99_ms': round(percentile(latencies, 99), 2) if latencies else None,
+                'queries_per_request': round(sum(sample[1] for sample in samples) / len(samples), 2) if samples else None,
+            }
+        return {
+            'requests': total,
+            'errors': sum(self.errors.values()),
+            'elapsed_s': round(elapsed, 3),
+            'requests_per_second': round(total / elapsed, 2) if elapsed else None,
+            'steps': steps,
+        }
+
+
+class FunnelUser:
+    """
+    가상 지원자 한 명입니다. 자신의 Client로 회원가입부터 지원서 확인까지 진행합니다.
+    """
+
+    def __init__(self, index, recorder, rng, questions, options):
+        self.index = index
+        self.recorder = recorder
+        self.rng = rng
+        self.questions = questions
+        self.options = options
+        self.email = f'loadtest{index}@example.com'
+        self.client = Client(raise_request_exception=False)
+        self.version = None
+
+    def request(self, step, method, path, **kwargs):
+        expected = dict(STEPS)[step]
+        queries = []
+        # 요청을 처리하는 스레드의 연결에 걸리므로 다른 가상 지원자의 쿼리는 섞이지 않습니다
+        with connection.execute_wrapper(lambda execute, *args: queries.append(1) or execute(*args)):
+            started = time.perf_counter()
+            response = getattr(self.client, method)(path, **kwargs)
+            elapsed = (time.perf_counter() - started) * 1000
+        self.recorder.add(step, elapsed, len(queries), response.status_code == expected)
+        return response
+
+    def run(self):
+        signup_url = reverse('applications:signup')
+        self.request('signup_form', 'get', signup_url)
+        self.request('signup', 'post', signup_url, data={
+            'photo': photo_upload(self.rng, self.index, self.options['heic_ratio']),
+            'email': self.email,
+            'name': f'지원자{self.index}',
+            'phone_number': f'010{self.index:08d}',
+            'birth_date': '2000-01-01',
+            'university': '피로대학교',
+            'major': '컴퓨터공학과',
+            'grade': self.rng.randint(1, 4),
+            'academic_status': 'attending',
+            'password1': PASSWORD,
+            'password2': PASSWORD,
+        })
+
+        # 메일 대신 DB에서 인증 코드를 읽습니다
+        code = Applicant.objects.filter(email=self.email).values_list('email_verification_token', flat=True).first()
+        self.request('verify_email', 'post', reverse('applications:verify_email'), data={'verification_code': code or ''})
+
+        response = self.request('answer_questions', 'get', reverse('applications:answer_questions'))
+        match = re.search(rb'name="version" value="(\d+)"', response.content)
+        self.version = int(match.group(1)) if match else None
+
+        answers = {question.id: korean_text(self.rng, question.max_length) for question in self.questions}
+        saved = {question_id: '' for question_id in answers}
+        autosaves = self.options['autosaves']
+        for step in range(1, autosaves + 1):
+            # 입력하는 동안 답변이 조금씩 길어지는 것처럼 보냅니다
+            changes = {}
+            for question_id, text in answers.items():
+                partial = text[:len(text) * step // autosaves]
+                changes[str(question_id)] = {'text': partial, 'base': answer_hash(saved[question_id])}
+                saved[question_id] = partial
+            response = self.request(
+                'autosave', 'post', reverse('applications:autosave_answers'),
+                data=json.dumps({'answers': changes, 'interview': {'interview_sat_morning': True}}),
+                content_type='application/json',
+                headers={'x-requested-with': 'XMLHttpRequest'},
+            )
+            if response.status_code == 200:
+                self.version = response.json()['version']
+
+        data = {f'question_{question_id}': text for question_id, text in answers.items()}
+        data.update({'interview_sat_morning': 'on', 'interview_sun_afternoon': 'on', 'submit': '1'})
+        if self.version is not None:
+            data['version'] = self.version
+        self.request('submit', 'post', reverse('applications:answer_questions'), data=data)
+        self.request('application_complete', 'get', reverse('applications:application_complete'))
+
+        application_id = Application.objects.filter(applicant__email=self.email).values_list('id', flat=True).first()
+        if application_id:
+            self.request('view_application', 'get', reverse('applications:view_application', args=[application_id]))
+
+
+def run_funnel(applicants=20, questions=5, concurrency=4, autosaves=3, answer_length=1000, heic_ratio=0.3, seed=0, process_photos=True):
+    """
+    지원 과정 전체를 가상 지원자 applicants명이 concurrency개 스레드로 나누어 진행하고,
+    단계별 처리량/지연 시간/요청당 쿼리 수를 dict로 돌려줍니다. 현재 연결된 DB에 데이터를 만들고
+    현재 캐시에 모집/질문 목록을 채우므로 명령에서는 테스트용 DB와 isolated_cache() 안에서 실행합니다.
+    """
+    recruitment = seed_recruitment(questions, answer_length)
+    question_list = list(Question.objects.filter(recruitment_settings=recruitment))
+    recorder = FunnelRecorder()
+    options = {'autosaves': autosaves, 'heic_ratio': heic_ratio}
+    metrics.registry.reset()
+
+    def run_user(index):
+        try:
+            FunnelUser(index, recorder, random.Random(seed * 100003 + index), question_list, options).run()
+        finally:
+            if concurrency > 1:
+                connections.close_all()
+
+    started = time.perf_counter()
+    if concurrency > 1:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            list(executor.map(run_user, range(applicants)))
+    else:
+        for index in range(applicants):
+            run_user(index)
+    report = recorder.summary(time.perf_counter() - started)
+
+    if process_photos:
+        # 업로드된 사진은 워커가 처리하므로 같은 데이터로 워커 처리량도 잽니다
+        started = time.perf_counter()
+        processed = 0
+        while True:
+            count = process_pending_photos(limit=10)
+            if not count:
+                break
+            processed += count
+        elapsed = time.perf_counter() - started
+        report['photos'] = {
+            'processed': processed,
+            'elapsed_s': round(elapsed, 3),
+            'photos_per_second': round(processed / elapsed, 2) if processed and elapsed else None,
+        }
+
+    report['config'] = {
+        'applicants': applicants,
+        'questions': questions,
+        'concurrency': concurrency,
+        'autosaves': autosaves,
+        'answer_length': answer_length,
+        'heic_ratio': heic_ratio,
+        'seed': seed,
+        'database': connection.vendor,
+    }
+    report['views'] = metrics.registry.snapshot()['views']
+    return report
+
+
+def compare_reports(baseline, report, tolerance):
+    # 단계별 p95 지연 시간이나 요청당 쿼리 수가 기준보다 tolerance 비율 넘게 늘어난 항목
+    regressions = []
+    for step, current in report['steps'].items():
+        previous = baseline.get('steps', {}).get(step)
+        if not previous:
+            continue
+        for key in ('p95_ms', 'queries_per_request'):
+            if previous.get(key) and current.get(key) and current[key] > previous[key] * (1 + tolerance):
+                regressions.append(f'{step} {key}: {previous[key]} -> {current[key]}')
+    return regressions
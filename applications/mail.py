@@ -0,0 +1,68 @@
+import logging
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+
+from .models import OutboundEmail
+
+logger = logging.getLogger(__name__)
+
+
+def queue_mail(to_email, subject, message, html_message='', dedupe_key='', applicant=None):
+    # 요청 처리 중에는 메일을 대기열에 넣기만 하고, 발송은 send_emails 워커가 합니다
+    return OutboundEmail.objects.enqueue(
+        to_email, subject, message,
+        html_body=html_message, dedupe_key=dedupe_key, applicant=applicant,
+    )
+
+
+async def aqueue_mail(to_email, subject, message, html_message='', dedupe_key='', applicant=None):
+    return await OutboundEmail.objects.aenqueue(
+        to_email, subject, message,
+        html_body=html_message, dedupe_key=dedupe_key, applicant=applicant,
+    )
+
+
+def build_message(email, connection):
+    message = EmailMultiAlternatives(
+        email.subject,
+        email.body,
+        settings.DEFAULT_FROM_EMAIL,
+        [email.to_email],
+        connection=connection,
+    )
+    if email.html_body:
+        message.attach_alternative(email.html_body, 'text/html')
+    return message
+
+
+def send_queued_emails(limit=50):
+    """
+    대기 중인 메일을 최대 limit개 가져와 하나의 SMTP 연결로 발송하고, 처리한 메일 수를 반환합니다.
+    실패한 메일은 백오프 후 재시도되고, 나머지 메일의 발송은 계속됩니다.
+    """
+    emails = OutboundEmail.objects.claim(limit)
+    if not emails:
+        return 0
+
+    connection = get_connection(fail_silently=False)
+    try:
+        connection.open()
+    except Exception as e:
+        logger.warning('SMTP 연결 실패: %s', e)
+        for email in emails:
+            email.mark_failed(f'SMTP 연결 실패: {e}')
+        return len(emails)
+
+    try:
+        for email in emails:
+            try:
+                build_message(email, connection).send()
+            except Exception as e:
+                logger.warning('메일 발송 실패 (%s, attempt=%s): %s', email.to_email, email.attempts, e)
+                email.mark_failed(str(e))
+            else:
+                email.mark_sent()
+    finally:
+        connection.close()
+    return len(emails)
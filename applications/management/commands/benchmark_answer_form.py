@@ -0,0 +1,92 @@
+import json
+import random
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, setup_databases, teardown_databases
+
+from applications.forms import DynamicAnswerForm
+from applications.loadtest import isolated_cache, korean_text, percentile, seed_recruitment
+from applications.models import Question
+from applications.questions import question_schemas
+
+
+def build_queryset_form(recruitment, initial):
+    # 이전 방식: 요청마다 질문을 조회하고 필드와 위젯을 새로 만듭니다
+    questions = Question.objects.filter(recruitment_settings=recruitment)
+    return DynamicAnswerForm(initial=initial, questions=questions)
+
+
+def build_schema_form(recruitment, initial):
+    return question_schemas.form_class(question_schemas.get(recruitment.id))(initial=initial)
+
+
+MODES = {
+    'queryset': build_queryset_form,
+    'schema': build_schema_form,
+}
+
+
+class Command(BaseCommand):
+    help = (
+        '지원서 작성 화면의 답변 폼을 요청마다 만드는 시간과 그리는 시간, 쿼리 수를 '
+        '이전 방식(질문 조회 + 필드 생성)과 질문 목록 캐시 방식으로 비교합니다. '
+        '테스트용 DB와 이 프로세스 전용 캐시를 사용하므로 운영 데이터와 캐시는 건드리지 않습니다.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--questions', type=int, default=5, help='질문 수')
+        parser.add_argument('--answer-length', type=int, default=1000, help='미리 채워 둘 답변 길이')
+        parser.add_argument('--iterations', type=int, default=500, help='방식별 반복 횟수')
+        parser.add_argument('-o', '--output', help='결과 JSON을 저장할 파일')
+
+    def run_mode(self, build, recruitment, initial, iterations):
+        build_us, render_us = [], []
+        with CaptureQueriesContext(connection) as queries:
+            for _ in range(iterations):
+                started = time.perf_counter()
+                form = build(recruitment, initial)
+                built = time.perf_counter()
+                ''.join(str(field) for field in form)
+                rendered = time.perf_counter()
+                build_us.append((built - started) * 1e6)
+                render_us.append((rendered - built) * 1e6)
+        return {
+            'build_p50_us': round(percentile(build_us, 50), 1),
+            'build_p95_us': round(percentile(build_us, 95), 1),
+            'render_p50_us': round(percentile(render_us, 50), 1),
+            'render_p95_us': round(percentile(render_us, 95), 1),
+            'queries_per_request': round(len(queries) / iterations, 2),
+        }
+
+    def handle(self, *args, **options):
+        iterations = options['iterations']
+        report = {'config': {
+            'questions': options['questions'],
+            'answer_length': options['answer_length'],
+            'iterations': iterations,
+        }}
+        old_config = setup_databases(verbosity=0, interactive=False, aliases={'default'}, serialized_aliases=set())
+        try:
+            with isolated_cache():
+                recruitment = seed_recruitment(options['questions'], options['answer_length'])
+                text = korean_text(random.Random(0), options['answer_length'])
+                initial = {
+                    f'question_{question_id}': text
+                    for question_id in Question.objects.filter(recruitment_settings=recruitment).values_list('id', flat=True)
+                }
+                for name, build in MODES.items():
+                    # 첫 요청에서 캐시를 채우고 폼 클래스를 만드는 비용은 따로 잽니다
+                    started = time.perf_counter()
+                    build(recruitment, initial).as_div()
+                    report[name] = {'first_request_us': round((time.perf_counter() - started) * 1e6, 1)}
+                    report[name].update(self.run_mode(build, recruitment, initial, iterations))
+        finally:
+            teardown_databases(old_config, verbosity=0)
+
+        output = json.dumps(report, ensure_ascii=False, indent=2)
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                f.write(output + '\n')
+        self.stdout.write(output)
@@ -0,0 +1,235 @@
+import asyncio
+import io
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.handlers.asgi import ASGIHandler
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management.base import BaseCommand
+from django.test import Client
+from django.test.utils import override_settings, setup_databases, teardown_databases
+from django.urls import reverse
+
+from applications.loadtest import isolated_cache, percentile, seed_recruitment
+from applications.models import Applicant, Application, Question, answer_hash
+
+CSRF_TOKEN = 'b' * 32
+
+
+class VirtualClient:
+    # 한 브라우저 탭처럼 로그인 세션을 가지고 같은 엔드포인트를 차례로 호출합니다
+    def __init__(self, applicant, session_key, question_id):
+        self.applicant = applicant
+        self.session_key = session_key
+        self.question_id = question_id
+        self.text = ''
+
+    def next_request(self, endpoint):
+        headers = {
+            'host': 'testserver',
+            'cookie': f'{settings.SESSION_COOKIE_NAME}={self.session_key}; {settings.CSRF_COOKIE_NAME}={CSRF_TOKEN}',
+            'x-csrftoken': CSRF_TOKEN,
+            'x-requested-with': 'XMLHttpRequest',
+        }
+        if endpoint == 'autosave':
+            base = answer_hash(self.text)
+            self.text += '가나다라마바사 '
+            body = json.dumps({'answers': {str(self.question_id): {'text': self.text[-500:], 'base': base}}}).encode()
+            self.text = self.text[-500:]
+            headers['content-type'] = 'application/json'
+            return 'POST', reverse('applications:autosave_answers'), headers, body
+        if endpoint == 'resend':
+            return 'POST', reverse('applications:resend_verification'), headers, b''
+        return 'GET', reverse('applications:index'), headers, b''
+
+
+def wsgi_environ(method, path, headers, body):
+    environ = {
+        'REQUEST_METHOD': method,
+        'PATH_INFO': path,
+        'QUERY_STRING': '',
+        'SERVER_NAME': 'testserver',
+        'SERVER_PORT': '80',
+        'SERVER_PROTOCOL': 'HTTP/1.1',
+        'REMOTE_ADDR': '127.0.0.1',
+        'CONTENT_LENGTH': str(len(body)),
+        'wsgi.version': (1, 0),
+        'wsgi.url_scheme': 'http',
+        'wsgi.input': io.BytesIO(body),
+        'wsgi.errors': io.StringIO(),
+        'wsgi.multithread': True,
+        'wsgi.multiprocess': False,
+        'wsgi.run_once': False,
+    }
+    for name, value in headers.items():
+        if name == 'content-type':
+            environ['CONTENT_TYPE'] = value
+        else:
+            environ['HTTP_' + name.upper().replace('-', '_')] = value
+    return environ
+
+
+def asgi_scope(method, path, headers, body):
+    return {
+        'type': 'http',
+        'asgi': {'version': '3.0'},
+        'http_version': '1.1',
+        'method': method,
+        'scheme': 'http',
+        'path': path,
+        'raw_path': path.encode(),
+        'query_string': b'',
+        'root_path': '',
+        'headers': [(name.encode(), value.encode()) for name, value in headers.items()]
+        + [(b'content-length', str(len(body)).encode())],
+        'client': ('127.0.0.1', 0),
+        'server': ('testserver', 80),
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        '같은 수의 동시 접속으로 동기 WSGI(스레드 수 제한)와 ASGI(이벤트 루프 하나) 처리기를 호출해 '
+        '초당 요청 수와 지연 시간을 비교합니다. 테스트용 DB와 이 프로세스 전용 캐시를 사용합니다.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--endpoint', choices=['autosave', 'resend', 'index'], default='autosave')
+        parser.add_argument('--connections', type=int, default=64, help='동시에 요청을 보내는 클라이언트 수')
+        parser.add_argument('--requests', type=int, default=10, help='클라이언트별 요청 수')
+        parser.add_argument('--threads', type=int, default=8, help='WSGI 워커의 스레드 수 (gunicorn --threads)')
+        parser.add_argument('-o', '--output', help='결과 JSON을 저장할 파일')
+
+    def seed(self, endpoint, count):
+        recruitment = seed_recruitment(1, 500)
+        question = Question.objects.get(recruitment_settings=recruitment)
+        applicants = Applicant.objects.bulk_create(
+            Applicant(
+                username=f'asgi{index}@example.com',
+                email=f'asgi{index}@example.com',
+                password='!',
+                name=f'지원자{index}',
+                is_email_verified=endpoint != 'resend',
+            )
+            for index in range(count)
+        )
+        Application.objects.bulk_create(
+            Application(applicant=applicant, recruitment_settings=recruitment) for applicant in applicants
+        )
+        clients = []
+        for applicant in applicants:
+            client = Client()
+            client.force_login(applicant, backend='applications.auth.EmailBackend')
+            clients.append(VirtualClient(applicant, client.cookies[settings.SESSION_COOKIE_NAME].value, question.id))
+        return clients
+
+    def run_wsgi(self, clients, endpoint, count, threads):
+        handler = WSGIHandler()
+        # gunicorn gthread 워커처럼 동시에 처리할 수 있는 요청 수가 스레드 수로 제한됩니다
+        workers = threading.Semaphore(threads)
+        latencies, statuses = [], []
+
+        def run_client(client):
+            response_status = []
+
+            def start_response(status, headers, exc_info=None):
+                response_status.append(int(status.split()[0]))
+
+            for _ in range(count):
+                response_status.clear()
+                started = time.perf_counter()
+                with workers:
+                    response = handler(wsgi_environ(*client.next_request(endpoint)), start_response)
+                    b''.join(response)
+                    response.close()
+                latencies.append((time.perf_counter() - started) * 1000)
+                statuses.append(response_status[0])
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=len(clients)) as executor:
+            list(executor.map(run_client, clients))
+        return latencies, statuses, time.perf_counter() - started
+
+    def run_asgi(self, clients, endpoint, count):
+        handler = ASGIHandler()
+        latencies, statuses = [], []
+
+        async def call(client):
+            method, path, headers, body = client.next_request(endpoint)
+            done = asyncio.Event()
+            messages = [{'type': 'http.request', 'body': body, 'more_body': False}]
+            response_status = []
+
+            async def receive():
+                if messages:
+                    return messages.pop()
+                await done.wait()
+                return {'type': 'http.disconnect'}
+
+            async def send(message):
+                if message['type'] == 'http.response.start':
+                    response_status.append(message['status'])
+                elif not message.get('more_body'):
+                    done.set()
+
+            await handler(asgi_scope(method, path, headers, body), receive, send)
+            return response_status[0]
+
+        async def run_client(client):
+            for _ in range(count):
+                started = time.perf_counter()
+                status = await call(client)
+                latencies.append((time.perf_counter() - started) * 1000)
+                statuses.append(status)
+
+        async def main():
+            await asyncio.gather(*(run_client(client) for client in clients))
+
+        started = time.perf_counter()
+        asyncio.run(main())
+        return latencies, statuses, time.perf_counter() - started
+
+    def summarize(self, latencies, statuses, elapsed):
+        return {
+            'requests': len(latencies),
+            # 재전송은 요청 제한에 걸리면 429로 바로 끝나므로 오류와 따로 셉니다
+            'rate_limited': statuses.count(429),
+            'errors': sum(1 for status in statuses if status >= 400 and status != 429),
+            'elapsed_s': round(elapsed, 3),
+            'requests_per_second': round(len(latencies) / elapsed, 2),
+            'p50_ms': round(percentile(latencies, 50), 2),
+            'p95_ms': round(percentile(latencies, 95), 2),
+            'p99_ms': round(percentile(latencies, 99), 2),
+        }
+
+    def handle(self, *args, **options):
+        endpoint, connections, count = options['endpoint'], options['connections'], options['requests']
+        report = {
+            'config': {
+                'endpoint': endpoint,
+                'connections': connections,
+                'requests_per_connection': count,
+                'wsgi_threads': options['threads'],
+            },
+        }
+        old_config = setup_databases(verbosity=0, interactive=False, aliases={'default'}, serialized_aliases=set())
+        try:
+            # 요청 제한 버킷과 세션을 운영 캐시에 만들거나 비우지 않도록 이 프로세스 전용 캐시를 씁니다
+            with override_settings(ALLOWED_HOSTS=['testserver'], REQUEST_METRICS_SLOW_MS=10 ** 9), isolated_cache():
+                clients = self.seed(endpoint, connections)
+                report['wsgi'] = self.summarize(*self.run_wsgi(clients, endpoint, count, options['threads']))
+                # 전용 캐시의 요청 제한 버킷을 비워 두 방식이 같은 조건에서 시작하게 합니다
+                cache.clear()
+                report['asgi'] = self.summarize(*self.run_asgi(clients, endpoint, count))
+        finally:
+            teardown_databases(old_config, verbosity=0)
+
+        output = json.dumps(report, ensure_ascii=False, indent=2)
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                f.write(output + '\n')
+        self.stdout.write(output)
@@ -0,0 +1,106 @@
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+from django.db import OperationalError, connections, transaction
+from django.test.utils import setup_databases, teardown_databases
+
+TABLE = 'benchmark_writes'
+
+
+class Command(BaseCommand):
+    help = (
+        '여러 스레드가 동시에 쓰기 트랜잭션을 실행해 잠금 오류 수와 처리량을 잽니다. '
+        '설정된 DB는 건드리지 않고 SQLite는 임시 파일, 그 밖의 DB는 테스트용 DB를 새로 만들어 사용합니다.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--writers', type=int, default=8, help='동시에 쓰는 스레드 수')
+        parser.add_argument('--writes', type=int, default=50, help='스레드별 트랜잭션 수')
+
+    def add_alias(self, alias, **overrides):
+        connections.settings[alias] = {**connections['default'].settings_dict, **overrides}
+
+    def remove_alias(self, alias):
+        connections[alias].close()
+        del connections.settings[alias]
+
+    def writer(self, alias, writes, barrier, errors):
+        barrier.wait()
+        try:
+            for _ in range(writes):
+                try:
+                    # 답변 자동 저장처럼 읽은 뒤 쓰는 트랜잭션
+                    with transaction.atomic(using=alias), connections[alias].cursor() as cursor:
+                        cursor.execute(f'SELECT COUNT(*) FROM {TABLE}')
+                        cursor.fetchone()
+                        cursor.execute(f'UPDATE {TABLE} SET value = value + 1 WHERE id = 1')
+                except OperationalError as e:
+                    errors.append(str(e))
+        finally:
+            connections[alias].close()
+
+    def run(self, alias, writers, writes):
+        with connections[alias].cursor() as cursor:
+            cursor.execute(f'CREATE TABLE IF NOT EXISTS {TABLE} (id integer PRIMARY KEY, value integer NOT NULL)')
+            cursor.execute(f'DELETE FROM {TABLE}')
+            cursor.execute(f'INSERT INTO {TABLE} (id, value) VALUES (1, 0)')
+
+        errors = []
+        barrier = threading.Barrier(writers)
+        threads = [
+            threading.Thread(target=self.writer, args=(alias, writes, barrier, errors))
+            for _ in range(writers)
+        ]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        with connections[alias].cursor() as cursor:
+            cursor.execute(f'SELECT value FROM {TABLE} WHERE id = 1')
+            committed = cursor.fetchone()[0]
+            cursor.execute(f'DROP TABLE {TABLE}')
+        return committed, errors, elapsed
+
+    def report(self, name, writers, writes, result):
+        committed, errors, elapsed = result
+        self.stdout.write(
+            f'{name:>8}: 커밋 {committed}/{writers * writes}건, 잠금 오류 {len(errors)}건, '
+            f'{committed / elapsed:.0f}건/초'
+        )
+        if errors:
+            self.stdout.write(f'          예: {errors[0]}')
+
+    def handle(self, *args, **options):
+        writers, writes = options['writers'], options['writes']
+        self.stdout.write(f'스레드 {writers}개가 각각 {writes}번씩 씁니다.')
+
+        if connections['default'].vendor != 'sqlite':
+            # PostgreSQL 등은 운영 DB 대신 같은 서버에 테스트용 DB(test_<이름>)를 만들어 잽니다
+            old_config = setup_databases(verbosity=0, interactive=False, aliases={'default'}, serialized_aliases=set())
+            self.add_alias('benchmark')
+            try:
+                self.report(connections['default'].vendor, writers, writes, self.run('benchmark', writers, writes))
+            finally:
+                self.remove_alias('benchmark')
+                teardown_databases(old_config, verbosity=0)
+            return
+
+        # SQLite는 운영 DB를 건드리지 않도록 임시 파일에서 기본 설정과 조정된 설정을 비교합니다
+        with tempfile.TemporaryDirectory() as tmpdir:
+            modes = {
+                'stock': {'ENGINE': 'django.db.backends.sqlite3', 'OPTIONS': {}},
+                'tuned': {},
+            }
+            for name, overrides in modes.items():
+                alias = f'benchmark_{name}'
+                self.add_alias(alias, NAME=Path(tmpdir) / f'{name}.sqlite3', **overrides)
+                try:
+                    self.report(name, writers, writes, self.run(alias, writers, writes))
+                finally:
+                    self.remove_alias(alias)
@@ -0,0 +1,76 @@
+import json
+import tempfile
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import override_settings, setup_databases, teardown_databases
+
+from applications.loadtest import compare_reports, isolated_cache, run_funnel
+
+
+class Command(BaseCommand):
+    help = (
+        '테스트용 DB와 이 프로세스 전용 캐시를 새로 만들어 회원가입부터 지원서 확인까지의 과정을 가상 지원자로 반복하고, '
+        '단계별 초당 요청 수, p50/p95/p99 지연 시간, 요청당 쿼리 수를 JSON으로 출력합니다.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--applicants', type=int, default=20, help='가상 지원자 수')
+        parser.add_argument('--questions', type=int, default=5, help='질문 수')
+        parser.add_argument('--concurrency', type=int, default=4, help='동시에 진행하는 지원자 수 (스레드)')
+        parser.add_argument('--autosaves', type=int, default=3, help='지원자별 자동 저장 횟수')
+        parser.add_argument('--answer-length', type=int, default=1000, help='답변 길이 (질문의 최대 글자 수)')
+        parser.add_argument('--heic-ratio', type=float, default=0.3, help='HEIC 사진을 올리는 지원자 비율')
+        parser.add_argument('--seed', type=int, default=0, help='난수 시드 (같은 값이면 같은 데이터)')
+        parser.add_argument('--skip-photos', action='store_true', help='사진 워커 처리량은 재지 않습니다')
+        parser.add_argument('-o', '--output', help='결과 JSON을 저장할 파일')
+        parser.add_argument('--baseline', help='비교할 이전 결과 JSON 파일')
+        parser.add_argument(
+            '--tolerance', type=float, default=0.2,
+            help='--baseline보다 p95 지연 시간이나 쿼리 수가 이 비율 넘게 늘면 실패합니다'
+        )
+
+    def handle(self, *args, **options):
+        baseline = None
+        if options['baseline']:
+            with open(options['baseline'], encoding='utf-8') as f:
+                baseline = json.load(f)
+
+        # 운영 데이터를 건드리지 않도록 테스트 러너처럼 test_ 접두사가 붙은 DB를 만들었다가 지우고,
+        # 캐시도 이 프로세스 전용 메모리 캐시를 씁니다
+        old_config = setup_databases(verbosity=0, interactive=False, aliases={'default'}, serialized_aliases=set())
+        try:
+            with tempfile.TemporaryDirectory() as media_root, override_settings(
+                MEDIA_ROOT=media_root,
+                ALLOWED_HOSTS=['testserver'],
+                EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend',
+            ), isolated_cache():
+                report = run_funnel(
+                    applicants=options['applicants'],
+                    questions=options['questions'],
+                    concurrency=options['concurrency'],
+                    autosaves=options['autosaves'],
+                    answer_length=options['answer_length'],
+                    heic_ratio=options['heic_ratio'],
+                    seed=options['seed'],
+                    process_photos=not options['skip_photos'],
+                )
+        finally:
+            teardown_databases(old_config, verbosity=0)
+
+        output = json.dumps(report, ensure_ascii=False, indent=2)
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                f.write(output + '\n')
+            self.stderr.write(
+                f'{report["requests"]}개 요청, {report["requests_per_second"]}건/초, '
+                f'오류 {report["errors"]}건 -> {options["output"]}'
+            )
+        else:
+            self.stdout.write(output)
+
+        if report['errors']:
+            raise CommandError(f'예상과 다른 응답이 {report["errors"]}건 있습니다.')
+        if baseline:
+            regressions = compare_reports(baseline, report, options['tolerance'])
+            if regressions:
+                raise CommandError('기준 결과보다 느려졌습니다:\n' + '\n'.join(regressions))
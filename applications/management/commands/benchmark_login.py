@@ -0,0 +1,31 @@
+import time
+
+from django.contrib.auth.hashers import get_hashers
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = 'PASSWORD_HASHERS의 해시별로 비밀번호 확인 속도(코어 하나당 초당 로그인 수)를 잽니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rounds', type=int, default=20, help='해시별 확인 횟수')
+
+    def handle(self, *args, **options):
+        rounds = options['rounds']
+        password = 'benchmark-password'
+        for index, hasher in enumerate(get_hashers()):
+            try:
+                encoded = hasher.encode(password, hasher.salt())
+            except ValueError as e:
+                # argon2-cffi처럼 필요한 라이브러리가 없는 경우
+                self.stdout.write(f'{hasher.algorithm:>14}: 건너뜀 ({e})')
+                continue
+
+            started = time.perf_counter()
+            for _ in range(rounds):
+                hasher.verify(password, encoded)
+            elapsed = (time.perf_counter() - started) / rounds
+            self.stdout.write(
+                f'{hasher.algorithm:>14}: {elapsed * 1000:.1f}ms/회, 코어당 {1 / elapsed:.1f}회/초'
+                + (' (새 비밀번호에 사용)' if index == 0 else '')
+            )
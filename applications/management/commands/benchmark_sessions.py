@@ -0,0 +1,75 @@
+import time
+from importlib import import_module
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test import Client, modify_settings, override_settings
+from django.test.utils import CaptureQueriesContext, setup_databases, teardown_databases
+from django.urls import reverse
+
+from applications.loadtest import isolated_cache
+
+SLIDING_MIDDLEWARE = 'applications.middleware.SlidingSessionMiddleware'
+
+MODES = {
+    # 이전 설정: DB 세션을 매 요청 저장
+    'every-request': (
+        {'SESSION_ENGINE': 'django.contrib.sessions.backends.db', 'SESSION_SAVE_EVERY_REQUEST': True},
+        {'MIDDLEWARE': {'remove': [SLIDING_MIDDLEWARE]}},
+    ),
+    # 현재 설정: cached_db 세션을 남은 수명이 적을 때만 저장
+    'sliding': (
+        {'SESSION_ENGINE': 'django.contrib.sessions.backends.cached_db', 'SESSION_SAVE_EVERY_REQUEST': False},
+        {'MIDDLEWARE': {'append': [SLIDING_MIDDLEWARE]}},
+    ),
+}
+
+
+def is_session_write(sql):
+    return 'django_session' in sql and sql.lstrip().upper().startswith(('INSERT', 'UPDATE', 'DELETE'))
+
+
+class Command(BaseCommand):
+    help = '세션 저장 방식별로 요청당 세션 저장소 쓰기 횟수와 응답 시간을 비교합니다. 테스트용 DB와 이 프로세스 전용 캐시를 사용합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=200, help='방식별 요청 수')
+        parser.add_argument('--path', default=None, help='요청할 경로 (기본값: 메인 페이지)')
+
+    def run_mode(self, path, count):
+        engine = import_module(settings.SESSION_ENGINE)
+        session = engine.SessionStore()
+        session['benchmark'] = True
+        session.create()
+
+        client = Client()
+        client.cookies[settings.SESSION_COOKIE_NAME] = session.session_key
+        try:
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                for _ in range(count):
+                    client.get(path)
+                elapsed = time.perf_counter() - started
+        finally:
+            session.delete()
+        writes = sum(1 for query in queries.captured_queries if is_session_write(query['sql']))
+        return writes, elapsed
+
+    def handle(self, *args, **options):
+        path = options['path'] or reverse('applications:index')
+        count = options['requests']
+        self.stdout.write(f'{path} 경로에 방식별로 {count}회 요청합니다.')
+        # 운영 세션 테이블과 캐시에 세션을 만들었다 지우지 않도록 테스트용 DB와 전용 캐시에서 잽니다
+        old_config = setup_databases(verbosity=0, interactive=False, aliases={'default'}, serialized_aliases=set())
+        try:
+            with override_settings(ALLOWED_HOSTS=['testserver']), isolated_cache():
+                for name, (overrides, middleware) in MODES.items():
+                    with override_settings(**overrides), modify_settings(**middleware):
+                        writes, elapsed = self.run_mode(path, count)
+                    self.stdout.write(
+                        f'{name:>14}: 세션 쓰기 {writes}회 ({writes / count:.2f}회/요청), '
+                        f'평균 {elapsed / count * 1000:.2f}ms/요청'
+                    )
+        finally:
+            teardown_databases(old_config, verbosity=0)
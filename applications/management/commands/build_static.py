@@ -0,0 +1,136 @@
+import json
+import os
+import re
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.template import engines
+from django.test import Client
+from django.test.utils import override_settings, setup_databases, teardown_databases
+from django.urls import reverse
+
+from applications.loadtest import isolated_cache, seed_recruitment
+from applications.models import Applicant, Application
+
+MANIFEST_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
+STATIC_TAG_RE = re.compile(r"""{%\s*static\s+['"]([^'"]+)['"]""")
+ASSET_RE = re.compile(r"""(?:href|src)=["']([^"']+)["']""")
+
+# 지원자가 차례로 거치는 화면. 로그인이 필요한 화면은 인증을 마친 지원자로 엽니다.
+PAGES = [
+    ('login', 'login', False),
+    ('signup', 'applications:signup', False),
+    ('reset_password_request', 'applications:reset_password_request', False),
+    ('index', 'applications:index', True),
+    ('answer_questions', 'applications:answer_questions', True),
+]
+
+
+class Command(BaseCommand):
+    help = (
+        '정적 파일을 내용 해시가 붙은 이름으로 STATIC_ROOT에 모으고 gzip/brotli로 미리 압축합니다. '
+        'CSS나 템플릿이 없는 정적 파일을 가리키면 실패하고, 화면별 전송 크기를 이전 방식과 비교해 출력합니다.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--skip-report', action='store_true', help='화면별 전송 크기는 재지 않습니다')
+        parser.add_argument('-o', '--output', help='결과 JSON을 저장할 파일')
+
+    def handle(self, *args, **options):
+        missing = self.missing_template_references()
+        if missing:
+            raise CommandError('템플릿이 없는 정적 파일을 가리킵니다:\n' + '\n'.join(
+                f'{template}: {name}' for template, name in missing
+            ))
+
+        with override_settings(STORAGES={**settings.STORAGES, 'staticfiles': {'BACKEND': MANIFEST_STORAGE}}):
+            try:
+                call_command('collectstatic', interactive=False, verbosity=0)
+            except ValueError as e:
+                # 매니페스트 저장소는 CSS의 url()/@import가 없는 파일을 가리키면 ValueError를 냅니다
+                raise CommandError(f'정적 파일을 처리하지 못했습니다: {e}')
+            self.stderr.write(f'정적 파일 {len(staticfiles_storage.hashed_files)}개 -> {settings.STATIC_ROOT}')
+
+            if options['skip_report']:
+                return
+            report = self.page_report()
+
+        output = json.dumps(report, ensure_ascii=False, indent=2)
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                f.write(output + '\n')
+        self.stdout.write(output)
+
+    def missing_template_references(self):
+        # 매니페스트 저장소에서 {% static %}이 없는 파일을 가리키면 렌더링할 때 500이 나므로 배포 전에 걸러 냅니다
+        missing = []
+        for backend in engines.all():
+            for directory in backend.engine.dirs:
+                for root, _, files in os.walk(directory):
+                    for filename in sorted(files):
+                        path = os.path.join(root, filename)
+                        with open(path, encoding='utf-8') as f:
+                            names = STATIC_TAG_RE.findall(f.read())
+                        missing.extend(
+                            (os.path.relpath(path, directory), name) for name in names if not finders.find(name)
+                        )
+        return missing
+
+    def asset_sizes(self, url):
+        name = url[len(staticfiles_storage.base_url):].split('?')[0]
+        path = staticfiles_storage.path(name)
+        if not os.path.exists(path):
+            return None
+        # 매니페스트에서 해시가 붙기 전 이름을 찾아 원본 크기를 구합니다
+        original = next((source for source, hashed in staticfiles_storage.hashed_files.items() if hashed == name), name)
+        sizes = {'raw': os.path.getsize(staticfiles_storage.path(original))}
+        for suffix, encoding in (('.gz', 'gzip'), ('.br', 'br')):
+            if os.path.exists(path + suffix):
+                sizes[encoding] = os.path.getsize(path + suffix)
+        return original, sizes
+
+    def page_report(self):
+        old_config = setup_databases(verbosity=0, interactive=False, aliases={'default'}, serialized_aliases=set())
+        try:
+            # 화면을 그리며 채우는 모집/질문 캐시가 운영 캐시에 섞이지 않도록 전용 캐시를 씁니다
+            with override_settings(ALLOWED_HOSTS=['testserver']), isolated_cache():
+                recruitment = seed_recruitment(5, 1000)
+                applicant = Applicant.objects.create_user(
+                    username='static@example.com', email='static@example.com', password='!', name='지원자',
+                    is_email_verified=True
+                )
+                Application.objects.create(applicant=applicant, recruitment_settings=recruitment)
+                anonymous, member = Client(), Client()
+                member.force_login(applicant, backend='applications.auth.EmailBackend')
+
+                pages = {}
+                for name, url_name, login in PAGES:
+                    response = (member if login else anonymous).get(reverse(url_name))
+                    if response.status_code != 200:
+                        raise CommandError(f'{name} 화면을 열지 못했습니다 ({response.status_code}).')
+                    pages[name] = self.page_sizes(response.content)
+        finally:
+            teardown_databases(old_config, verbosity=0)
+        return {'pages': pages}
+
+    def page_sizes(self, content):
+        html = len(content)
+        assets = {}
+        for url in ASSET_RE.findall(content.decode()):
+            if url.startswith(staticfiles_storage.base_url):
+                sizes = self.asset_sizes(url)
+                if sizes:
+                    assets[sizes[0]] = sizes[1]
+        raw = sum(sizes['raw'] for sizes in assets.values())
+        compressed = sum(min(sizes.values()) for sizes in assets.values())
+        return {
+            'html_bytes': html,
+            'assets': assets,
+            # 이전에는 같은 CSS/JS를 압축 없이 HTML 안에 넣어 매 화면마다 보냈습니다
+            'before': {'every_visit_bytes': html + raw},
+            # 지금은 처음 한 번만 압축본을 받고, 이후에는 immutable 캐시에서 다시 확인 없이 씁니다
+            'after': {'first_visit_bytes': html + compressed, 'repeat_visit_bytes': html},
+        }
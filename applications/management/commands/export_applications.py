@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from applications import exports
+from applications.models import Application
+
+
+class Command(BaseCommand):
+    help = '지원서와 질문별 답변을 한 행씩 CSV 또는 XLSX로 내보냅니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--recruitment', type=int, help='모집 설정 ID')
+        parser.add_argument('--status', nargs='+', help='이 상태인 지원서만 내보냅니다.')
+        parser.add_argument('--format', choices=['csv', 'xlsx'], default='csv')
+        parser.add_argument('--output', '-o', help='저장할 파일 경로 (CSV는 생략하면 표준 출력)')
+        parser.add_argument('--chunk-size', type=int, default=exports.CHUNK_SIZE, help='한 번에 읽을 행 수')
+
+    def handle(self, *args, **options):
+        queryset = Application.objects.all()
+        if options['recruitment']:
+            queryset = queryset.filter(recruitment_settings_id=options['recruitment'])
+        if options['status']:
+            queryset = queryset.filter(status__in=options['status'])
+
+        if options['format'] == 'xlsx':
+            if not options['output']:
+                raise CommandError('XLSX는 --output 경로를 지정해주세요.')
+            with open(options['output'], 'wb') as f:
+                exports.write_xlsx(queryset, f, options['chunk_size'])
+            return
+
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8', newline='') as f:
+                f.writelines(exports.iter_csv(queryset, options['chunk_size']))
+        else:
+            for line in exports.iter_csv(queryset, options['chunk_size']):
+                self.stdout.write(line, ending='')
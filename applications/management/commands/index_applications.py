@@ -0,0 +1,11 @@
+from applications.management.worker import WorkerCommand
+from applications.search import index_stale_applications
+
+
+class Command(WorkerCommand):
+    help = '답변이나 지원자 정보가 바뀐 지원서의 검색 문서를 다시 만듭니다.'
+    processed_message = '{count}건의 지원서를 색인했습니다.'
+    default_batch_size = 100
+
+    def process(self, batch_size):
+        return index_stale_applications(batch_size)
@@ -0,0 +1,10 @@
+from applications.management.worker import WorkerCommand
+from applications.photos import process_pending_photos
+
+
+class Command(WorkerCommand):
+    help = '대기 중인 지원자 사진 변환 작업을 처리합니다.'
+    processed_message = '{count}개의 사진을 처리했습니다.'
+
+    def process(self, batch_size):
+        return process_pending_photos(batch_size)
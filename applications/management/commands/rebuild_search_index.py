@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from applications.search import rebuild_index
+
+
+class Command(BaseCommand):
+    help = '모든 지원서의 검색 문서를 다시 만듭니다. 이후에는 index_applications 워커가 바뀐 지원서만 갱신합니다.'
+
+    def handle(self, *args, **options):
+        count = rebuild_index()
+        self.stdout.write(self.style.SUCCESS(f'{count}건의 지원서를 색인했습니다.'))
@@ -0,0 +1,52 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from applications.models import Application, RecruitmentSettings
+from applications.recruitment import registry
+from applications.scheduling import schedule_interviews
+from applications.transitions import transition_applications
+
+
+class Command(BaseCommand):
+    help = '서류 합격자를 면접 희망 시간에 맞춰 면접 슬롯에 자동 배정합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--recruitment', type=int, help='모집 설정 ID (기본값: 활성화된 모집)')
+        parser.add_argument('--slot-minutes', type=int, default=30, help='면접 한 건의 길이(분)')
+        parser.add_argument('--rooms', nargs='+', default=['면접실'], help='면접 장소 목록')
+        parser.add_argument('--per-room', type=int, default=1, help='한 슬롯에 한 장소에서 면접 볼 수 있는 인원')
+        parser.add_argument('--dry-run', action='store_true', help='배정 결과만 출력하고 저장하지 않습니다.')
+        parser.add_argument('--notify', action='store_true', help='배정된 지원서를 면접예정으로 바꾸고 일정 안내 메일을 보냅니다.')
+
+    def handle(self, *args, **options):
+        if options['recruitment']:
+            recruitment = RecruitmentSettings.objects.filter(pk=options['recruitment']).first()
+        else:
+            recruitment = registry.get_current()
+        if recruitment is None:
+            raise CommandError('모집 설정을 찾을 수 없습니다.')
+
+        started = time.perf_counter()
+        result = schedule_interviews(
+            recruitment,
+            slot_minutes=options['slot_minutes'],
+            rooms=options['rooms'],
+            per_room=options['per_room'],
+            commit=not options['dry_run'],
+        )
+        elapsed = time.perf_counter() - started
+
+        self.stdout.write(
+            f'{len(result.assigned)}명 배정, {len(result.unplaced)}명 미배정 '
+            f'(전체 자리 {result.capacity}개, {elapsed * 1000:.0f}ms)'
+        )
+        for application in result.unplaced:
+            self.stdout.write(f'  미배정: 지원서 #{application.pk} ({application.get_interview_preferences_display()})')
+
+        if options['notify'] and not options['dry_run'] and result.assigned:
+            changed, _ = transition_applications(
+                Application.objects.filter(pk__in=[application.pk for application in result.assigned]),
+                'interview_scheduled',
+            )
+            self.stdout.write(self.style.SUCCESS(f'{changed}건을 면접예정으로 변경하고 안내 메일을 대기열에 넣었습니다.'))
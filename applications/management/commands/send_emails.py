@@ -0,0 +1,11 @@
+from applications.mail import send_queued_emails
+from applications.management.worker import WorkerCommand
+
+
+class Command(WorkerCommand):
+    help = '대기 중인 메일을 하나의 SMTP 연결로 묶어 발송합니다.'
+    default_batch_size = 50
+    processed_message = '{count}통의 메일을 처리했습니다.'
+
+    def process(self, batch_size):
+        return send_queued_emails(batch_size)
@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from applications.models import Application
+from applications.transitions import TransitionError, allowed_sources, transition_applications
+
+
+class Command(BaseCommand):
+    help = '지원서 상태를 한 번에 변경하고 결과 안내 메일을 대기열에 넣습니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('to_status', choices=[status for status, _ in Application.STATUS_CHOICES])
+        parser.add_argument('--ids', nargs='+', type=int, help='변경할 지원서 ID 목록')
+        parser.add_argument('--from-status', help='이 상태인 지원서만 변경합니다.')
+        parser.add_argument('--recruitment', type=int, help='모집 설정 ID')
+        parser.add_argument('--no-notify', action='store_true', help='결과 안내 메일을 보내지 않습니다.')
+        parser.add_argument('--dry-run', action='store_true', help='변경 대상 수만 출력합니다.')
+
+    def handle(self, *args, **options):
+        queryset = Application.objects.all()
+        if options['ids']:
+            queryset = queryset.filter(pk__in=options['ids'])
+        if options['from_status']:
+            queryset = queryset.filter(status=options['from_status'])
+        if options['recruitment']:
+            queryset = queryset.filter(recruitment_settings_id=options['recruitment'])
+        if not (options['ids'] or options['from_status'] or options['recruitment']):
+            raise CommandError('--ids, --from-status, --recruitment 중 하나 이상을 지정해주세요.')
+
+        if options['dry_run']:
+            eligible = queryset.filter(status__in=allowed_sources(options['to_status'])).count()
+            self.stdout.write(f'변경 대상 {eligible}건 / 전체 {queryset.count()}건')
+            return
+
+        try:
+            changed, skipped = transition_applications(
+                queryset, options['to_status'], notify=not options['no_notify']
+            )
+        except TransitionError as e:
+            raise CommandError(str(e))
+        self.stdout.write(self.style.SUCCESS(f'{changed}건을 변경했습니다. (건너뜀 {skipped}건)'))
@@ -0,0 +1,20 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from applications.metrics import warm_up_templates
+
+
+class Command(BaseCommand):
+    help = (
+        'templates/ 아래의 모든 템플릿을 파싱해 봅니다. 워커가 뜰 때 하는 미리 읽기(TEMPLATE_WARMUP)와 같은 작업이며, '
+        '배포 전에 문법 오류가 있는 템플릿을 찾는 데 씁니다.'
+    )
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        loaded, failed = warm_up_templates(force=True)
+        elapsed = (time.perf_counter() - started) * 1000
+        self.stdout.write(f'템플릿 {loaded}개를 {elapsed:.0f}ms에 읽었습니다.')
+        if failed:
+            raise CommandError('읽지 못한 템플릿이 있습니다:\n' + '\n'.join(f'{name}: {error}' for name, error in failed))
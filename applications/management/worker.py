@@ -0,0 +1,30 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+
+class WorkerCommand(BaseCommand):
+    """
+    DB 작업 큐를 처리하는 워커 명령의 공통 루프입니다.
+    하위 클래스는 process(batch_size)에서 처리한 작업 수를 반환합니다.
+    """
+    default_batch_size = 10
+    processed_message = '{count}개의 작업을 처리했습니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='대기 중인 작업을 한 번만 처리하고 종료합니다.')
+        parser.add_argument('--batch-size', type=int, default=self.default_batch_size)
+        parser.add_argument('--sleep', type=float, default=2.0, help='처리할 작업이 없을 때 대기할 시간(초)')
+
+    def process(self, batch_size):
+        raise NotImplementedError
+
+    def handle(self, *args, **options):
+        while True:
+            processed = self.process(options['batch_size'])
+            if processed:
+                self.stdout.write(self.processed_message.format(count=processed))
+            elif options['once']:
+                break
+            else:
+                time.sleep(options['sleep'])
@@ -0,0 +1,124 @@
+import mimetypes
+import re
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.http import FileResponse, HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, parse_http_date_safe
+
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+SENDFILE_BACKENDS = ('', 'nginx', 'xsendfile')
+
+
+class FileRange:
+    # 파일의 start부터 length 바이트만 읽는 파일 객체. FileResponse로 Range 응답을 보낼 때 씁니다.
+    def __init__(self, file, start, length):
+        file.seek(start)
+        self.file = file
+        self.remaining = length
+
+    def read(self, size=-1):
+        if self.remaining <= 0:
+            return b''
+        size = self.remaining if size is None or size < 0 else min(size, self.remaining)
+        data = self.file.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def close(self):
+        self.file.close()
+
+
+def parse_range(header, size):
+    """
+    Range 헤더에서 (시작, 끝) 바이트 위치를 구합니다. 'bytes=0-99', 'bytes=100-', 'bytes=-100' 한 구간만 지원하며,
+    읽을 수 없거나 여러 구간이면 None(전체 전송)을, 파일 범위를 벗어나면 빈 튜플(416)을 돌려줍니다.
+    """
+    match = RANGE_RE.match(header.strip())
+    if not match or not any(match.groups()):
+        return None
+    start, end = match.groups()
+    if not start:
+        # 마지막 N바이트
+        length = int(end)
+        return (max(size - length, 0), size - 1) if length and size else ()
+    start = int(start)
+    end = min(int(end), size - 1) if end else size - 1
+    if start >= size:
+        return ()
+    if end < start:
+        return None
+    return start, end
+
+
+def if_range_matches(request, etag, last_modified):
+    # If-Range가 없거나 현재 파일과 같을 때만 Range를 따릅니다. 다르면 파일 전체를 보냅니다.
+    value = request.headers.get('If-Range')
+    if not value:
+        return True
+    if value.startswith(('"', 'W/')):
+        return value == etag
+    return parse_http_date_safe(value) == last_modified
+
+
+def sendfile_backend():
+    backend = getattr(settings, 'MEDIA_SENDFILE', '')
+    if backend not in SENDFILE_BACKENDS:
+        raise ImproperlyConfigured(f'MEDIA_SENDFILE은 {", ".join(map(repr, SENDFILE_BACKENDS))} 중 하나여야 합니다.')
+    return backend
+
+
+def serve_file(request, storage, name, content_type=None, headers=None, etag=None):
+    """
+    권한 확인을 마친 저장소 파일을 보냅니다.
+
+    MEDIA_SENDFILE이 'nginx'이면 X-Accel-Redirect, 'xsendfile'이면 X-Sendfile 헤더만 담아 돌려주고
+    파일 전송, Range, 조건부 요청은 웹 서버가 처리합니다. 설정하지 않았거나 저장소가 로컬 파일이 아니면
+    Django가 직접 보내며, 이때도 ETag/Last-Modified 조건부 요청과 한 구간 Range 요청을 지원합니다.
+    """
+    headers = dict(headers or {})
+    content_type = content_type or mimetypes.guess_type(name)[0] or 'application/octet-stream'
+    backend = sendfile_backend()
+    if backend == 'nginx':
+        response = HttpResponse(content_type=content_type, headers=headers)
+        response['X-Accel-Redirect'] = quote(getattr(settings, 'MEDIA_ACCEL_REDIRECT_PREFIX', '/protected-media/') + name)
+        return response
+    if backend == 'xsendfile':
+        try:
+            path = storage.path(name)
+        except NotImplementedError:
+            pass
+        else:
+            response = HttpResponse(content_type=content_type, headers=headers)
+            response['X-Sendfile'] = path
+            return response
+
+    size = storage.size(name)
+    last_modified = int(storage.get_modified_time(name).timestamp())
+    etag = etag or f'"{last_modified:x}-{size:x}"'
+    headers.update({'ETag': etag, 'Last-Modified': http_date(last_modified), 'Accept-Ranges': 'bytes'})
+    response = get_conditional_response(
+        request, etag=etag, last_modified=last_modified, response=HttpResponse(headers=headers)
+    )
+    if response.status_code != 200:
+        return response
+
+    byte_range = None
+    if 'Range' in request.headers and if_range_matches(request, etag, last_modified):
+        byte_range = parse_range(request.headers['Range'], size)
+    if byte_range == ():
+        return HttpResponse(status=416, headers={'Content-Range': f'bytes */{size}', 'Accept-Ranges': 'bytes'})
+
+    file = storage.open(name, 'rb')
+    if byte_range:
+        start, end = byte_range
+        response = FileResponse(FileRange(file, start, end - start + 1), status=206, content_type=content_type)
+        response['Content-Range'] = f'bytes {start}-{end}/{size}'
+        response['Content-Length'] = end - start + 1
+    else:
+        response = FileResponse(file, content_type=content_type)
+    for header, value in headers.items():
+        response[header] = value
+    return response
@@ -0,0 +1,260 @@
+import bisect
+import os
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+from pathlib import Path
+
+from django.conf import settings
+from django.template import engines
+from django.template.backends.django import DjangoTemplates, Template
+from django.template.base import NodeList
+from django.template.loader_tags import ExtendsNode
+from django.template.loaders.cached import Loader as CachedLoader
+
+# 요청 처리 시간(ms)과 쿼리 수 히스토그램의 구간 상한. 마지막 구간은 그 이상 전부입니다.
+DURATION_BUCKETS = [5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000]
+QUERY_BUCKETS = [0, 1, 2, 5, 10, 20, 50, 100]
+
+current_metrics = ContextVar('request_metrics', default=None)
+
+
+class RequestMetrics:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.queries = []  # (ms, sql)
+        self.db_ms = 0.0
+        self.template_ms = 0.0
+        self.total_ms = 0.0
+        self.templates = {}  # 템플릿 이름: [렌더링 횟수, 시간(ms)]
+        self.template_includes = 0
+        self.template_stack = []
+
+    @property
+    def query_count(self):
+        return len(self.queries)
+
+    @property
+    def template_renders(self):
+        return sum(count for count, _ in self.templates.values())
+
+    def add_template(self, name, elapsed):
+        stats = self.templates.setdefault(name, [0, 0.0])
+        stats[0] += 1
+        stats[1] += elapsed
+
+    def finish(self):
+        self.total_ms = (time.perf_counter() - self.started) * 1000
+
+    def slowest_queries(self, limit=5):
+        return sorted(self.queries, reverse=True)[:limit]
+
+    def repeated_queries(self, limit=3):
+        # 같은 SQL이 여러 번 실행되었다면 N+1 쿼리일 가능성이 큽니다
+        counts = Counter(sql for _, sql in self.queries)
+        return [(sql, count) for sql, count in counts.most_common(limit) if count > 1]
+
+    def slowest_templates(self, limit=5):
+        return sorted(((ms, name, count) for name, (count, ms) in self.templates.items()), reverse=True)[:limit]
+
+
+def record_query(execute, sql, params, many, context):
+    metrics = current_metrics.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        elapsed = (time.perf_counter() - started) * 1000
+        metrics.db_ms += elapsed
+        metrics.queries.append((elapsed, sql))
+
+
+class TimedTemplate(Template):
+    def render(self, context=None, request=None):
+        metrics = current_metrics.get()
+        if metrics is None:
+            return super().render(context, request)
+        started = time.perf_counter()
+        try:
+            return super().render(context, request)
+        finally:
+            metrics.template_ms += (time.perf_counter() - started) * 1000
+
+
+class TimedNodeList(NodeList):
+    """
+    템플릿 하나의 본문입니다. 렌더링할 때마다 템플릿 이름별 시간과 include 횟수를 요청 지표에 더합니다.
+
+    시간은 안에서 그린 템플릿을 포함합니다. extends로 상속한 페이지의 블록은
+    부모 템플릿 안에서 그려지므로 base.html의 시간에 들어갑니다.
+    """
+
+    def __init__(self, nodelist, template_name):
+        super().__init__(nodelist)
+        self.contains_nontext = nodelist.contains_nontext
+        self.template_name = template_name
+        self.extends = any(isinstance(node, ExtendsNode) for node in nodelist)
+
+    def render(self, context):
+        metrics = current_metrics.get()
+        if metrics is None:
+            return super().render(context)
+        stack = metrics.template_stack
+        # extends하는 템플릿 바로 안에서 그려지는 것은 부모 템플릿이고, 나머지는 include입니다
+        if stack and not stack[-1].extends:
+            metrics.template_includes += 1
+        stack.append(self)
+        started = time.perf_counter()
+        try:
+            return super().render(context)
+        finally:
+            stack.pop()
+            metrics.add_template(self.template_name, (time.perf_counter() - started) * 1000)
+
+
+class TimedCachedLoader(CachedLoader):
+    """
+    한 번 읽은 템플릿을 프로세스에 보관하는 캐시 로더에 렌더링 시간 측정을 더합니다.
+    include/extends도 이 로더를 거치므로 요청 안에서 그린 템플릿을 모두 잴 수 있습니다.
+    """
+
+    def get_template(self, template_name, skip=None):
+        template = super().get_template(template_name, skip)
+        if not isinstance(template.nodelist, TimedNodeList):
+            template.nodelist = TimedNodeList(template.nodelist, template.name)
+        return template
+
+
+class TimedDjangoTemplates(DjangoTemplates):
+    """
+    렌더링 시간을 요청 지표에 더하는 Django 템플릿 백엔드입니다.
+    최상위 템플릿의 전체 시간은 여기서, 템플릿별 시간과 include 횟수는 TimedCachedLoader에서 잽니다.
+    """
+
+    def from_string(self, template_code):
+        return TimedTemplate(self.engine.from_string(template_code), self)
+
+    def get_template(self, template_name):
+        template = super().get_template(template_name)
+        return TimedTemplate(template.template, self)
+
+    def warm_up(self):
+        """
+        DIRS 아래의 모든 템플릿을 미리 파싱해 캐시 로더에 올립니다.
+        (읽은 템플릿 수, 실패한 템플릿 이름과 오류 목록)을 돌려줍니다.
+        """
+        loaded, failed = 0, []
+        for directory in self.engine.dirs:
+            for path in sorted(Path(directory).rglob('*')):
+                if not path.is_file() or path.name.startswith('.'):
+                    continue
+                name = path.relative_to(directory).as_posix()
+                try:
+                    self.engine.get_template(name)
+                except Exception as e:
+                    failed.append((name, e))
+                else:
+                    loaded += 1
+        return loaded, failed
+
+
+def warm_up_templates(force=False):
+    # 첫 요청이 템플릿 파싱으로 느려지지 않도록 워커가 뜰 때 불립니다 (TEMPLATE_WARMUP)
+    if not force and not getattr(settings, 'TEMPLATE_WARMUP', False):
+        return 0, []
+    loaded, failed = 0, []
+    for backend in engines.all():
+        if isinstance(backend, TimedDjangoTemplates):
+            count, errors = backend.warm_up()
+            loaded += count
+            failed.extend(errors)
+    return loaded, failed
+
+
+class MetricsRegistry:
+    """
+    URL 이름별 요청 지표를 프로세스 메모리에 모읍니다.
+    워커 프로세스가 여러 개라면 각 프로세스가 자신이 처리한 요청만 집계합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._views = {}
+        self._templates = {}
+
+    def record(self, view_name, metrics):
+        with self._lock:
+            stats = self._views.get(view_name)
+            if stats is None:
+                stats = self._views[view_name] = {
+                    'count': 0,
+                    'total_ms': 0.0,
+                    'db_ms': 0.0,
+                    'template_ms': 0.0,
+                    'template_includes': 0,
+                    'queries': 0,
+                    'max_ms': 0.0,
+                    'max_queries': 0,
+                    'duration_histogram': [0] * (len(DURATION_BUCKETS) + 1),
+                    'query_histogram': [0] * (len(QUERY_BUCKETS) + 1),
+                }
+            stats['count'] += 1
+            stats['total_ms'] += metrics.total_ms
+            stats['db_ms'] += metrics.db_ms
+            stats['template_ms'] += metrics.template_ms
+            stats['template_includes'] += metrics.template_includes
+            stats['queries'] += metrics.query_count
+            stats['max_ms'] = max(stats['max_ms'], metrics.total_ms)
+            stats['max_queries'] = max(stats['max_queries'], metrics.query_count)
+            stats['duration_histogram'][bisect.bisect_left(DURATION_BUCKETS, metrics.total_ms)] += 1
+            stats['query_histogram'][bisect.bisect_left(QUERY_BUCKETS, metrics.query_count)] += 1
+            for name, (count, elapsed) in metrics.templates.items():
+                template = self._templates.setdefault(name, {'renders': 0, 'total_ms': 0.0, 'max_ms': 0.0})
+                template['renders'] += count
+                template['total_ms'] += elapsed
+                template['max_ms'] = max(template['max_ms'], elapsed / count)
+
+    def snapshot(self):
+        with self._lock:
+            views = {}
+            for view_name, stats in sorted(self._views.items()):
+                count = stats['count']
+                views[view_name] = {
+                    'count': count,
+                    'avg_ms': round(stats['total_ms'] / count, 2),
+                    'avg_db_ms': round(stats['db_ms'] / count, 2),
+                    'avg_template_ms': round(stats['template_ms'] / count, 2),
+                    'avg_template_includes': round(stats['template_includes'] / count, 2),
+                    'avg_queries': round(stats['queries'] / count, 2),
+                    'max_ms': round(stats['max_ms'], 2),
+                    'max_queries': stats['max_queries'],
+                    'duration_histogram': histogram(DURATION_BUCKETS, stats['duration_histogram']),
+                    'query_histogram': histogram(QUERY_BUCKETS, stats['query_histogram']),
+                }
+            # 렌더링에 쓴 시간이 많은 템플릿부터 보여 줍니다
+            templates = {
+                name: {
+                    'renders': stats['renders'],
+                    'avg_ms': round(stats['total_ms'] / stats['renders'], 2),
+                    'max_ms': round(stats['max_ms'], 2),
+                    'total_ms': round(stats['total_ms'], 2),
+                }
+                for name, stats in sorted(self._templates.items(), key=lambda item: -item[1]['total_ms'])
+            }
+        return {'pid': os.getpid(), 'views': views, 'templates': templates}
+
+    def reset(self):
+        with self._lock:
+            self._views.clear()
+            self._templates.clear()
+
+
+def histogram(bounds, counts):
+    labels = [f'<={bound}' for bound in bounds] + [f'>{bounds[-1]}']
+    return dict(zip(labels, counts))
+
+
+registry = MetricsRegistry()
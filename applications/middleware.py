@@ -0,0 +1,178 @@
+import logging
+import time
+from contextlib import ExitStack
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import connections
+from django.utils.deprecation import MiddlewareMixin
+
+from .metrics import RequestMetrics, current_metrics, record_query, registry
+from .ratelimit import check_rate_limits, rate_limited_response
+
+logger = logging.getLogger('applications.metrics')
+
+SESSION_REFRESHED_KEY = '_session_refreshed_at'
+
+
+class SlidingSessionMiddleware:
+    """
+    SESSION_SAVE_EVERY_REQUEST 대신 세션 만료 시각을 밀어 주는 미들웨어입니다.
+
+    남은 수명이 SESSION_REFRESH_THRESHOLD(초)보다 적어졌을 때만 세션을 다시 저장하므로,
+    자동 저장처럼 자주 오는 요청마다 세션 저장소에 쓰지 않습니다.
+    SessionMiddleware보다 뒤에 두어야 응답 시 세션이 저장되기 전에 실행됩니다.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        response = self.get_response(request)
+        self.refresh(request)
+        return response
+
+    async def __acall__(self, request):
+        response = await self.get_response(request)
+        # 세션을 읽으면 저장소를 조회할 수 있으므로 동기 코드로 처리합니다
+        await sync_to_async(self.refresh)(request)
+        return response
+
+    def refresh(self, request):
+        session = getattr(request, 'session', None)
+        if session is None or session.is_empty():
+            return
+        if session.modified:
+            # 어차피 저장되는 요청이므로 갱신 시각만 함께 기록합니다
+            session[SESSION_REFRESHED_KEY] = int(time.time())
+            return
+
+        refreshed_at = session.get(SESSION_REFRESHED_KEY)
+        if session.is_empty():
+            # 쿠키의 세션이 이미 만료되었으면 새로 만들지 않습니다
+            return
+
+        now = int(time.time())
+        age = session.get_expiry_age()
+        threshold = getattr(settings, 'SESSION_REFRESH_THRESHOLD', age // 2)
+        if refreshed_at is None or refreshed_at + age - now < threshold:
+            # 값을 바꾸면 SessionMiddleware가 저장소와 쿠키의 만료 시각을 함께 갱신합니다
+            session[SESSION_REFRESHED_KEY] = now
+
+
+class RequestMetricsMiddleware:
+    """
+    요청마다 쿼리 수, DB 시간, 템플릿 렌더링 시간, 전체 처리 시간을 잽니다.
+
+    DEBUG이거나 스태프 사용자이면 Server-Timing 헤더로 브라우저 개발자 도구에 보여 주고,
+    REQUEST_METRICS_SLOW_MS(ms)나 REQUEST_METRICS_SLOW_QUERIES(개)를 넘는 요청은 원인 SQL과 함께 로그에 남깁니다.
+    모든 미들웨어의 시간이 포함되도록 MIDDLEWARE 맨 앞에 둡니다.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        metrics = RequestMetrics()
+        token = current_metrics.set(metrics)
+        try:
+            with self.wrap_connections():
+                response = self.get_response(request)
+        finally:
+            current_metrics.reset(token)
+        return self.finish(request, response, metrics)
+
+    async def __acall__(self, request):
+        metrics = RequestMetrics()
+        token = current_metrics.set(metrics)
+        try:
+            # async 뷰의 ORM 호출은 요청마다 정해진 스레드에서 실행되므로 그 스레드의 연결을 감쌉니다
+            stack = await sync_to_async(self.wrap_connections)()
+            try:
+                response = await self.get_response(request)
+            finally:
+                await sync_to_async(stack.close)()
+        finally:
+            current_metrics.reset(token)
+        # 스태프 여부를 확인하려면 request.user를 읽어야 합니다
+        return await sync_to_async(self.finish)(request, response, metrics)
+
+    def wrap_connections(self):
+        stack = ExitStack()
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(record_query))
+        return stack
+
+    def finish(self, request, response, metrics):
+        metrics.finish()
+        match = request.resolver_match
+        view_name = match.view_name if match else 'unresolved'
+        registry.record(view_name, metrics)
+        if self.is_slow(metrics):
+            self.log_slow_request(request, view_name, metrics)
+        if settings.DEBUG or self.is_staff(request):
+            response['Server-Timing'] = self.server_timing(metrics)
+        return response
+
+    def is_staff(self, request):
+        user = getattr(request, 'user', None)
+        return user is not None and user.is_staff
+
+    def is_slow(self, metrics):
+        return (
+            metrics.total_ms > getattr(settings, 'REQUEST_METRICS_SLOW_MS', 500)
+            or metrics.query_count > getattr(settings, 'REQUEST_METRICS_SLOW_QUERIES', 50)
+        )
+
+    def server_timing(self, metrics):
+        return ', '.join([
+            f'db;dur={metrics.db_ms:.1f};desc="{metrics.query_count} queries"',
+            f'tpl;dur={metrics.template_ms:.1f};desc="{metrics.template_renders} templates, {metrics.template_includes} includes"',
+            f'total;dur={metrics.total_ms:.1f}',
+        ])
+
+    def log_slow_request(self, request, view_name, metrics):
+        lines = [
+            f'느린 요청 {request.method} {request.path} ({view_name}): '
+            f'{metrics.total_ms:.0f}ms, 쿼리 {metrics.query_count}개 {metrics.db_ms:.0f}ms, '
+            f'템플릿 {metrics.template_ms:.0f}ms (include {metrics.template_includes}회)'
+        ]
+        for elapsed, sql in metrics.slowest_queries():
+            lines.append(f'  {elapsed:.1f}ms {sql[:300]}')
+        for sql, count in metrics.repeated_queries():
+            lines.append(f'  {count}회 반복 {sql[:300]}')
+        for elapsed, name, count in metrics.slowest_templates():
+            lines.append(f'  템플릿 {name} {elapsed:.1f}ms ({count}회)')
+        logger.warning('\n'.join(lines))
+
+
+class RateLimitMiddleware(MiddlewareMixin):
+    """
+    RATE_LIMITS 설정({URL 이름: 규칙 목록})에 있는 뷰의 POST 요청을 제한합니다.
+    로그인 화면처럼 직접 데코레이터를 붙일 수 없는 뷰에 씁니다.
+    """
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if request.method != 'POST':
+            return None
+        rules = getattr(settings, 'RATE_LIMITS', {}).get(request.resolver_match.view_name)
+        if not rules:
+            return None
+        retry_after = check_rate_limits(request, request.resolver_match.view_name, rules)
+        if retry_after:
+            return rate_limited_response(request, retry_after)
+        return None
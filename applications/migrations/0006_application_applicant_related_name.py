@@ -0,0 +1,26 @@
+# Generated by Django 5.0.2 on 2026-10-18 10:22
+
+import applications.models
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0005_remove_application_photo_applicant_photo'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='applicant',
+            name='photo',
+            field=models.ImageField(blank=True, help_text='3x4cm 사진을 업로드해주세요. (JPG, PNG, HEIC 형식, 최대 5MB)', null=True, upload_to='applicant_photos/%Y/%m/', validators=[applications.models.validate_image_file], verbose_name='프로필 사진'),
+        ),
+        migrations.AlterField(
+            model_name='application',
+            name='applicant',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='applications', to=settings.AUTH_USER_MODEL, verbose_name='지원자'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.0.2 on 2026-10-18 10:22
+
+from django.db import migrations, models
+
+
+def remove_duplicate_answers(apps, schema_editor):
+    # 같은 질문에 대한 중복 답변은 가장 최근 행만 남깁니다
+    Answer = apps.get_model('applications', 'Answer')
+    latest_ids = (
+        Answer.objects.values('application_id', 'question_id')
+        .annotate(latest_id=models.Max('id'))
+        .values_list('latest_id', flat=True)
+    )
+    Answer.objects.exclude(id__in=list(latest_ids)).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0006_application_applicant_related_name'),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_answers, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='answer',
+            constraint=models.UniqueConstraint(fields=('application', 'question'), name='unique_answer_per_question'),
+        ),
+    ]
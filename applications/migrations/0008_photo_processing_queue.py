@@ -0,0 +1,48 @@
+# Generated by Django 5.0.2 on 2026-10-18 10:25
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+def mark_existing_photos_ready(apps, schema_editor):
+    # 이전 버전은 업로드 요청 안에서 바로 변환했으므로 기존 사진은 모두 처리 완료 상태입니다
+    Applicant = apps.get_model('applications', 'Applicant')
+    Applicant.objects.exclude(photo='').exclude(photo__isnull=True).update(photo_status='ready')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0007_answer_unique_application_question'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='applicant',
+            name='photo_status',
+            field=models.CharField(blank=True, choices=[('pending', '처리 대기'), ('processing', '처리 중'), ('ready', '처리 완료'), ('failed', '처리 실패')], max_length=20, verbose_name='사진 처리 상태'),
+        ),
+        migrations.CreateModel(
+            name='PhotoJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('pending', '대기'), ('processing', '처리 중'), ('done', '완료'), ('failed', '실패')], default='pending', max_length=20, verbose_name='상태')),
+                ('attempts', models.PositiveIntegerField(default=0, verbose_name='시도 횟수')),
+                ('available_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='실행 가능 시각')),
+                ('last_error', models.TextField(blank=True, verbose_name='마지막 오류')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일')),
+                ('photo', models.CharField(max_length=255, verbose_name='원본 파일')),
+                ('applicant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='photo_jobs', to=settings.AUTH_USER_MODEL, verbose_name='지원자')),
+            ],
+            options={
+                'verbose_name': '사진 처리 작업',
+                'verbose_name_plural': '사진 처리 작업 목록',
+                'abstract': False,
+                'indexes': [models.Index(fields=['status', 'available_at'], name='application_status_056f00_idx')],
+            },
+        ),
+        migrations.RunPython(mark_existing_photos_ready, migrations.RunPython.noop),
+    ]
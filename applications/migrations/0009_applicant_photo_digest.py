@@ -0,0 +1,18 @@
+# Generated by Django 5.0.2 on 2026-10-18 10:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0008_photo_processing_queue'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='applicant',
+            name='photo_digest',
+            field=models.CharField(blank=True, editable=False, max_length=64, verbose_name='사진 해시'),
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 5.0.2 on 2026-10-18 10:28
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0009_applicant_photo_digest'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OutboundEmail',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('pending', '대기'), ('processing', '처리 중'), ('done', '완료'), ('failed', '실패')], default='pending', max_length=20, verbose_name='상태')),
+                ('attempts', models.PositiveIntegerField(default=0, verbose_name='시도 횟수')),
+                ('available_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='실행 가능 시각')),
+                ('last_error', models.TextField(blank=True, verbose_name='마지막 오류')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일')),
+                ('to_email', models.EmailField(max_length=254, verbose_name='받는 사람')),
+                ('subject', models.CharField(max_length=255, verbose_name='제목')),
+                ('body', models.TextField(verbose_name='본문')),
+                ('html_body', models.TextField(blank=True, verbose_name='HTML 본문')),
+                ('dedupe_key', models.CharField(blank=True, max_length=100, verbose_name='중복 방지 키')),
+                ('sent_at', models.DateTimeField(blank=True, null=True, verbose_name='발송일')),
+                ('applicant', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='outbound_emails', to=settings.AUTH_USER_MODEL, verbose_name='지원자')),
+            ],
+            options={
+                'verbose_name': '발송 메일',
+                'verbose_name_plural': '발송 메일 목록',
+                'abstract': False,
+                'indexes': [models.Index(fields=['status', 'available_at'], name='application_status_5b66a6_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='outboundemail',
+            constraint=models.UniqueConstraint(condition=models.Q(('status', 'pending'), models.Q(('dedupe_key', ''), _negated=True)), fields=('dedupe_key',), name='unique_pending_email_per_dedupe_key'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.0.2 on 2026-10-18 10:29
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0010_outbound_email_queue'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StatusChange',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('from_status', models.CharField(choices=[('draft', '임시저장'), ('submitted', '제출완료'), ('document_screening', '서류심사중'), ('document_passed', '서류합격'), ('document_failed', '서류불합격'), ('interview_scheduled', '면접예정'), ('interview_completed', '면접완료'), ('final_passed', '최종합격'), ('final_failed', '최종불합격')], max_length=20, verbose_name='이전 상태')),
+                ('to_status', models.CharField(choices=[('draft', '임시저장'), ('submitted', '제출완료'), ('document_screening', '서류심사중'), ('document_passed', '서류합격'), ('document_failed', '서류불합격'), ('interview_scheduled', '면접예정'), ('interview_completed', '면접완료'), ('final_passed', '최종합격'), ('final_failed', '최종불합격')], max_length=20, verbose_name='변경 상태')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='변경일')),
+                ('application', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='status_changes', to='applications.application', verbose_name='지원서')),
+                ('changed_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='변경한 사람')),
+            ],
+            options={
+                'verbose_name': '상태 변경 기록',
+                'verbose_name_plural': '상태 변경 기록 목록',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
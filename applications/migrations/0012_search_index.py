@@ -0,0 +1,80 @@
+# Generated by Django 5.0.2 on 2026-10-18 10:32
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+FTS_TABLE = 'applications_searchdocument_fts'
+
+SQLITE_FORWARD = [
+    f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5("
+    "content, content='applications_searchdocument', content_rowid='id', tokenize='unicode61')",
+    f"CREATE TRIGGER {FTS_TABLE}_ai AFTER INSERT ON applications_searchdocument BEGIN "
+    f"INSERT INTO {FTS_TABLE}(rowid, content) VALUES (new.id, new.content); END",
+    f"CREATE TRIGGER {FTS_TABLE}_ad AFTER DELETE ON applications_searchdocument BEGIN "
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, content) VALUES ('delete', old.id, old.content); END",
+    f"CREATE TRIGGER {FTS_TABLE}_au AFTER UPDATE ON applications_searchdocument BEGIN "
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, content) VALUES ('delete', old.id, old.content); "
+    f"INSERT INTO {FTS_TABLE}(rowid, content) VALUES (new.id, new.content); END",
+]
+SQLITE_BACKWARD = [
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ai",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ad",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_au",
+    f"DROP TABLE IF EXISTS {FTS_TABLE}",
+]
+POSTGRES_FORWARD = [
+    "CREATE INDEX applications_searchdocument_content_gin "
+    "ON applications_searchdocument USING gin (to_tsvector('simple', content))",
+]
+POSTGRES_BACKWARD = [
+    "DROP INDEX IF EXISTS applications_searchdocument_content_gin",
+]
+
+
+def run_statements(schema_editor, statements):
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        run_statements(schema_editor, POSTGRES_FORWARD)
+    elif vendor == 'sqlite':
+        with schema_editor.connection.cursor() as cursor:
+            cursor.execute("SELECT sqlite_compileoption_used('ENABLE_FTS5')")
+            if not cursor.fetchone()[0]:
+                return
+        run_statements(schema_editor, SQLITE_FORWARD)
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        run_statements(schema_editor, POSTGRES_BACKWARD)
+    elif vendor == 'sqlite':
+        run_statements(schema_editor, SQLITE_BACKWARD)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0011_status_change_audit'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('content', models.TextField(blank=True, verbose_name='검색 내용')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일')),
+                ('application', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='search_document', to='applications.application', verbose_name='지원서')),
+            ],
+            options={
+                'verbose_name': '검색 문서',
+                'verbose_name_plural': '검색 문서 목록',
+            },
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 5.0.2 on 2026-10-18 10:44
+
+from django.db import migrations, models
+
+
+def remove_duplicate_applications(apps, schema_editor):
+    # 같은 모집에 중복된 지원서는 제출된 것(없으면 가장 최근 것) 하나만 남깁니다
+    Application = apps.get_model('applications', 'Application')
+    duplicates = (
+        Application.objects.values('applicant_id', 'recruitment_settings_id')
+        .annotate(count=models.Count('id'))
+        .filter(count__gt=1)
+    )
+    for duplicate in duplicates:
+        applications = Application.objects.filter(
+            applicant_id=duplicate['applicant_id'],
+            recruitment_settings_id=duplicate['recruitment_settings_id'],
+        ).order_by(
+            models.Case(models.When(status='draft', then=1), default=0),
+            '-updated_at',
+            '-id',
+        )
+        keep = applications.first()
+        applications.exclude(pk=keep.pk).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0012_search_index'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='applicant',
+            index=models.Index(fields=['name', 'phone_number'], name='applicant_name_phone_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='applicant',
+            index=models.Index(condition=models.Q(('password_reset_token__isnull', False)), fields=['password_reset_token', 'token_generated_at'], name='applicant_reset_token_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='recruitmentsettings',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['application_start_date', 'application_end_date'], name='recruitment_active_dates_idx'),
+        ),
+        migrations.RunPython(remove_duplicate_applications, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='application',
+            constraint=models.UniqueConstraint(fields=('applicant', 'recruitment_settings'), name='unique_application_per_recruitment'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.2 on 2026-10-18 10:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0013_lookup_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='application',
+            name='version',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='버전'),
+        ),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 5.0.2 on 2026-10-18 11:46
+
+from django.db import migrations, models
+
+FTS_TABLE = 'applications_searchdocument_fts'
+
+
+def create_triggers(schema_editor, update_columns):
+    # 필드를 추가/삭제하며 SQLite가 테이블을 다시 만들면 트리거가 사라지므로 세 트리거를 모두 다시 만듭니다
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s", [FTS_TABLE])
+        if cursor.fetchone() is None:
+            return
+    for suffix in ('ai', 'ad', 'au'):
+        schema_editor.execute(f"DROP TRIGGER IF EXISTS {FTS_TABLE}_{suffix}")
+    schema_editor.execute(
+        f"CREATE TRIGGER {FTS_TABLE}_ai AFTER INSERT ON applications_searchdocument BEGIN "
+        f"INSERT INTO {FTS_TABLE}(rowid, content) VALUES (new.id, new.content); END"
+    )
+    schema_editor.execute(
+        f"CREATE TRIGGER {FTS_TABLE}_ad AFTER DELETE ON applications_searchdocument BEGIN "
+        f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, content) VALUES ('delete', old.id, old.content); END"
+    )
+    schema_editor.execute(
+        f"CREATE TRIGGER {FTS_TABLE}_au AFTER UPDATE {update_columns}ON applications_searchdocument BEGIN "
+        f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, content) VALUES ('delete', old.id, old.content); "
+        f"INSERT INTO {FTS_TABLE}(rowid, content) VALUES (new.id, new.content); END"
+    )
+
+
+def sync_on_content_update(apps, schema_editor):
+    # 색인 표시(stale_at)만 바꾸는 UPDATE에서는 FTS 행을 다시 쓰지 않고 content가 바뀔 때만 동기화합니다
+    create_triggers(schema_editor, 'OF content ')
+
+
+def sync_on_any_update(apps, schema_editor):
+    create_triggers(schema_editor, '')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0014_application_version'),
+    ]
+
+    operations = [
+        # 되돌릴 때는 필드를 지운 뒤 마지막에 실행되어 이전 트리거를 다시 만듭니다
+        migrations.RunPython(migrations.RunPython.noop, sync_on_any_update),
+        migrations.AddField(
+            model_name='searchdocument',
+            name='stale_at',
+            field=models.DateTimeField(blank=True, db_index=True, null=True, verbose_name='색인 필요 시각'),
+        ),
+        migrations.RunPython(sync_on_content_update, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.0.2 on 2026-10-18 11:53
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0015_search_index_queue'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='recruitmentsettings',
+            name='recruitment_active_dates_idx',
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.2 on 2026-10-18 11:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0016_drop_recruitment_dates_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='photojob',
+            name='previous_photo',
+            field=models.CharField(blank=True, max_length=255, verbose_name='이전 사진'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.2 on 2026-10-18 12:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0017_photo_job_previous_photo'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='applicant',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, verbose_name='수정일'),
+        ),
+    ]
@@ -2,18 +2,19 @@ from django.db import models
 from django.core.validators import MinLengthValidator, MaxLengthValidator, EmailValidator, RegexValidator
 from django.utils import timezone
 import uuid
+import hashlib
 from django.contrib.auth.models import AbstractUser, BaseUserManager
 import random
 import string
 from django.core.mail import send_mail
 from django.conf import settings
+from django.urls import reverse
 from datetime import datetime, timedelta
-from PIL import Image
-import os
-from PIL import ExifTags
 from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+from django.db.models import F, Q
 import magic
-import pillow_heif
+from asgiref.sync import sync_to_async
 
 class RecruitmentSettings(models.Model):
     title = models.CharField('모집 제목', max_length=200)
@@ -126,6 +127,21 @@ class Applicant(AbstractUser):
     is_email_verified = models.BooleanField(default=False)
     
     password_reset_token = models.UUIDField(null=True, blank=True)
+
+    PHOTO_PENDING = 'pending'
+    PHOTO_PROCESSING = 'processing'
+    PHOTO_READY = 'ready'
+    PHOTO_FAILED = 'failed'
+    PHOTO_STATUS_CHOICES = [
+        (PHOTO_PENDING, '처리 대기'),
+        (PHOTO_PROCESSING, '처리 중'),
+        (PHOTO_READY, '처리 완료'),
+        (PHOTO_FAILED, '처리 실패'),
+    ]
+    photo_status = models.CharField('사진 처리 상태', max_length=20, choices=PHOTO_STATUS_CHOICES, blank=True)
+    photo_digest = models.CharField('사진 해시', max_length=64, blank=True, editable=False)
+    # 지원서 확인 화면의 ETag와 답변 조각 캐시 키에 들어가, 관리자가 지원자 정보를 고치면 새로 그리게 합니다
+    updated_at = models.DateTimeField('수정일', auto_now=True)
     
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = ['username']
@@ -133,6 +149,16 @@ class Applicant(AbstractUser):
     class Meta:
         verbose_name = '지원자'
         verbose_name_plural = '지원자 목록'
+        indexes = [
+            # 이메일 찾기
+            models.Index(fields=['name', 'phone_number'], name='applicant_name_phone_idx'),
+            # 비밀번호 재설정 링크. 토큰이 발급된 지원자만 색인합니다.
+            models.Index(
+                fields=['password_reset_token', 'token_generated_at'],
+                condition=Q(password_reset_token__isnull=False),
+                name='applicant_reset_token_idx',
+            ),
+        ]
     
     def __str__(self):
         return f'{self.name} ({self.email})'
@@ -141,103 +167,93 @@ class Applicant(AbstractUser):
         if not self.username:
             self.username = self.email
         
-        # 기존 이미지가 있다면 삭제
-        try:
-            this = Applicant.objects.get(id=self.id)
-            if this.photo != self.photo and this.photo:
-                this.photo.delete(save=False)
-        except:
-            pass
-
-        super().save(*args, **kwargs)
-        
-        # 이미지 처리
-        if self.photo:
-            file_path = self.photo.path
-            file_name, file_ext = os.path.splitext(file_path)
-            
-            try:
-                # HEIC/HEIF 파일 처리
-                if file_ext.lower() in ['.heic', '.heif']:
-                    heif_file = pillow_heif.read_heif(file_path)
-                    img = Image.frombytes(
-                        heif_file.mode,
-                        heif_file.size,
-                        heif_file.data,
-                        "raw",
-                    )
-                    
-                    # HEIC/HEIF 파일을 JPG로 변환
-                    new_path = file_name + '.jpg'
-                    self.photo.name = os.path.basename(new_path)
-                    img.save(new_path, 'JPEG', quality=95)
-                    
-                    # 원본 HEIC/HEIF 파일 삭제
-                    os.remove(file_path)
-                    file_path = new_path
-                else:
-                    img = Image.open(file_path)
-
-                # EXIF 방향 정보 처리
+        # 사진을 읽지 않았거나 저장 대상이 아니면(로그인 시각 갱신 등) 사진 변경을 확인하지 않습니다
+        update_fields = kwargs.get('update_fields')
+        photo_changed = False
+        previous_photo = ''
+        if 'photo' not in self.get_deferred_fields() and (update_fields is None or 'photo' in update_fields):
+            photo_changed = bool(self.photo)
+            if self.pk:
                 try:
-                    for orientation in ExifTags.TAGS.keys():
-                        if ExifTags.TAGS[orientation] == 'Orientation':
-                            break
-                    exif = dict(img._getexif().items())
-
-                    if orientation in exif:
-                        if exif[orientation] == 2:
-                            img = img.transpose(Image.FLIP_LEFT_RIGHT)
-                        elif exif[orientation] == 3:
-                            img = img.rotate(180)
-                        elif exif[orientation] == 4:
-                            img = img.transpose(Image.FLIP_TOP_BOTTOM)
-                        elif exif[orientation] == 5:
-                            img = img.transpose(Image.FLIP_LEFT_RIGHT).rotate(90)
-                        elif exif[orientation] == 6:
-                            img = img.rotate(270)
-                        elif exif[orientation] == 7:
-                            img = img.transpose(Image.FLIP_LEFT_RIGHT).rotate(270)
-                        elif exif[orientation] == 8:
-                            img = img.rotate(90)
-                except (AttributeError, KeyError, IndexError):
+                    this = Applicant.objects.only('id', 'photo', 'photo_status').get(id=self.id)
+                    photo_changed = this.photo != self.photo
+                    if photo_changed and this.photo:
+                        previous_photo = self.replaced_photo(this)
+                except Applicant.DoesNotExist:
                     pass
 
-                # 이미지 크기 및 비율 조정
-                width, height = img.size
-                target_ratio = 3/4
-                current_ratio = width/height
-
-                if current_ratio > target_ratio:  # 너무 넓은 경우
-                    new_width = int(height * target_ratio)
-                    left = (width - new_width) // 2
-                    img = img.crop((left, 0, left + new_width, height))
-                elif current_ratio < target_ratio:  # 너무 높은 경우
-                    new_height = int(width / target_ratio)
-                    top = (height - new_height) // 2
-                    img = img.crop((0, top, width, top + new_height))
-
-                # 최종 크기로 리사이징 (300x400px)
-                output_size = (300, 400)
-                img = img.resize(output_size, Image.Resampling.LANCZOS)
-
-                # 이미지 최적화 및 저장
-                img.save(file_path, 'JPEG', quality=85, optimize=True)
-                
-            except Exception as e:
-                # 이미지 처리 중 오류 발생 시 이미지 삭제
-                if os.path.exists(file_path):
-                    os.remove(file_path)
-                self.photo = None
-                self.save()
-                raise ValidationError(f'이미지 처리 중 오류가 발생했습니다: {str(e)}')
+        # 이미지 변환은 요청 밖에서 process_photos 워커가 처리합니다
+        if photo_changed:
+            self.photo_status = self.PHOTO_PENDING if self.photo else ''
+            self.photo_digest = ''
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'photo_status', 'photo_digest'}
+
+        super().save(*args, **kwargs)
+
+        if photo_changed and self.photo:
+            PhotoJob.objects.create(applicant=self, photo=self.photo.name, previous_photo=previous_photo)
+
+    def replaced_photo(self, this):
+        """
+        사진이 바뀔 때 기존 사진을 정리하고, 새 사진 작업이 나중에 지울 처리된 사진 이름을 반환합니다.
+
+        처리된 사진은 새 사진이 준비될 때까지 두었다가 사진 작업이 새 사진을 저장한 뒤 렌디션과 함께 지웁니다.
+        아직 처리되지 않은 업로드는 렌디션이 없으므로 바로 지우고, 그 작업이 지우려던 사진을 이어받습니다.
+        """
+        from .photos import delete_photo
+
+        storage = this.photo.storage
+        if this.photo_status == self.PHOTO_READY:
+            previous_photo = this.photo.name
+        else:
+            previous_photo = PhotoJob.objects.filter(
+                applicant_id=self.pk, photo=this.photo.name
+            ).order_by('-id').values_list('previous_photo', flat=True).first() or ''
+            this.photo.delete(save=False)
+        if not self.photo:
+            # 사진을 지운 경우 기다릴 새 사진이 없으므로 바로 지웁니다
+            delete_photo(storage, previous_photo)
+            return ''
+        return previous_photo
+    
+    def get_photo_digest(self):
+        # 처리 완료된 사진의 내용 해시. 해시가 없던 기존 사진은 처음 요청될 때 계산해 둡니다.
+        if self.photo_status != self.PHOTO_READY or not self.photo:
+            return ''
+        if not self.photo_digest:
+            from .photos import file_digest
+            self.photo_digest = file_digest(self.photo.storage, self.photo.name)
+            Applicant.objects.filter(pk=self.pk, photo=self.photo.name).update(photo_digest=self.photo_digest)
+        return self.photo_digest
+
+    def get_photo_rendition_url(self, rendition):
+        from .photos import rendition_filename
+        digest = self.get_photo_digest()
+        if not digest:
+            return ''
+        return reverse('applications:photo_rendition', args=[self.pk, rendition, rendition_filename(digest, rendition)])
     
     def generate_verification_code(self):
         code = ''.join(random.choices(string.digits, k=6))
         self.email_verification_token = code
         self.token_generated_at = timezone.now()
-        self.save()
+        self.save(update_fields=['email_verification_token', 'token_generated_at'])
         return code
+
+    def reusable_verification_code(self):
+        # 재전송 대기 시간 안에 만든 코드가 아직 유효하면 새로 만들지 않고 그대로 다시 보냅니다
+        cooldown = getattr(settings, 'VERIFICATION_RESEND_COOLDOWN', 600)
+        if (
+            self.email_verification_token
+            and self.is_token_valid()
+            and timezone.now() < self.token_generated_at + timezone.timedelta(seconds=cooldown)
+        ):
+            return self.email_verification_token
+        return None
+
+    async def agenerate_verification_code(self):
+        return await sync_to_async(self.generate_verification_code)()
     
     def is_token_valid(self):
         if not self.token_generated_at:
@@ -248,15 +264,18 @@ class Applicant(AbstractUser):
         self.is_email_verified = True
         self.email_verification_token = ''
         self.token_generated_at = None
-        self.save()
+        self.save(update_fields=['is_email_verified', 'email_verification_token', 'token_generated_at'])
     
     def generate_password_reset_token(self):
         token = uuid.uuid4()
         self.password_reset_token = token
         self.token_generated_at = timezone.now()
-        self.save()
+        self.save(update_fields=['password_reset_token', 'token_generated_at'])
         return token
 
+    async def agenerate_password_reset_token(self):
+        return await sync_to_async(self.generate_password_reset_token)()
+
 class Application(models.Model):
     STATUS_CHOICES = [
         ('draft', '임시저장'),
@@ -273,6 +292,7 @@ class Application(models.Model):
     applicant = models.ForeignKey(
         Applicant,
         on_delete=models.CASCADE,
+        related_name='applications',
         verbose_name='지원자'
     )
     recruitment_settings = models.ForeignKey(
@@ -301,18 +321,54 @@ class Application(models.Model):
     interview_end_time = models.TimeField('면접 종료 시간', null=True, blank=True)
     interview_location = models.CharField('면접 장소', max_length=200, blank=True)
     interview_notes = models.TextField('면접 참고사항', blank=True)
+
+    # 작성 중인 지원서가 저장될 때마다 1씩 올라갑니다. 다른 창에서 먼저 저장했는지 확인하는 데 씁니다.
+    version = models.PositiveIntegerField('버전', default=0, editable=False)
     
     class Meta:
         verbose_name = '지원서'
         verbose_name_plural = '지원서 목록'
+        constraints = [
+            # 모집 기수마다 지원서는 하나이며, (지원자, 모집) 조회에도 이 인덱스를 씁니다
+            models.UniqueConstraint(fields=['applicant', 'recruitment_settings'], name='unique_application_per_recruitment'),
+        ]
     
     def __str__(self):
         return f'{self.applicant.name}의 지원서'
     
+    def save_draft(self, fields, version=None):
+        """
+        작성 중인 지원서의 fields를 조건부 UPDATE로 저장하고 version을 올립니다.
+        이미 제출되었거나, version을 넘겼는데 그 사이 다른 창에서 먼저 저장했다면
+        저장하지 않고 False를 반환합니다.
+        """
+        queryset = Application.objects.filter(pk=self.pk, status='draft')
+        if version is not None:
+            queryset = queryset.filter(version=version)
+        now = timezone.now()
+        if not queryset.update(version=F('version') + 1, updated_at=now, **fields):
+            return False
+
+        for field, value in fields.items():
+            setattr(self, field, value)
+        self.updated_at = now
+        if version is not None:
+            self.version = version + 1
+        else:
+            self.refresh_from_db(fields=['version'])
+        return True
+
     def submit(self):
-        self.status = 'submitted'
-        self.submitted_at = timezone.now()
-        self.save()
+        # 두 창에서 동시에 제출해도 작성 중(draft)인 지원서만 한 번 제출되도록 조건부 UPDATE로 바꿉니다
+        now = timezone.now()
+        submitted = Application.objects.filter(pk=self.pk, status='draft').update(
+            status='submitted', submitted_at=now, updated_at=now, version=F('version') + 1
+        )
+        if submitted:
+            self.status = 'submitted'
+            self.submitted_at = self.updated_at = now
+            self.version += 1
+        return bool(submitted)
     
     def get_interview_schedule_display(self):
         if not all([self.interview_date, self.interview_start_time, self.interview_end_time]):
@@ -333,14 +389,280 @@ class Application(models.Model):
             times.append('일요일 오후')
         return ', '.join(times) if times else '선택된 시간 없음'
 
+class StatusChange(models.Model):
+    application = models.ForeignKey(Application, on_delete=models.CASCADE, related_name='status_changes', verbose_name='지원서')
+    from_status = models.CharField('이전 상태', max_length=20, choices=Application.STATUS_CHOICES)
+    to_status = models.CharField('변경 상태', max_length=20, choices=Application.STATUS_CHOICES)
+    changed_by = models.ForeignKey(Applicant, on_delete=models.SET_NULL, null=True, blank=True, related_name='+', verbose_name='변경한 사람')
+    created_at = models.DateTimeField('변경일', auto_now_add=True)
+
+    class Meta:
+        verbose_name = '상태 변경 기록'
+        verbose_name_plural = '상태 변경 기록 목록'
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f'{self.application_id}: {self.get_from_status_display()} → {self.get_to_status_display()}'
+
+class SearchDocument(models.Model):
+    # 지원서 한 건의 지원자 정보와 답변을 n-gram으로 펼친 검색용 문서 (applications.search 참고)
+    application = models.OneToOneField(Application, on_delete=models.CASCADE, related_name='search_document', verbose_name='지원서')
+    content = models.TextField('검색 내용', blank=True)
+    # 다시 색인해야 하는 문서는 마지막으로 바뀐 시각을, 최신 문서는 NULL을 가집니다
+    stale_at = models.DateTimeField('색인 필요 시각', null=True, blank=True, db_index=True)
+    updated_at = models.DateTimeField('수정일', auto_now=True)
+
+    class Meta:
+        verbose_name = '검색 문서'
+        verbose_name_plural = '검색 문서 목록'
+
+    def __str__(self):
+        return f'{self.application_id} 검색 문서'
+
+def schedule_search_index(application_id):
+    from .search import schedule_index
+    schedule_index(application_id)
+
+def answer_hash(answer_text):
+    # 자동 저장 시 클라이언트와 서버가 답변 버전을 비교하는 데 사용하는 해시
+    return hashlib.sha1(answer_text.encode('utf-8')).hexdigest()[:16]
+
+class AnswerManager(models.Manager):
+    def _upsert(self, application, answers):
+        self.bulk_create(
+            [
+                self.model(application=application, question_id=question_id, answer_text=answer_text)
+                for question_id, answer_text in answers.items()
+            ],
+            update_conflicts=True,
+            unique_fields=['application', 'question'],
+            update_fields=['answer_text'],
+        )
+
+    def save_answers(self, application, answers):
+        """
+        {question_id: answer_text} 형태의 답변을 질문 수와 관계없이 한 번의 조회와
+        한 번의 upsert로 저장합니다. 변경된 답변 수를 반환합니다.
+        """
+        existing = dict(
+            self.filter(application=application).values_list('question_id', 'answer_text')
+        )
+        changed = {
+            question_id: answer_text
+            for question_id, answer_text in answers.items()
+            if existing.get(question_id) != answer_text
+        }
+        if changed:
+            self._upsert(application, changed)
+            schedule_search_index(application.pk)
+        return len(changed)
+
+    def save_answer_changes(self, application, changes):
+        """
+        자동 저장용 델타 저장입니다. changes는 {question_id: (answer_text, base_hash)}이며,
+        base_hash는 클라이언트가 마지막으로 받은 답변 해시이며, 서버의 답변이 그 사이
+        바뀌었다면 덮어쓰지 않고 conflicts로 돌려줍니다. None이면 검사하지 않습니다.
+        """
+        existing = dict(
+            self.filter(application=application, question_id__in=changes).values_list('question_id', 'answer_text')
+        )
+        saved, conflicts = {}, {}
+        for question_id, (answer_text, base_hash) in changes.items():
+            # 아직 저장되지 않은 답변은 빈 답변과 같은 것으로 봅니다
+            current = existing.get(question_id, '')
+            if current == answer_text:
+                continue
+            current_hash = answer_hash(current)
+            if base_hash is not None and base_hash != current_hash:
+                conflicts[question_id] = current_hash
+                continue
+            saved[question_id] = answer_text
+        if saved:
+            self._upsert(application, saved)
+            schedule_search_index(application.pk)
+        return {question_id: answer_hash(text) for question_id, text in saved.items()}, conflicts
+
 class Answer(models.Model):
     application = models.ForeignKey(Application, on_delete=models.CASCADE, verbose_name='지원서')
     question = models.ForeignKey(Question, on_delete=models.CASCADE, verbose_name='질문')
     answer_text = models.TextField('답변')
+
+    objects = AnswerManager()
     
     class Meta:
         verbose_name = '답변'
         verbose_name_plural = '답변 목록'
+        constraints = [
+            models.UniqueConstraint(fields=['application', 'question'], name='unique_answer_per_question'),
+        ]
     
     def __str__(self):
         return f'{self.application.applicant.name}의 답변'
+
+class QueuedJobManager(models.Manager):
+    def claim(self, limit):
+        """
+        실행 가능한 작업을 최대 limit개 가져와 processing 상태로 표시합니다.
+        행마다 조건부 UPDATE로 선점하므로 여러 워커가 동시에 돌아도 같은 작업을 중복 실행하지 않습니다.
+        오래 processing에 머문 작업(워커 비정상 종료)은 다시 가져갑니다.
+        """
+        now = timezone.now()
+        stale_before = now - timedelta(seconds=getattr(settings, 'JOB_STALE_AFTER', 600))
+        claimable = (
+            Q(status=QueuedJob.STATUS_PENDING, available_at__lte=now)
+            | Q(status=QueuedJob.STATUS_PROCESSING, updated_at__lt=stale_before)
+        )
+        candidates = list(
+            self.filter(claimable).order_by('available_at', 'id').values_list('id', flat=True)[:limit]
+        )
+        claimed = [
+            pk for pk in candidates
+            if self.filter(claimable, pk=pk).update(
+                status=QueuedJob.STATUS_PROCESSING, attempts=F('attempts') + 1, updated_at=now
+            )
+        ]
+        return list(self.filter(pk__in=claimed).order_by('available_at', 'id'))
+
+class QueuedJob(models.Model):
+    STATUS_PENDING = 'pending'
+    STATUS_PROCESSING = 'processing'
+    STATUS_DONE = 'done'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_PENDING, '대기'),
+        (STATUS_PROCESSING, '처리 중'),
+        (STATUS_DONE, '완료'),
+        (STATUS_FAILED, '실패'),
+    ]
+
+    status = models.CharField('상태', max_length=20, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    attempts = models.PositiveIntegerField('시도 횟수', default=0)
+    available_at = models.DateTimeField('실행 가능 시각', default=timezone.now)
+    last_error = models.TextField('마지막 오류', blank=True)
+    created_at = models.DateTimeField('생성일', auto_now_add=True)
+    updated_at = models.DateTimeField('수정일', auto_now=True)
+
+    objects = QueuedJobManager()
+
+    max_attempts_setting = 'JOB_MAX_ATTEMPTS'
+
+    class Meta:
+        abstract = True
+        indexes = [
+            models.Index(fields=['status', 'available_at']),
+        ]
+
+    @property
+    def max_attempts(self):
+        return getattr(settings, self.max_attempts_setting, getattr(settings, 'JOB_MAX_ATTEMPTS', 3))
+
+    def retry_delay(self):
+        # 지수 백오프: 30초, 60초, 120초 ... 최대 1시간
+        base = getattr(settings, 'JOB_RETRY_BASE_DELAY', 30)
+        return timedelta(seconds=min(base * 2 ** max(self.attempts - 1, 0), 3600))
+
+    def mark_done(self):
+        self.status = self.STATUS_DONE
+        self.last_error = ''
+        self.save(update_fields=['status', 'last_error', 'updated_at'])
+
+    def mark_failed(self, error):
+        if self.attempts >= self.max_attempts:
+            self.status = self.STATUS_FAILED
+        else:
+            self.status = self.STATUS_PENDING
+            self.available_at = timezone.now() + self.retry_delay()
+        self.last_error = error
+        self.save(update_fields=['status', 'available_at', 'last_error', 'updated_at'])
+
+class PhotoJob(QueuedJob):
+    applicant = models.ForeignKey(Applicant, on_delete=models.CASCADE, related_name='photo_jobs', verbose_name='지원자')
+    photo = models.CharField('원본 파일', max_length=255)
+    # 새 사진을 저장한 뒤 렌디션과 함께 지울 이전 사진
+    previous_photo = models.CharField('이전 사진', max_length=255, blank=True)
+
+    max_attempts_setting = 'PHOTO_JOB_MAX_ATTEMPTS'
+
+    class Meta(QueuedJob.Meta):
+        verbose_name = '사진 처리 작업'
+        verbose_name_plural = '사진 처리 작업 목록'
+
+    def __str__(self):
+        return f'{self.applicant_id} - {self.photo} ({self.get_status_display()})'
+
+class OutboundEmailManager(QueuedJobManager):
+    def enqueue(self, to_email, subject, body, html_body='', dedupe_key='', applicant=None):
+        """
+        메일을 발송 대기열에 넣습니다. 같은 dedupe_key로 아직 발송되지 않은 메일이 있으면
+        새로 쌓지 않고 그 메일의 내용을 최신으로 바꿉니다(인증 메일 재전송 버튼 연타 등).
+        """
+        fields = {
+            'to_email': to_email,
+            'subject': subject,
+            'body': body,
+            'html_body': html_body,
+            'applicant': applicant,
+        }
+        if dedupe_key:
+            pending = self.filter(dedupe_key=dedupe_key, status=QueuedJob.STATUS_PENDING)
+            if pending.update(updated_at=timezone.now(), **fields):
+                return self.filter(dedupe_key=dedupe_key).latest('id')
+        try:
+            with transaction.atomic():
+                return self.create(dedupe_key=dedupe_key, **fields)
+        except IntegrityError:
+            # 동시에 같은 키의 메일이 먼저 쌓였다면 그 메일을 갱신합니다
+            pending = self.filter(dedupe_key=dedupe_key, status=QueuedJob.STATUS_PENDING)
+            pending.update(updated_at=timezone.now(), **fields)
+            return self.filter(dedupe_key=dedupe_key).latest('id')
+
+    async def aenqueue(self, to_email, subject, body, html_body='', dedupe_key='', applicant=None):
+        # async 뷰용 enqueue. 쿼리마다 스레드를 오가지 않고 enqueue 전체를 한 번에 스레드에서 실행합니다.
+        return await sync_to_async(self.enqueue)(
+            to_email, subject, body, html_body=html_body, dedupe_key=dedupe_key, applicant=applicant
+        )
+
+class OutboundEmail(QueuedJob):
+    applicant = models.ForeignKey(Applicant, on_delete=models.SET_NULL, null=True, blank=True, related_name='outbound_emails', verbose_name='지원자')
+    to_email = models.EmailField('받는 사람')
+    subject = models.CharField('제목', max_length=255)
+    body = models.TextField('본문')
+    html_body = models.TextField('HTML 본문', blank=True)
+    dedupe_key = models.CharField('중복 방지 키', max_length=100, blank=True)
+    sent_at = models.DateTimeField('발송일', null=True, blank=True)
+
+    objects = OutboundEmailManager()
+
+    max_attempts_setting = 'EMAIL_MAX_ATTEMPTS'
+
+    class Meta(QueuedJob.Meta):
+        verbose_name = '발송 메일'
+        verbose_name_plural = '발송 메일 목록'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['dedupe_key'],
+                condition=Q(status='pending') & ~Q(dedupe_key=''),
+                name='unique_pending_email_per_dedupe_key',
+            ),
+        ]
+
+    def __str__(self):
+        return f'{self.to_email} - {self.subject}'
+
+    def mark_failed(self, error):
+        if not self.dedupe_key:
+            return super().mark_failed(error)
+        try:
+            with transaction.atomic():
+                super().mark_failed(error)
+        except IntegrityError:
+            # 발송하는 사이 같은 키로 새 메일이 쌓였다면 그 메일이 최신 내용이므로 이 메일은 다시 보내지 않습니다
+            self.status = self.STATUS_FAILED
+            self.last_error = f'같은 키의 새 메일로 대체됨: {error}'
+            self.save(update_fields=['status', 'last_error', 'updated_at'])
+
+    def mark_sent(self):
+        self.status = self.STATUS_DONE
+        self.sent_at = timezone.now()
+        self.last_error = ''
+        self.save(update_fields=['status', 'sent_at', 'last_error', 'updated_at'])
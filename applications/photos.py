@@ -0,0 +1,263 @@
+import hashlib
+import logging
+import os
+import tempfile
+import time
+
+import pillow_heif
+from django.conf import settings
+from PIL import ExifTags, Image, ImageOps
+
+logger = logging.getLogger(__name__)
+
+# 워커가 저장하는 원본 증명사진 크기 (3:4 비율). 화면별 크기는 RENDITIONS에서 만듭니다.
+OUTPUT_SIZE = (600, 800)
+TARGET_RATIO = 3 / 4
+
+# 화면별 사진 크기. 처음 요청될 때 만들어져 디스크에 캐시됩니다.
+RENDITIONS = {
+    'thumbnail': {'size': (60, 80), 'quality': 80},   # 관리자 목록
+    'detail': {'size': (216, 288), 'quality': 85},    # 지원서 확인, 관리자 상세 (108x144 @2x)
+    'print': {'size': (600, 800), 'quality': 92},     # 인쇄용
+}
+RENDITION_FORMATS = {
+    'jpeg': ('JPEG', 'jpg', 'image/jpeg'),
+    'webp': ('WEBP', 'webp', 'image/webp'),
+    'avif': ('AVIF', 'avif', 'image/avif'),
+}
+RENDITION_ROOT = 'renditions'
+# Applicant.photo의 upload_to 앞부분. 원본 사진만 이 아래에 저장됩니다.
+PHOTO_UPLOAD_ROOT = 'applicant_photos/'
+HEIF_EXTENSIONS = ['.heic', '.heif']
+JPEG_EXTENSIONS = ['.jpg', '.jpeg']
+
+# 업로드 폼의 ImageField가 Pillow로 파일을 검사하므로 HEIC도 열 수 있게 등록합니다
+pillow_heif.register_heif_opener()
+
+
+def open_image(file_path):
+    _, file_ext = os.path.splitext(file_path)
+    if file_ext.lower() in HEIF_EXTENSIONS:
+        heif_file = pillow_heif.read_heif(file_path)
+        return Image.frombytes(
+            heif_file.mode,
+            heif_file.size,
+            heif_file.data,
+            "raw",
+        )
+    return Image.open(file_path)
+
+
+def apply_exif_orientation(img):
+    # EXIF 방향 정보 처리
+    try:
+        for orientation in ExifTags.TAGS.keys():
+            if ExifTags.TAGS[orientation] == 'Orientation':
+                break
+        exif = dict(img._getexif().items())
+
+        if orientation in exif:
+            if exif[orientation] == 2:
+                img = img.transpose(Image.FLIP_LEFT_RIGHT)
+            elif exif[orientation] == 3:
+                img = img.rotate(180)
+            elif exif[orientation] == 4:
+                img = img.transpose(Image.FLIP_TOP_BOTTOM)
+            elif exif[orientation] == 5:
+                img = img.transpose(Image.FLIP_LEFT_RIGHT).rotate(90)
+            elif exif[orientation] == 6:
+                img = img.rotate(270)
+            elif exif[orientation] == 7:
+                img = img.transpose(Image.FLIP_LEFT_RIGHT).rotate(270)
+            elif exif[orientation] == 8:
+                img = img.rotate(90)
+    except (AttributeError, KeyError, IndexError):
+        pass
+    return img
+
+
+def crop_to_ratio(img, target_ratio=TARGET_RATIO):
+    width, height = img.size
+    current_ratio = width / height
+
+    if current_ratio > target_ratio:  # 너무 넓은 경우
+        new_width = int(height * target_ratio)
+        left = (width - new_width) // 2
+        img = img.crop((left, 0, left + new_width, height))
+    elif current_ratio < target_ratio:  # 너무 높은 경우
+        new_height = int(width / target_ratio)
+        top = (height - new_height) // 2
+        img = img.crop((0, top, width, top + new_height))
+    return img
+
+
+def save_atomically(img, file_path, format, **options):
+    # 같은 디렉터리의 임시 파일에 쓴 뒤 교체하여, 읽는 쪽이 반쯤 쓰인 파일을 보지 않게 합니다
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(file_path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as tmp_file:
+            img.save(tmp_file, format, **options)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def derivative_name(storage, name):
+    file_name, file_ext = os.path.splitext(name)
+    if file_ext.lower() in JPEG_EXTENSIONS:
+        return name
+    return storage.get_available_name(file_name + '.jpg')
+
+
+def process_photo(field_file):
+    """
+    업로드된 원본을 3:4 비율, 600x800px JPEG로 변환합니다.
+
+    JPEG 원본은 제자리에서 교체하고, 그 외 형식은 새 .jpg 파일을 만듭니다.
+    변환된 파일의 저장소 이름을 반환하며 원본 삭제는 호출하는 쪽에서 합니다.
+    """
+    storage = field_file.storage
+    img = open_image(field_file.path)
+    img = apply_exif_orientation(img)
+    img = crop_to_ratio(img)
+    img = img.resize(OUTPUT_SIZE, Image.Resampling.LANCZOS)
+    if img.mode != 'RGB':
+        img = img.convert('RGB')
+
+    new_name = derivative_name(storage, field_file.name)
+    save_atomically(img, storage.path(new_name), 'JPEG', quality=85, optimize=True)
+    return new_name
+
+
+def file_digest(storage, name):
+    hasher = hashlib.sha256()
+    with storage.open(name, 'rb') as f:
+        for chunk in iter(lambda: f.read(64 * 1024), b''):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def rendition_format():
+    # PHOTO_RENDITION_FORMAT(webp/avif)을 Pillow가 저장할 수 없으면 JPEG로 대신합니다
+    preferred = getattr(settings, 'PHOTO_RENDITION_FORMAT', 'jpeg')
+    Image.init()
+    if preferred in RENDITION_FORMATS and RENDITION_FORMATS[preferred][0] in Image.SAVE:
+        return preferred
+    return 'jpeg'
+
+
+def rendition_filename(digest, rendition, format=None):
+    """
+    원본 사진 해시와 렌디션 설정으로 정해지는 파일 이름입니다.
+    내용이 바뀌면 이름도 바뀌므로 브라우저에 영구 캐시해도 안전합니다.
+    """
+    format = format or rendition_format()
+    spec = RENDITIONS[rendition]
+    key = hashlib.sha256(
+        f"{digest}:{spec['size'][0]}x{spec['size'][1]}:{spec['quality']}:{format}".encode()
+    ).hexdigest()[:20]
+    return f'{key}.{RENDITION_FORMATS[format][1]}'
+
+
+def format_for_filename(filename):
+    extension = filename.rsplit('.', 1)[-1]
+    for format, (_, format_extension, _) in RENDITION_FORMATS.items():
+        if format_extension == extension:
+            return format
+    return None
+
+
+def rendition_names(digest):
+    # 설정이 바뀌었을 수도 있으므로 모든 렌디션 크기와 형식의 이름을 돌려줍니다
+    return [
+        f'{RENDITION_ROOT}/{rendition}/{rendition_filename(digest, rendition, format)}'
+        for rendition in RENDITIONS
+        for format in RENDITION_FORMATS
+    ]
+
+
+def delete_photo(storage, name, keep_digest=''):
+    """
+    처리된 사진과 그 해시로 만든 렌디션을 지웁니다. 해시가 keep_digest와 같으면 렌디션은 남깁니다.
+    같은 사진을 쓰는 다른 지원자의 렌디션이 지워지더라도 다음 요청에서 다시 만들어집니다.
+    """
+    if not name or not storage.exists(name):
+        return
+    digest = file_digest(storage, name)
+    if digest != keep_digest:
+        for rendition_name in rendition_names(digest):
+            storage.delete(rendition_name)
+    storage.delete(name)
+
+
+def ensure_rendition(field_file, rendition, filename):
+    # 렌디션이 디스크에 없으면 원본에서 만들어 저장하고, 저장소 이름을 반환합니다
+    storage = field_file.storage
+    name = f'{RENDITION_ROOT}/{rendition}/{filename}'
+    if storage.exists(name):
+        return name
+
+    format = format_for_filename(filename)
+    spec = RENDITIONS[rendition]
+    with storage.open(field_file.name, 'rb') as f:
+        img = Image.open(f)
+        img = ImageOps.fit(img.convert('RGB'), spec['size'], Image.Resampling.LANCZOS)
+
+    path = storage.path(name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    save_atomically(img, path, RENDITION_FORMATS[format][0], quality=spec['quality'])
+    return name
+
+
+def run_photo_job(job):
+    from .models import Applicant
+
+    applicant = Applicant.objects.only('id', 'photo').get(pk=job.applicant_id)
+    if applicant.photo.name != job.photo:
+        # 처리하기 전에 다른 사진이 업로드되어 이 작업은 더 이상 필요 없습니다
+        job.mark_done()
+        return
+
+    storage = applicant.photo.storage
+    started = time.perf_counter()
+    try:
+        new_name = process_photo(applicant.photo)
+    except Exception as e:
+        logger.warning('사진 처리 실패 (applicant=%s, attempt=%s): %s', job.applicant_id, job.attempts, e)
+        job.mark_failed(f'이미지 처리 중 오류가 발생했습니다: {e}')
+        if job.status == job.STATUS_FAILED:
+            # 재시도 횟수를 모두 쓰면 원본을 지우고 실패 상태로 남깁니다
+            if Applicant.objects.filter(pk=job.applicant_id, photo=job.photo).update(photo='', photo_status=Applicant.PHOTO_FAILED):
+                storage.delete(job.photo)
+                delete_photo(storage, job.previous_photo)
+        return
+
+    logger.info('사진 처리 완료 (applicant=%s): %.0fms', job.applicant_id, (time.perf_counter() - started) * 1000)
+
+    digest = file_digest(storage, new_name)
+    updated = Applicant.objects.filter(pk=job.applicant_id, photo=job.photo).update(
+        photo=new_name, photo_status=Applicant.PHOTO_READY, photo_digest=digest
+    )
+    if new_name != job.photo:
+        # 교체에 성공하면 원본을, 그 사이 사진이 바뀌었다면 방금 만든 파일을 지웁니다
+        storage.delete(job.photo if updated else new_name)
+    if updated and job.previous_photo != new_name:
+        # 새 사진이 저장된 뒤에 이전 사진과 그 렌디션을 지웁니다
+        delete_photo(storage, job.previous_photo, keep_digest=digest)
+    job.mark_done()
+
+
+def process_pending_photos(limit=10):
+    from .models import Applicant, PhotoJob
+
+    jobs = PhotoJob.objects.claim(limit)
+    if jobs:
+        Applicant.objects.filter(
+            pk__in=[job.applicant_id for job in jobs],
+            photo_status=Applicant.PHOTO_PENDING,
+        ).update(photo_status=Applicant.PHOTO_PROCESSING)
+    for job in jobs:
+        run_photo_job(job)
+    return len(jobs)
@@ -0,0 +1,85 @@
+import hashlib
+import threading
+from collections import namedtuple
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .forms import DynamicAnswerForm
+from .models import Question
+
+CACHE_KEY = 'applications:questions:{}'
+
+QuestionSpec = namedtuple('QuestionSpec', ['id', 'field_name', 'label', 'max_length', 'required'])
+
+
+class QuestionSchema:
+    """
+    모집 기수 하나의 질문 목록을 폼 필드를 만드는 데 필요한 값만 남겨 보관합니다.
+
+    version은 질문 내용으로 계산하므로 질문이 바뀌면 함께 바뀌고,
+    같은 질문 목록이면 어느 프로세스에서 만들어도 같은 값입니다.
+    """
+
+    def __init__(self, recruitment_id, specs):
+        self.recruitment_id = recruitment_id
+        self.specs = tuple(specs)
+        self.version = hashlib.sha1(repr(self.specs).encode()).hexdigest()[:12]
+        self.max_lengths = {spec.id: spec.max_length for spec in self.specs}
+
+    def __len__(self):
+        return len(self.specs)
+
+
+class QuestionSchemaRegistry:
+    """
+    질문 목록은 Django 캐시에, 버전별 답변 폼 클래스는 프로세스 메모리에 보관합니다.
+
+    Question 저장/삭제가 커밋되면 시그널이 캐시를 지우고 다음 요청이 새 버전을 만들며,
+    다른 프로세스도 공유 캐시에서 새 버전을 읽어 해당 폼 클래스를 한 번만 만듭니다.
+    queryset.update()나 bulk_create()는 시그널을 보내지 않으므로 커밋 후 invalidate()를 직접 불러야 하고,
+    놓치더라도 QUESTION_SCHEMA_CACHE_TIMEOUT(기본 5분)이 지나면 DB에서 다시 읽습니다.
+    """
+
+    # 버전이 바뀌어도 옛 폼 클래스가 쌓이지 않도록 이 개수를 넘으면 비웁니다
+    MAX_FORM_CLASSES = 32
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._form_classes = {}
+
+    @property
+    def timeout(self):
+        return getattr(settings, 'QUESTION_SCHEMA_CACHE_TIMEOUT', 300)
+
+    def _load(self, recruitment_id):
+        rows = Question.objects.filter(recruitment_settings_id=recruitment_id).order_by('order', 'pk').values_list(
+            'id', 'question_text', 'max_length', 'is_required'
+        )
+        return QuestionSchema(recruitment_id, [
+            QuestionSpec(question_id, f'question_{question_id}', text, max_length, required)
+            for question_id, text, max_length, required in rows
+        ])
+
+    def get(self, recruitment_id):
+        key = CACHE_KEY.format(recruitment_id)
+        schema = cache.get(key)
+        if schema is None:
+            schema = self._load(recruitment_id)
+            cache.set(key, schema, self.timeout)
+        return schema
+
+    def form_class(self, schema):
+        form_class = self._form_classes.get(schema.version)
+        if form_class is None:
+            with self._lock:
+                if len(self._form_classes) >= self.MAX_FORM_CLASSES:
+                    self._form_classes.clear()
+                form_class = self._form_classes.setdefault(schema.version, DynamicAnswerForm.for_schema(schema))
+        return form_class
+
+    def invalidate(self, recruitment_id):
+        cache.delete(CACHE_KEY.format(recruitment_id))
+
+
+question_schemas = QuestionSchemaRegistry()
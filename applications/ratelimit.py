@@ -0,0 +1,115 @@
+import math
+import re
+import time
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse, JsonResponse
+
+CACHE_PREFIX = 'ratelimit'
+PERIOD_UNITS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+RULE_RE = re.compile(r'^(?P<key>\w+):(?P<capacity>\d+)/(?P<count>\d*)(?P<unit>[smhd])$')
+
+
+def parse_rule(rule):
+    """
+    'ip:5/10m'처럼 적은 규칙을 (키 종류, 용량, 기간(초))로 바꿉니다.
+    용량만큼 연속 요청을 허용하고, 그 뒤로는 기간/용량마다 한 번씩 다시 허용됩니다.
+    """
+    match = RULE_RE.match(rule)
+    if not match:
+        raise ValueError(f'잘못된 요청 제한 규칙입니다: {rule}')
+    period = int(match['count'] or 1) * PERIOD_UNITS[match['unit']]
+    return match['key'], int(match['capacity']), period
+
+
+def client_ip(request):
+    if getattr(settings, 'RATE_LIMIT_TRUST_X_FORWARDED_FOR', False):
+        forwarded = request.META.get('HTTP_X_FORWARDED_FOR')
+        if forwarded:
+            return forwarded.split(',')[0].strip()
+    return request.META.get('REMOTE_ADDR', '')
+
+
+def rate_limit_key(request, key):
+    if key == 'ip':
+        return client_ip(request)
+    if key == 'user':
+        # request.user를 읽으면 세션을 조회하므로 로그인 상태를 확인하는 뷰에서만 씁니다
+        user = getattr(request, 'user', None)
+        return str(user.pk) if user is not None and user.is_authenticated else None
+    if key == 'email':
+        email = request.POST.get('email') or request.POST.get('username')
+        return email.strip().lower() if email else None
+    raise ValueError(f'알 수 없는 요청 제한 키입니다: {key}')
+
+
+def consume(bucket, capacity, period, now=None):
+    """
+    토큰 버킷에서 토큰 하나를 꺼냅니다. 허용되면 0을, 아니면 다시 시도할 수 있을 때까지의 초를 돌려줍니다.
+
+    캐시의 get/set 사이에 다른 요청이 끼어들면 한두 번 더 허용될 수 있습니다.
+    정확한 카운터보다 캐시 한 번 왕복으로 끝나는 쪽을 택했습니다.
+    버킷은 모든 워커가 같이 쓰는 캐시에 있어야 하며, 워커마다 따로인 캐시면 한도가 워커 수만큼 늘어납니다.
+    그래서 배포 검사(applications.E001)와 gunicorn 시작 단계에서 그런 캐시를 거부합니다.
+    """
+    now = time.time() if now is None else now
+    key = f'{CACHE_PREFIX}:{bucket}'
+    rate = capacity / period
+    tokens, updated = cache.get(key, (capacity, now))
+    tokens = min(capacity, tokens + (now - updated) * rate)
+    if tokens < 1:
+        return math.ceil((1 - tokens) / rate)
+    cache.set(key, (tokens - 1, now), timeout=math.ceil(period))
+    return 0
+
+
+def check_rate_limits(request, name, rules):
+    # 모든 규칙을 확인하고 가장 오래 기다려야 하는 시간을 돌려줍니다 (0이면 허용)
+    retry_after = 0
+    for rule in rules:
+        key, capacity, period = parse_rule(rule)
+        value = rate_limit_key(request, key)
+        if value is None:
+            continue
+        retry_after = max(retry_after, consume(f'{name}:{key}:{value}', capacity, period))
+    return retry_after
+
+
+def rate_limited_response(request, retry_after):
+    message = f'요청이 너무 많습니다. {retry_after}초 후에 다시 시도해주세요.'
+    if request.headers.get('x-requested-with') == 'XMLHttpRequest' or 'application/json' in request.headers.get('accept', ''):
+        response = JsonResponse({'status': 'error', 'message': message, 'retry_after': retry_after}, status=429)
+    else:
+        response = HttpResponse(message, status=429, content_type='text/plain; charset=utf-8')
+    response['Retry-After'] = str(retry_after)
+    return response
+
+
+def rate_limit(name, rules, methods=('POST',)):
+    """
+    뷰에 요청 제한을 거는 데코레이터입니다. rules는 'ip:5/10m' 같은 규칙 목록이고,
+    methods에 해당하는 요청만 셉니다. 한도를 넘으면 뷰를 실행하지 않고 429를 돌려줍니다.
+    """
+    def decorator(view_func):
+        if iscoroutinefunction(view_func):
+            @wraps(view_func)
+            async def _wrapper_view(request, *args, **kwargs):
+                if request.method in methods:
+                    retry_after = await sync_to_async(check_rate_limits)(request, name, rules)
+                    if retry_after:
+                        return rate_limited_response(request, retry_after)
+                return await view_func(request, *args, **kwargs)
+        else:
+            @wraps(view_func)
+            def _wrapper_view(request, *args, **kwargs):
+                if request.method in methods:
+                    retry_after = check_rate_limits(request, name, rules)
+                    if retry_after:
+                        return rate_limited_response(request, retry_after)
+                return view_func(request, *args, **kwargs)
+        return _wrapper_view
+    return decorator
+
@@ -0,0 +1,97 @@
+import threading
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from .models import RecruitmentSettings
+
+CACHE_KEY = 'applications:recruitment:active'
+
+
+class RecruitmentRegistry:
+    """
+    활성화된 모집 설정을 프로세스 로컬 메모리와 Django 캐시 두 단계로 보관합니다.
+
+    캐시는 가장 가까운 지원 시작/마감 시각에 맞춰 만료되며,
+    RecruitmentSettings 저장/삭제가 커밋되면 시그널로 무효화됩니다. 다른 프로세스의
+    로컬 사본은 RECRUITMENT_LOCAL_CACHE_TIMEOUT(초)이 지나면 공유 캐시에서 다시 읽으므로
+    Django 캐시는 모든 워커가 같이 쓰는 캐시(Redis 또는 DB 캐시)여야 합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._recruitments = None
+        self._expires_at = None
+
+    @property
+    def shared_timeout(self):
+        return getattr(settings, 'RECRUITMENT_CACHE_TIMEOUT', 300)
+
+    @property
+    def local_timeout(self):
+        return getattr(settings, 'RECRUITMENT_LOCAL_CACHE_TIMEOUT', 5)
+
+    def _next_boundary(self, recruitments, now):
+        boundaries = [
+            boundary
+            for recruitment in recruitments
+            for boundary in (recruitment.application_start_date, recruitment.application_end_date)
+            if boundary > now
+        ]
+        return min(boundaries) if boundaries else None
+
+    def _load(self, now):
+        recruitments = cache.get(CACHE_KEY)
+        if recruitments is None:
+            recruitments = list(RecruitmentSettings.objects.filter(is_active=True).order_by('pk'))
+            boundary = self._next_boundary(recruitments, now)
+            timeout = self.shared_timeout
+            if boundary is not None:
+                timeout = min(timeout, max(int((boundary - now).total_seconds()), 1))
+            cache.set(CACHE_KEY, recruitments, timeout)
+
+        expires_at = now + timedelta(seconds=self.local_timeout)
+        boundary = self._next_boundary(recruitments, now)
+        if boundary is not None:
+            expires_at = min(expires_at, boundary)
+        return recruitments, expires_at
+
+    def _get_recruitments(self, now):
+        recruitments, expires_at = self._recruitments, self._expires_at
+        if recruitments is not None and now < expires_at:
+            return recruitments
+
+        with self._lock:
+            if self._recruitments is None or now >= self._expires_at:
+                self._recruitments, self._expires_at = self._load(now)
+            return self._recruitments
+
+    def get_current(self):
+        # 지원 기간과 관계없이 활성화된 모집 설정
+        recruitments = self._get_recruitments(timezone.now())
+        return recruitments[0] if recruitments else None
+
+    def get_active(self):
+        # 현재 지원 기간 안에 있는 모집 설정
+        now = timezone.now()
+        for recruitment in self._get_recruitments(now):
+            if recruitment.application_start_date <= now <= recruitment.application_end_date:
+                return recruitment
+        return None
+
+    def has_active(self):
+        return self.get_current() is not None
+
+    def is_open(self, recruitment):
+        return recruitment.application_start_date <= timezone.now() <= recruitment.application_end_date
+
+    def invalidate(self):
+        with self._lock:
+            self._recruitments = None
+            self._expires_at = None
+        cache.delete(CACHE_KEY)
+
+
+registry = RecruitmentRegistry()
@@ -0,0 +1,171 @@
+from collections import Counter, defaultdict, deque, namedtuple
+from datetime import datetime, time, timedelta
+
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Application
+
+# 지원서의 면접 희망 시간 필드별 요일(월=0)과 시간대
+PERIODS = {
+    'interview_sat_morning': (5, time(10, 0), time(12, 0)),
+    'interview_sat_afternoon': (5, time(14, 0), time(17, 0)),
+    'interview_sun_morning': (6, time(10, 0), time(12, 0)),
+    'interview_sun_afternoon': (6, time(14, 0), time(17, 0)),
+}
+PERIOD_FIELDS = list(PERIODS)
+
+Slot = namedtuple('Slot', ['date', 'start_time', 'end_time', 'period'])
+
+
+class ScheduleResult:
+    def __init__(self, assigned, unplaced, capacity):
+        self.assigned = assigned
+        self.unplaced = unplaced
+        self.capacity = capacity
+
+
+def preference_mask(application):
+    mask = 0
+    for bit, field in enumerate(PERIOD_FIELDS):
+        if getattr(application, field):
+            mask |= 1 << bit
+    return mask
+
+
+def build_slots(recruitment, slot_minutes):
+    """
+    모집 설정의 면접 기간 안에 있는 주말 시간대를 slot_minutes 단위로 나눕니다.
+    첫날과 마지막 날은 면접 시작/종료 시각 밖의 슬롯을 제외합니다.
+    """
+    window_start = timezone.localtime(recruitment.interview_start_date)
+    window_end = timezone.localtime(recruitment.interview_end_date)
+    length = timedelta(minutes=slot_minutes)
+    tz = window_start.tzinfo
+
+    slots = []
+    day = window_start.date()
+    while day <= window_end.date():
+        for period, (weekday, period_start, period_end) in PERIODS.items():
+            if day.weekday() != weekday:
+                continue
+            start = datetime.combine(day, period_start, tzinfo=tz)
+            end = datetime.combine(day, period_end, tzinfo=tz)
+            while start + length <= end:
+                if window_start <= start and start + length <= window_end:
+                    slots.append(Slot(day, start.time(), (start + length).time(), period))
+                start += length
+        day += timedelta(days=1)
+    return slots
+
+
+def max_flow(capacity, source, sink):
+    # Edmonds-Karp. 노드 수가 (희망 시간 조합 16개 + 시간대 블록 수) 정도로 작아 충분히 빠릅니다.
+    flow = defaultdict(int)
+    neighbors = defaultdict(set)
+    for u, v in capacity:
+        neighbors[u].add(v)
+        neighbors[v].add(u)
+
+    while True:
+        parent = {source: None}
+        queue = deque([source])
+        while queue and sink not in parent:
+            u = queue.popleft()
+            for v in neighbors[u]:
+                if v not in parent and capacity.get((u, v), 0) - flow[(u, v)] > 0:
+                    parent[v] = u
+                    queue.append(v)
+        if sink not in parent:
+            return flow
+
+        path, v = [], sink
+        while parent[v] is not None:
+            path.append((parent[v], v))
+            v = parent[v]
+        augment = min(capacity.get(edge, 0) - flow[edge] for edge in path)
+        for u, v in path:
+            flow[(u, v)] += augment
+            flow[(v, u)] -= augment
+
+
+def schedule_interviews(recruitment, slot_minutes=30, rooms=('면접실',), per_room=1, commit=True):
+    """
+    서류 합격자(document_passed) 중 면접 일정이 없는 지원자를 희망 시간대의 슬롯에 배정합니다.
+
+    같은 희망 시간 조합을 가진 지원자를 한 그룹으로 묶고, 그룹 → 시간대 블록(날짜, 시간대)
+    → 배정 가능 인원으로 이어지는 그래프의 최대 유량을 구해 배정 인원을 최대화합니다.
+    이미 일정이 잡힌 지원서가 차지한 자리는 비워 둡니다.
+    """
+    seats_per_slot = len(rooms) * per_room
+    slots = build_slots(recruitment, slot_minutes)
+
+    # 슬롯별로 남은 (방, 자리) 목록
+    occupied = Counter(
+        Application.objects.filter(
+            recruitment_settings=recruitment,
+            interview_date__isnull=False,
+        ).exclude(
+            status__in=['draft', 'submitted', 'document_screening', 'document_failed']
+        ).values_list('interview_date', 'interview_start_time', 'interview_location')
+    )
+    free_seats = {}
+    for slot in slots:
+        free_seats[slot] = deque(
+            room
+            for room in rooms
+            for _ in range(per_room - occupied[(slot.date, slot.start_time, room)])
+        )
+
+    blocks = defaultdict(list)
+    for slot in slots:
+        blocks[(slot.date, slot.period)].append(slot)
+
+    applications = list(
+        Application.objects.filter(
+            recruitment_settings=recruitment,
+            status='document_passed',
+            interview_date__isnull=True,
+        ).order_by('submitted_at', 'pk').only('pk', 'submitted_at', *PERIOD_FIELDS)
+    )
+    groups = defaultdict(list)
+    for application in applications:
+        groups[preference_mask(application)].append(application)
+
+    source, sink = 'source', 'sink'
+    capacity = {}
+    for mask, members in groups.items():
+        capacity[(source, ('group', mask))] = len(members)
+        for block in blocks:
+            if mask & (1 << PERIOD_FIELDS.index(block[1])):
+                capacity[(('group', mask), ('block', block))] = len(members)
+    for block, block_slots in blocks.items():
+        capacity[(('block', block), sink)] = sum(len(free_seats[slot]) for slot in block_slots)
+    flow = max_flow(capacity, source, sink)
+
+    now = timezone.now()
+    assigned, unplaced = [], []
+    for mask, members in groups.items():
+        members = deque(members)
+        for block, block_slots in sorted(blocks.items()):
+            count = flow.get((('group', mask), ('block', block)), 0)
+            for slot in block_slots:
+                while count and free_seats[slot] and members:
+                    application = members.popleft()
+                    application.interview_date = slot.date
+                    application.interview_start_time = slot.start_time
+                    application.interview_end_time = slot.end_time
+                    application.interview_location = free_seats[slot].popleft()
+                    application.updated_at = now
+                    assigned.append(application)
+                    count -= 1
+        unplaced.extend(members)
+
+    if commit and assigned:
+        with transaction.atomic():
+            Application.objects.bulk_update(
+                assigned,
+                ['interview_date', 'interview_start_time', 'interview_end_time', 'interview_location', 'updated_at'],
+                batch_size=500,
+            )
+    return ScheduleResult(assigned, unplaced, len(slots) * seats_per_slot)
@@ -0,0 +1,142 @@
+import re
+import unicodedata
+from functools import partial
+
+from django.conf import settings
+from django.db import OperationalError, connection, transaction
+from django.db.models import Case, F, When
+from django.utils import timezone
+
+from .models import Application, SearchDocument
+
+# SQLite에서는 FTS5 가상 테이블, PostgreSQL에서는 GIN 인덱스를 씁니다 (마이그레이션 0012 참고)
+FTS_TABLE = 'applications_searchdocument_fts'
+WORD_RE = re.compile(r'\w+')
+MAX_RESULTS = 500
+
+
+def ngram_tokens(text, n=2):
+    """
+    한국어는 형태소 분석 없이도 부분 일치가 되도록 글자 n-gram으로 색인합니다.
+    '피로그래밍' → '피로 로그 그래 래밍', 한 글자 단어는 그대로 둡니다.
+    """
+    tokens = []
+    for word in WORD_RE.findall(unicodedata.normalize('NFKC', text or '').lower()):
+        word = word.replace('_', '')
+        if len(word) <= n:
+            if word:
+                tokens.append(word)
+            continue
+        tokens.extend(word[i:i + n] for i in range(len(word) - n + 1))
+    return tokens
+
+
+def document_content(application):
+    applicant = application.applicant
+    parts = [applicant.name, applicant.email, applicant.phone_number or '', applicant.university, applicant.major]
+    parts.extend(answer.answer_text for answer in application.answer_set.all())
+    return ' '.join(ngram_tokens(' '.join(parts)))
+
+
+def mark_stale(application_id):
+    # 검색 문서를 다시 만들어야 한다고 표시만 합니다. 실제 색인은 index_applications 워커가 합니다.
+    now = timezone.now()
+    if SearchDocument.objects.filter(application_id=application_id).update(stale_at=now):
+        return
+    if Application.objects.filter(pk=application_id).exists():
+        SearchDocument.objects.bulk_create(
+            [SearchDocument(application_id=application_id, stale_at=now)], ignore_conflicts=True
+        )
+
+
+def schedule_index(application_id):
+    # 자동 저장마다 답변 전체를 다시 읽어 색인하지 않도록, 커밋 후 표시만 하고 워커가 모아서 색인합니다
+    transaction.on_commit(partial(mark_stale, application_id))
+
+
+def index_stale_applications(limit=100, delay=None):
+    """
+    표시된 지 delay초(SEARCH_INDEX_DELAY)가 지난 검색 문서를 최대 limit개 다시 만들고 그 수를 반환합니다.
+    자동 저장이 이어지는 동안에는 표시 시각이 계속 뒤로 밀리므로 작성을 멈춘 뒤 한 번만 색인합니다.
+    색인하는 사이 다시 표시된 문서는 표시를 남겨 두어 다음 차례에 다시 색인합니다.
+    """
+    if delay is None:
+        delay = getattr(settings, 'SEARCH_INDEX_DELAY', 5)
+    stale = dict(
+        SearchDocument.objects.filter(stale_at__lte=timezone.now() - timezone.timedelta(seconds=delay))
+        .order_by('stale_at')
+        .values_list('application_id', 'stale_at')[:limit]
+    )
+    if not stale:
+        return 0
+    applications = (
+        Application.objects.select_related('applicant')
+        .prefetch_related('answer_set')
+        .filter(pk__in=stale)
+    )
+    for application in applications:
+        stale_at = stale[application.pk]
+        SearchDocument.objects.filter(application_id=application.pk).update(
+            content=document_content(application),
+            stale_at=Case(When(stale_at=stale_at, then=None), default=F('stale_at')),
+            updated_at=timezone.now(),
+        )
+    return len(stale)
+
+
+def rebuild_index(chunk_size=500):
+    count = 0
+    applications = Application.objects.select_related('applicant').prefetch_related('answer_set').order_by('pk')
+    for start in range(0, applications.count(), chunk_size):
+        documents = [
+            SearchDocument(application=application, content=document_content(application))
+            for application in applications[start:start + chunk_size]
+        ]
+        SearchDocument.objects.bulk_create(
+            documents,
+            update_conflicts=True,
+            unique_fields=['application'],
+            update_fields=['content', 'updated_at'],
+        )
+        count += len(documents)
+    return count
+
+
+def search_applications(query, limit=MAX_RESULTS):
+    """
+    검색어와 일치하는 지원서를 관련도 순으로 [(application_id, score), ...] 형태로 최대 limit개 반환합니다.
+    검색어의 모든 n-gram을 포함한 문서만 일치로 보며, 한 글자 검색어는 접두어로 찾습니다.
+    결과가 잘렸는지 알아야 하면 limit보다 하나 더 요청해 비교합니다.
+    """
+    tokens = list(dict.fromkeys(ngram_tokens(query)))
+    if not tokens:
+        return []
+
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            cursor.execute(
+                "SELECT application_id, ts_rank(to_tsvector('simple', content), query) AS score "
+                "FROM applications_searchdocument, to_tsquery('simple', %s) query "
+                "WHERE to_tsvector('simple', content) @@ query "
+                "ORDER BY score DESC LIMIT %s",
+                [' & '.join(token + (':*' if len(token) == 1 else '') for token in tokens), limit],
+            )
+            return cursor.fetchall()
+        if connection.vendor == 'sqlite':
+            try:
+                cursor.execute(
+                    f"SELECT d.application_id, -bm25({FTS_TABLE}) AS score "
+                    f"FROM {FTS_TABLE} JOIN applications_searchdocument d ON d.id = {FTS_TABLE}.rowid "
+                    f"WHERE {FTS_TABLE} MATCH %s ORDER BY score DESC LIMIT %s",
+                    [' AND '.join(f'"{token}"' + ('*' if len(token) == 1 else '') for token in tokens), limit],
+                )
+                return cursor.fetchall()
+            except OperationalError:
+                # FTS5 없이 빌드된 SQLite
+                pass
+
+    # 전문 검색을 쓸 수 없는 DB에서는 n-gram 문자열 포함 여부로 대신합니다
+    documents = SearchDocument.objects.all()
+    for token in tokens:
+        documents = documents.filter(content__contains=token)
+    return [(application_id, 0) for application_id in documents.values_list('application_id', flat=True)[:limit]]
@@ -0,0 +1,67 @@
+from functools import partial
+
+from django.core.cache import cache
+from django.core.cache.utils import make_template_fragment_key
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .auth import invalidate_user_cache
+from .models import Answer, Applicant, Application, Question, RecruitmentSettings
+from .questions import question_schemas
+from .recruitment import registry
+from .search import schedule_index
+
+
+@receiver([post_save, post_delete], sender=RecruitmentSettings)
+def invalidate_recruitment_registry(sender, **kwargs):
+    # 커밋 전에 지우면 다른 요청이 아직 커밋되지 않은 옛 값을 다시 캐시할 수 있습니다
+    transaction.on_commit(registry.invalidate)
+
+
+@receiver([post_save, post_delete], sender=Question)
+def invalidate_question_schema(sender, instance, **kwargs):
+    transaction.on_commit(partial(question_schemas.invalidate, instance.recruitment_settings_id))
+
+
+@receiver([post_save, post_delete], sender=Answer)
+def index_answer_application(sender, instance, **kwargs):
+    schedule_index(instance.application_id)
+
+
+@receiver([post_save, post_delete], sender=Answer)
+def invalidate_answers_fragment(sender, instance, **kwargs):
+    # 자동 저장/제출은 지원서 버전이 바뀌어 새 캐시 키를 쓰고, 관리자 화면에서 답변을 고친 경우만 여기서 지웁니다
+    row = Application.objects.filter(pk=instance.application_id).values_list(
+        'version', 'recruitment_settings_id', 'applicant__updated_at'
+    ).first()
+    if row is not None:
+        version, recruitment_id, applicant_updated_at = row
+        question_version = question_schemas.get(recruitment_id).version
+        cache.delete(make_template_fragment_key(
+            'application_answers', [instance.application_id, version, question_version, applicant_updated_at]
+        ))
+
+
+@receiver(post_save, sender=Application)
+def index_new_application(sender, instance, created, **kwargs):
+    if created:
+        schedule_index(instance.pk)
+
+
+@receiver([post_save, post_delete], sender=Applicant)
+def invalidate_cached_user(sender, instance, **kwargs):
+    # 커밋 전에 지우면 다른 요청이 옛 값을 다시 캐시할 수 있으므로 커밋 후에 지웁니다
+    transaction.on_commit(partial(invalidate_user_cache, instance.pk))
+
+
+SEARCHABLE_APPLICANT_FIELDS = {'name', 'email', 'phone_number', 'university', 'major'}
+
+
+@receiver(post_save, sender=Applicant)
+def index_applicant_applications(sender, instance, created, update_fields=None, **kwargs):
+    # 인증 코드 발급처럼 검색 대상이 아닌 필드만 바뀐 저장은 건너뜁니다
+    if created or (update_fields is not None and not SEARCHABLE_APPLICANT_FIELDS & set(update_fields)):
+        return
+    for application_id in instance.applications.values_list('pk', flat=True):
+        schedule_index(application_id)
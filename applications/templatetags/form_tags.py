@@ -5,6 +5,8 @@ register = template.Library()
 @register.filter(name='addclass')
 def addclass(value, arg):
     css_classes = value.field.widget.attrs.get('class', '').split()
-    if arg not in css_classes:
-        css_classes.append(arg)
-    return value.as_widget(attrs={'class': ' '.join(css_classes)}) 
\ No newline at end of file
+    if arg in css_classes:
+        # 이미 있는 클래스면 속성을 다시 합치지 않고 위젯을 그대로 그립니다
+        return value
+    css_classes.append(arg)
+    return value.as_widget(attrs={'class': ' '.join(css_classes)})
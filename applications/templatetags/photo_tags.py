@@ -0,0 +1,8 @@
+from django import template
+
+register = template.Library()
+
+@register.simple_tag
+def photo_url(applicant, rendition='detail'):
+    # 처리가 끝나지 않은 사진이면 빈 문자열을 반환합니다
+    return applicant.get_photo_rendition_url(rendition)
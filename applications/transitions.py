@@ -0,0 +1,105 @@
+from django.db import transaction
+from django.template.loader import get_template
+from django.utils import timezone
+
+from .models import Application, OutboundEmail, StatusChange
+
+# 상태별로 옮겨갈 수 있는 다음 상태
+ALLOWED_TRANSITIONS = {
+    'draft': ['submitted'],
+    'submitted': ['document_screening', 'document_passed', 'document_failed'],
+    'document_screening': ['document_passed', 'document_failed'],
+    'document_passed': ['interview_scheduled'],
+    'interview_scheduled': ['interview_completed', 'final_passed', 'final_failed'],
+    'interview_completed': ['final_passed', 'final_failed'],
+}
+
+# 지원자에게 결과 메일을 보내는 상태와 메일 제목
+NOTIFY_SUBJECTS = {
+    'document_passed': '[피로그래밍] 서류 전형 결과 안내',
+    'document_failed': '[피로그래밍] 서류 전형 결과 안내',
+    'interview_scheduled': '[피로그래밍] 면접 일정 안내',
+    'final_passed': '[피로그래밍] 최종 결과 안내',
+    'final_failed': '[피로그래밍] 최종 결과 안내',
+}
+
+CHUNK_SIZE = 500
+
+
+class TransitionError(ValueError):
+    pass
+
+
+def allowed_sources(to_status):
+    return [status for status, targets in ALLOWED_TRANSITIONS.items() if to_status in targets]
+
+
+def transition_applications(queryset, to_status, changed_by=None, notify=True):
+    """
+    queryset의 지원서 중 to_status로 옮길 수 있는 지원서만 상태를 바꿉니다.
+
+    허용되지 않은 전이는 건너뛰고, 바뀐 지원서마다 StatusChange 기록을 남기며,
+    결과 안내 대상 상태라면 메일을 한 번에 대기열에 넣습니다.
+    (변경된 수, 건너뛴 수)를 반환합니다.
+    """
+    if to_status not in dict(Application.STATUS_CHOICES):
+        raise TransitionError(f'알 수 없는 상태입니다: {to_status}')
+    sources = allowed_sources(to_status)
+
+    with transaction.atomic():
+        total = queryset.count()
+        rows = list(
+            queryset.filter(status__in=sources)
+            .select_for_update()
+            .order_by('pk')
+            .values_list('pk', 'status')
+        )
+        now = timezone.now()
+        changed = []
+        for start in range(0, len(rows), CHUNK_SIZE):
+            chunk = rows[start:start + CHUNK_SIZE]
+            for from_status in {status for _, status in chunk}:
+                ids = [pk for pk, status in chunk if status == from_status]
+                Application.objects.filter(pk__in=ids, status=from_status).update(status=to_status, updated_at=now)
+                changed.extend((pk, from_status) for pk in ids)
+
+        StatusChange.objects.bulk_create(
+            [
+                StatusChange(application_id=pk, from_status=from_status, to_status=to_status, changed_by=changed_by)
+                for pk, from_status in changed
+            ],
+            batch_size=CHUNK_SIZE,
+        )
+        if notify and to_status in NOTIFY_SUBJECTS:
+            queue_result_emails([pk for pk, _ in changed], to_status)
+
+    return len(changed), total - len(changed)
+
+
+def queue_result_emails(application_ids, status):
+    # 템플릿은 한 번만 불러오고, 메일은 bulk_create로 한꺼번에 쌓습니다
+    template = get_template('applications/email/result.html')
+    subject = NOTIFY_SUBJECTS[status]
+    emails = []
+    for start in range(0, len(application_ids), CHUNK_SIZE):
+        applications = (
+            Application.objects.filter(pk__in=application_ids[start:start + CHUNK_SIZE])
+            .select_related('applicant', 'recruitment_settings')
+            .only(
+                'id', 'status', 'interview_date', 'interview_start_time', 'interview_end_time',
+                'interview_location', 'applicant__id', 'applicant__name', 'applicant__email',
+                'recruitment_settings__title',
+            )
+        )
+        for application in applications:
+            message = template.render({'application': application, 'applicant': application.applicant, 'status': status})
+            emails.append(OutboundEmail(
+                applicant=application.applicant,
+                to_email=application.applicant.email,
+                subject=subject,
+                body=message,
+                html_body=message,
+                dedupe_key=f'result:{application.pk}:{status}',
+            ))
+    OutboundEmail.objects.bulk_create(emails, batch_size=CHUNK_SIZE, ignore_conflicts=True)
+    return len(emails)
@@ -12,7 +12,10 @@ urlpatterns = [
     path('applications/', views.application_list, name='application_list'),
     path('applications/<int:application_id>/', views.view_application, name='view_application'),
     path('answer-questions/', views.answer_questions, name='answer_questions'),
+    path('answer-questions/autosave/', views.autosave_answers, name='autosave_answers'),
     path('application-complete/', views.application_complete, name='application_complete'),
+    path('photos/<int:applicant_id>/<slug:rendition>/<str:filename>', views.photo_rendition, name='photo_rendition'),
+    path('metrics/', views.request_metrics, name='request_metrics'),
     
     # 이메일/비밀번호 찾기
     path('find-email/', views.find_email, name='find_email'),
@@ -1,28 +1,79 @@
+import hashlib
+import json
+import posixpath
+from functools import wraps
+
+from asgiref.sync import sync_to_async
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib import messages
 from django.contrib.auth import login
+from django.contrib.admin.views.decorators import staff_member_required
 from django.contrib.auth.decorators import login_required
-from django.core.mail import send_mail
+from django.contrib.auth.views import redirect_to_login
 from django.template.loader import render_to_string
 from django.utils import timezone
 from django.urls import reverse
 from django.conf import settings
-from django.http import JsonResponse, HttpResponseForbidden
-from django.views.decorators.http import require_http_methods
+from django.http import JsonResponse, HttpResponse, HttpResponseForbidden, HttpResponseNotModified, Http404
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition, require_http_methods
+from django.contrib.messages import get_messages
+from django.db.models import Count, Max
+from django.utils.functional import SimpleLazyObject
+from django.core.files.storage import default_storage
 from django.db import transaction
 from django.contrib.auth.models import User
 from django.contrib.auth.backends import ModelBackend
 
-from .models import RecruitmentSettings, Applicant, Application, Question, Answer
-from .forms import ApplicantForm, ApplicationForm, DynamicAnswerForm, EmailVerificationForm, FindEmailForm, PasswordResetRequestForm, PasswordResetConfirmForm, SignUpForm
+from .models import Applicant, Application, Answer, answer_hash
+from .forms import ApplicantForm, ApplicationForm, EmailVerificationForm, FindEmailForm, PasswordResetRequestForm, PasswordResetConfirmForm, SignUpForm
+from .recruitment import registry
+from .questions import question_schemas
+from . import metrics
+from .mail import aqueue_mail, queue_mail
+from .ratelimit import rate_limit
+from .media import serve_file
+from .photos import PHOTO_UPLOAD_ROOT, RENDITION_FORMATS, RENDITIONS, ensure_rendition, format_for_filename, rendition_filename, rendition_format
 
 def get_active_recruitment():
-    return RecruitmentSettings.objects.filter(
-        is_active=True,
-        application_start_date__lte=timezone.now(),
-        application_end_date__gte=timezone.now()
-    ).first()
+    return registry.get_active()
+
+def get_applicant(request):
+    # request.user에는 인증에 필요한 필드만 있으므로 프로필 전체가 필요한 화면에서는 다시 조회합니다
+    return Applicant.objects.get(pk=request.user.pk)
+
+async def aget_applicant(user):
+    return await Applicant.objects.aget(pk=user.pk)
 
+def async_login_required(view_func):
+    # Django 5.0의 login_required는 async 뷰를 감싸지 못하므로 request.auser()로 확인합니다
+    @wraps(view_func)
+    async def _wrapper_view(request, *args, **kwargs):
+        user = await request.auser()
+        if not user.is_authenticated:
+            return redirect_to_login(request.get_full_path())
+        return await view_func(request, user, *args, **kwargs)
+    return _wrapper_view
+
+def page_etag(request, *parts):
+    """
+    사용자별 페이지의 ETag입니다. 화면에 보이는 데이터(parts)가 같아도 사용자, 인증 상태,
+    CSRF 토큰이 다르면 다른 페이지이고, 표시할 메시지가 남아 있으면 304로 답하지 않습니다.
+    """
+    if len(get_messages(request)):
+        return None
+    user = request.user
+    key = [user.pk, user.is_authenticated and user.is_email_verified, request.META.get('CSRF_COOKIE', ''), *parts]
+    return hashlib.sha1(repr(key).encode()).hexdigest()[:32]
+
+def index_etag(request):
+    recruitment = get_active_recruitment()
+    has_application = request.user.is_authenticated and request.user.applications.exists()
+    return page_etag(request, recruitment and (recruitment.pk, recruitment.updated_at), has_application)
+
+# 브라우저가 매번 ETag로 다시 확인하도록 합니다 (내용이 같으면 304)
+@cache_control(private=True, no_cache=True)
+@condition(etag_func=index_etag)
 def index(request):
     recruitment = get_active_recruitment()
     if not recruitment:
@@ -41,26 +92,15 @@ def signup(request):
     if request.user.is_authenticated:
         return redirect('applications:index')
     
-<<<<<<< HEAD
     if request.method == 'POST':
         form = SignUpForm(request.POST, request.FILES)
         if form.is_valid():
             user = form.save()
-            login(request, user, backend='django.contrib.auth.backends.ModelBackend')
+            login(request, user, backend='applications.auth.EmailBackend')
             # 회원가입 직후 이메일 인증 메일 발송
             send_verification_email(user)
             messages.success(request, '회원가입이 완료되었습니다. 이메일로 전송된 인증 코드를 입력해주세요.')
             return redirect('applications:verify_email')
-=======
-    # 이미 로그인한 사용자의 경우
-    if request.user.is_authenticated:
-        # 지원서가 있는 경우 질문 답변 페이지로 리다이렉트
-        if request.user.applications.filter(recruitment_settings=recruitment).exists():
-            return redirect('applications:answer_questions')
-        
-        # 지원서가 없는 경우 기존 정보로 폼 초기화
-        applicant_form = ApplicantForm(instance=request.user)
->>>>>>> a26d92994d0bbae7eaea83c06e1577dfdde5c6ed
     else:
         form = SignUpForm()
     
@@ -68,16 +108,20 @@ def signup(request):
 
 @login_required
 def start_application(request):
-    recruitment_settings = get_object_or_404(RecruitmentSettings, is_active=True)
+    recruitment_settings = registry.get_current()
+    if recruitment_settings is None:
+        raise Http404('활성화된 모집이 없습니다.')
     
     # 현재 활성화된 모집 기간인지 확인
-    if not (recruitment_settings.application_start_date <= timezone.now() <= recruitment_settings.application_end_date):
+    if not registry.is_open(recruitment_settings):
         messages.error(request, '현재 지원 기간이 아닙니다.')
         return redirect('applications:index')
     
+    applicant = get_applicant(request)
+
     # 기존 지원서 확인
     existing_application = Application.objects.filter(
-        applicant=request.user,
+        applicant=applicant,
         recruitment_settings=recruitment_settings
     ).first()
     
@@ -88,53 +132,30 @@ def start_application(request):
         application = existing_application
     else:
         application = Application(
-            applicant=request.user,
+            applicant=applicant,
             recruitment_settings=recruitment_settings
         )
     
     if request.method == 'POST':
-        applicant_form = ApplicantForm(request.POST, instance=request.user)
+        applicant_form = ApplicantForm(request.POST, instance=applicant)
         application_form = ApplicationForm(request.POST, instance=application)
         
         if applicant_form.is_valid() and application_form.is_valid():
-<<<<<<< HEAD
             applicant_form.save()
-            application = application_form.save()
+            # 두 창에서 동시에 저장해도 (지원자, 모집) 유일 제약으로 지원서는 하나만 만들어집니다
+            application, created = Application.objects.get_or_create(
+                applicant=applicant,
+                recruitment_settings=recruitment_settings,
+                defaults=application_form.cleaned_data
+            )
+            if not created and not application.save_draft(application_form.cleaned_data):
+                messages.warning(request, '이미 지원서를 제출하셨습니다.')
+                return redirect('applications:view_application', application_id=application.id)
             messages.success(request, '기본 정보가 저장되었습니다.')
             return redirect('applications:verify_email')
     else:
-        applicant_form = ApplicantForm(instance=request.user)
+        applicant_form = ApplicantForm(instance=applicant)
         application_form = ApplicationForm(instance=application)
-=======
-            with transaction.atomic():
-                applicant = applicant_form.save(commit=False)
-                if not request.user.is_authenticated:
-                    # 새로운 사용자의 경우 임시 비밀번호 설정
-                    temp_password = User.objects.make_random_password()
-                    applicant.set_password(temp_password)
-                applicant.save()
-                
-                # 기존 지원서가 있는지 확인
-                application, created = Application.objects.get_or_create(
-                    applicant=applicant,
-                    recruitment_settings=recruitment,
-                    defaults={'status': 'draft'}
-                )
-                
-                # 면접 시간 업데이트
-                application.interview_times = application_form.cleaned_data['interview_times']
-                application.save()
-                
-                if not request.user.is_authenticated:
-                    # 새로운 사용자 로그인 처리
-                    login(request, applicant, backend='applications.auth.EmailBackend')
-                
-                # 이메일 인증 코드 발송
-                send_verification_email(applicant)
-                
-                messages.success(request, '이메일로 인증 코드가 발송되었습니다. 이메일을 확인해주세요.')
-                return redirect('applications:verify_email')
->>>>>>> a26d92994d0bbae7eaea83c06e1577dfdde5c6ed
     
     context = {
         'applicant_form': applicant_form,
@@ -144,8 +165,9 @@ def start_application(request):
     return render(request, 'applications/start_application.html', context)
 
 @login_required
+@rate_limit('verify_email', ['user:5/10m', 'ip:30/10m'])
 def verify_email(request):
-    applicant = request.user
+    applicant = get_applicant(request)
     if applicant.is_email_verified:
         return redirect('applications:answer_questions')
     
@@ -166,31 +188,40 @@ def verify_email(request):
         'applicant': applicant
     })
 
-@login_required
-def resend_verification_email(request):
-    applicant = request.user
+@async_login_required
+@require_http_methods(['POST'])
+@rate_limit('resend_verification', ['user:3/10m', 'ip:30/10m'])
+async def resend_verification_email(request, user):
+    applicant = await aget_applicant(user)
     if applicant.is_email_verified:
         return JsonResponse({'status': 'error', 'message': '이미 인증된 이메일입니다.'})
     
-    send_verification_email(applicant)
+    await asend_verification_email(applicant)
     return JsonResponse({'status': 'success', 'message': '인증 이메일이 재전송되었습니다.'})
 
-def send_verification_email(applicant):
-    verification_code = applicant.generate_verification_code()
+def verification_mail(applicant, verification_code):
     subject = '[피로그래밍] 이메일 인증'
     message = render_to_string('applications/email/verification.html', {
         'applicant': applicant,
         'verification_code': verification_code
     })
-    
-    send_mail(
-        subject,
-        message,
-        settings.DEFAULT_FROM_EMAIL,
-        [applicant.email],
-        html_message=message,
-        fail_silently=False
-    )
+    # 아직 발송되지 않은 인증 메일이 있으면 새 코드로 내용만 바꿉니다
+    return {
+        'subject': subject,
+        'message': message,
+        'html_message': message,
+        'dedupe_key': f'verification:{applicant.pk}',
+        'applicant': applicant,
+    }
+
+def send_verification_email(applicant):
+    verification_code = applicant.reusable_verification_code() or applicant.generate_verification_code()
+    queue_mail(applicant.email, **verification_mail(applicant, verification_code))
+
+async def asend_verification_email(applicant):
+    # 연달아 재전송을 누르면 같은 코드를 다시 보내고 지원자 행은 쓰지 않습니다
+    verification_code = applicant.reusable_verification_code() or await applicant.agenerate_verification_code()
+    await aqueue_mail(applicant.email, **verification_mail(applicant, verification_code))
 
 @login_required
 def answer_questions(request):
@@ -204,42 +235,51 @@ def answer_questions(request):
         messages.error(request, '현재 지원 기간이 아닙니다.')
         return redirect('applications:index')
     
-    # 기존 지원서 확인 또는 새로 생성
-    application = Application.objects.filter(
+    # 기존 지원서 확인 또는 새로 생성 (동시에 열린 창이 있어도 하나만 만들어집니다)
+    application, _ = Application.objects.get_or_create(
         applicant=applicant,
         recruitment_settings=recruitment_settings
-    ).first()
-    
-    if not application:
-        application = Application.objects.create(
-            applicant=applicant,
-            recruitment_settings=recruitment_settings
-        )
+    )
+    if application.status != 'draft':
+        messages.warning(request, '이미 지원서를 제출하셨습니다.')
+        return redirect('applications:view_application', application_id=application.id)
     
-    questions = Question.objects.filter(recruitment_settings=recruitment_settings)
+    # 질문 목록은 캐시에서, 폼 클래스는 질문 목록 버전별로 한 번만 만들어 둔 것을 씁니다
+    AnswerForm = question_schemas.form_class(question_schemas.get(recruitment_settings.id))
     
     if request.method == 'POST':
-        answer_form = DynamicAnswerForm(request.POST, questions=questions)
+        answer_form = AnswerForm(request.POST)
         interview_form = ApplicationForm(request.POST, instance=application)
         
         if answer_form.is_valid() and interview_form.is_valid():
-            # 면접 시간 선호도 저장
-            interview_form.save()
-            
-            # 답변 저장
-            for field_name, value in answer_form.cleaned_data.items():
-                if field_name.startswith('question_'):
-                    question_id = int(field_name.split('_')[1])
-                    question = Question.objects.get(id=question_id)
-                    Answer.objects.update_or_create(
-                        application=application,
-                        question=question,
-                        defaults={'answer_text': value}
-                    )
+            answers = {
+                int(field_name.split('_')[1]): value
+                for field_name, value in answer_form.cleaned_data.items()
+                if field_name.startswith('question_')
+            }
+            try:
+                version = int(request.POST['version'])
+            except (KeyError, ValueError):
+                version = None
+            with transaction.atomic():
+                # 면접 시간 선호도 저장. 페이지를 연 뒤 다른 창에서 먼저 저장했다면 덮어쓰지 않습니다.
+                saved = application.save_draft(interview_form.cleaned_data, version=version)
+                # 답변 저장
+                if saved:
+                    Answer.objects.save_answers(application, answers)
             
-            if 'save_draft' in request.POST:
+            if not saved:
+                application.refresh_from_db()
+                if application.status != 'draft':
+                    messages.warning(request, '이미 지원서를 제출하셨습니다.')
+                    return redirect('applications:view_application', application_id=application.id)
+                if request.headers.get('x-requested-with') == 'XMLHttpRequest':
+                    return JsonResponse({'status': 'conflict', 'version': application.version}, status=409)
+                # 입력한 내용은 폼에 남겨 두고 최신 버전으로 다시 저장할 수 있게 합니다
+                messages.error(request, '다른 창에서 지원서가 수정되었습니다. 내용을 확인한 뒤 다시 저장해주세요.')
+            elif 'save_draft' in request.POST:
                 if request.headers.get('x-requested-with') == 'XMLHttpRequest':
-                    return JsonResponse({'status': 'success'})
+                    return JsonResponse({'status': 'success', 'version': application.version})
                 messages.success(request, '임시저장되었습니다.')
                 return redirect('applications:answer_questions')
             else:
@@ -253,43 +293,164 @@ def answer_questions(request):
                     messages.error(request, '면접 가능 시간을 최소 한 개 이상 선택해주세요.')
                     return redirect('applications:answer_questions')
                 
-                application.submit()
-                messages.success(request, '지원서가 성공적으로 제출되었습니다.')
+                if application.submit():
+                    messages.success(request, '지원서가 성공적으로 제출되었습니다.')
                 return redirect('applications:application_complete')
     else:
         initial_data = {
             f'question_{answer.question_id}': answer.answer_text
             for answer in Answer.objects.filter(application=application)
         }
-        answer_form = DynamicAnswerForm(initial=initial_data, questions=questions)
+        answer_form = AnswerForm(initial=initial_data)
         interview_form = ApplicationForm(instance=application)
     
+    # 자동 저장 스크립트가 변경 여부를 판단하는 기준 해시
+    answer_hashes = {
+        field_name.split('_')[1]: answer_hash(answer_form.initial.get(field_name, ''))
+        for field_name in answer_form.fields
+    } if not answer_form.is_bound else {}
+    
     return render(request, 'applications/answer_questions.html', {
         'answer_form': answer_form,
         'interview_form': interview_form,
         'application': application,
-        'recruitment_settings': recruitment_settings
+        'recruitment_settings': recruitment_settings,
+        'answer_hashes': answer_hashes,
     })
 
+INTERVIEW_PREFERENCE_FIELDS = [
+    'interview_sat_morning', 'interview_sat_afternoon',
+    'interview_sun_morning', 'interview_sun_afternoon',
+]
+
+@async_login_required
+@require_http_methods(['POST'])
+async def autosave_answers(request, user):
+    """
+    변경된 답변만 받는 자동 저장 엔드포인트입니다.
+
+    요청 본문: {"answers": {"<question_id>": {"text": "...", "base": "<hash>"}},
+               "interview": {"interview_sat_morning": true, ...}}
+    변경 사항이 없으면 204를, 저장하면 새 해시를, 다른 탭과 충돌하면 409를 돌려줍니다.
+    """
+    try:
+        payload = json.loads(request.body or b'{}')
+        answers = payload.get('answers') or {}
+        interview = payload.get('interview') or {}
+        changes = {
+            int(question_id): (str(change['text']), change.get('base'))
+            for question_id, change in answers.items()
+        }
+    except (ValueError, TypeError, KeyError, AttributeError):
+        return JsonResponse({'status': 'error', 'message': '잘못된 요청입니다.'}, status=400)
+
+    interview = {
+        field: bool(value) for field, value in interview.items()
+        if field in INTERVIEW_PREFERENCE_FIELDS
+    }
+    if not changes and not interview:
+        return HttpResponse(status=204)
+
+    if not user.is_email_verified:
+        return JsonResponse({'status': 'error', 'message': '이메일 인증이 필요합니다.'}, status=403)
+
+    recruitment_settings = await sync_to_async(get_active_recruitment)()
+    if not recruitment_settings:
+        return JsonResponse({'status': 'error', 'message': '현재 지원 기간이 아닙니다.'}, status=403)
+
+    if changes:
+        schema = await sync_to_async(question_schemas.get)(recruitment_settings.id)
+        max_lengths = schema.max_lengths
+        for question_id, (text, base_hash) in changes.items():
+            if question_id not in max_lengths or len(text) > max_lengths[question_id]:
+                return JsonResponse({'status': 'error', 'message': '잘못된 답변입니다.', 'question': question_id}, status=400)
+
+    # transaction.atomic은 async 코드에서 쓸 수 없으므로 저장은 한 번의 동기 호출로 처리합니다
+    application, saved, conflicts, interview = await sync_to_async(save_autosave)(
+        user, recruitment_settings, changes, interview
+    )
+    if not application:
+        return JsonResponse({'status': 'error', 'message': '작성 중인 지원서가 없습니다.'}, status=409)
+
+    if conflicts:
+        return JsonResponse({'status': 'conflict', 'saved': saved, 'conflicts': conflicts, 'version': application.version}, status=409)
+    if not saved and not interview:
+        return HttpResponse(status=204)
+    return JsonResponse({'status': 'success', 'saved': saved, 'version': application.version})
+
+def save_autosave(user, recruitment_settings, changes, interview):
+    with transaction.atomic():
+        # 같은 지원서에 대한 저장이 차례로 처리되도록 행을 잠급니다 (SQLite는 BEGIN IMMEDIATE로 직렬화됩니다)
+        application = Application.objects.select_for_update().filter(
+            applicant=user,
+            recruitment_settings=recruitment_settings,
+            status='draft'
+        ).first()
+        if not application:
+            return None, [], [], {}
+
+        saved, conflicts = Answer.objects.save_answer_changes(application, changes)
+        interview = {
+            field: value for field, value in interview.items()
+            if getattr(application, field) != value
+        }
+        if saved or interview:
+            application.save_draft(interview, version=application.version)
+    return application, saved, conflicts, interview
+
 @login_required
 def application_complete(request):
-    application = get_object_or_404(Application, applicant=request.user)
-    if application.status != 'submitted':
+    # 모집 기수마다 지원서가 하나씩 있을 수 있으므로 가장 최근에 제출한 지원서를 보여줍니다
+    application = Application.objects.filter(
+        applicant=request.user,
+        status='submitted'
+    ).order_by('-submitted_at').first()
+    if application is None:
         return redirect('applications:answer_questions')
     
     return render(request, 'applications/application_complete.html', {
         'application': application
     })
 
+def application_validators(request, application_id):
+    # ETag와 Last-Modified를 한 번의 조회로 계산해 요청에 보관합니다
+    if not hasattr(request, '_application_validators'):
+        row = Application.objects.filter(id=application_id, applicant=request.user).values(
+            'version', 'status', 'updated_at', 'recruitment_settings_id', 'recruitment_settings__updated_at',
+            'applicant__updated_at', 'applicant__photo', 'applicant__photo_status', 'applicant__photo_digest'
+        ).first()
+        if row is None:
+            request._application_validators = (None, None)
+        else:
+            # 질문 문구를 고쳐도 지원서와 모집 설정의 수정 시각은 그대로이므로 질문 목록 버전을 함께 넣습니다
+            question_version = question_schemas.get(row['recruitment_settings_id']).version
+            etag = page_etag(request, *row.values(), question_version)
+            last_modified = max(row['updated_at'], row['recruitment_settings__updated_at'], row['applicant__updated_at'])
+            request._application_validators = (etag, last_modified if etag else None)
+    return request._application_validators
+
+def build_answers(application):
+    return [
+        {
+            'question': answer.question.question_text,
+            'answer': answer.answer_text,
+            'max_length': answer.question.max_length
+        }
+        for answer in application.answer_set.select_related('question')
+    ]
+
 @login_required
+@cache_control(private=True, no_cache=True)
+@condition(
+    etag_func=lambda request, application_id: application_validators(request, application_id)[0],
+    last_modified_func=lambda request, application_id: application_validators(request, application_id)[1],
+)
 def view_application(request, application_id):
     # 현재 로그인한 사용자의 지원서만 조회 가능
     try:
         application = Application.objects.select_related(
             'applicant',
             'recruitment_settings'
-        ).prefetch_related(
-            'answer_set__question'  # 질문과 답변을 한 번에 가져옴
         ).get(
             id=application_id,
             applicant=request.user  # 현재 로그인한 사용자의 지원서만 조회
@@ -309,25 +470,22 @@ def view_application(request, application_id):
     if application.interview_sun_afternoon:
         interview_times.append('일요일 오후 (14:00 ~ 17:00)')
     
-    # 답변 정보 정리
-    answers = []
-    for answer in application.answer_set.all():
-        answers.append({
-            'question': answer.question.question_text,
-            'answer': answer.answer_text,
-            'max_length': answer.question.max_length
-        })
+    # 답변 목록은 템플릿 조각 캐시에 없을 때만 조회합니다
+    answers = SimpleLazyObject(lambda: build_answers(application))
     
     context = {
         'application': application,
         'interview_times': interview_times,
         'answers': answers,
+        'answers_cache_timeout': settings.ANSWERS_FRAGMENT_CACHE_TIMEOUT,
+        'question_version': question_schemas.get(application.recruitment_settings_id).version,
         'status_display': application.get_status_display(),
         'submitted_at': application.submitted_at,
     }
     
     return render(request, 'applications/view_application.html', context)
 
+@rate_limit('find_email', ['ip:10/h'])
 def find_email(request):
     if request.method == 'POST':
         form = FindEmailForm(request.POST)
@@ -346,15 +504,19 @@ def find_email(request):
     
     return render(request, 'applications/find_email.html', {'form': form})
 
-def reset_password_request(request):
+@rate_limit('password_reset', ['ip:10/h', 'email:3/h'])
+async def reset_password_request(request):
     if request.method == 'POST':
         form = PasswordResetRequestForm(request.POST)
         if form.is_valid():
             email = form.cleaned_data['email']
             try:
-                applicant = Applicant.objects.get(email=email)
+                applicant = await Applicant.objects.aget(email=email)
+            except Applicant.DoesNotExist:
+                messages.error(request, '입력하신 이메일과 일치하는 회원이 없습니다.')
+            else:
                 # 비밀번호 재설정 토큰 생성 (24시간 유효)
-                token = applicant.generate_password_reset_token()
+                token = await applicant.agenerate_password_reset_token()
                 
                 # 이메일 발송
                 subject = '[피로그래밍] 비밀번호 재설정'
@@ -365,23 +527,22 @@ def reset_password_request(request):
                     )
                 })
                 
-                send_mail(
+                await aqueue_mail(
+                    email,
                     subject,
                     message,
-                    settings.DEFAULT_FROM_EMAIL,
-                    [email],
                     html_message=message,
-                    fail_silently=False
+                    dedupe_key=f'password_reset:{applicant.pk}',
+                    applicant=applicant
                 )
                 
                 messages.success(request, '비밀번호 재설정 링크가 이메일로 발송되었습니다.')
                 return redirect('login')
-            except Applicant.DoesNotExist:
-                messages.error(request, '입력하신 이메일과 일치하는 회원이 없습니다.')
     else:
         form = PasswordResetRequestForm()
     
-    return render(request, 'applications/reset_password_request.html', {'form': form})
+    # 레이아웃 템플릿이 request.user를 읽으며 DB를 조회할 수 있으므로 렌더링은 동기 코드로 합니다
+    return await sync_to_async(render)(request, 'applications/reset_password_request.html', {'form': form})
 
 def reset_password_confirm(request, token):
     try:
@@ -397,7 +558,7 @@ def reset_password_confirm(request, token):
                 # 새 비밀번호 설정
                 applicant.set_password(form.cleaned_data['new_password1'])
                 # 토큰 초기화
-                applicant.password_reset_token = ''
+                applicant.password_reset_token = None
                 applicant.token_generated_at = None
                 applicant.save()
                 
@@ -412,7 +573,67 @@ def reset_password_confirm(request, token):
         messages.error(request, '유효하지 않거나 만료된 링크입니다.')
         return redirect('login')
 
+def application_list_etag(request):
+    summary = Application.objects.filter(applicant=request.user).aggregate(
+        count=Count('id'), updated_at=Max('updated_at'), recruitment_updated_at=Max('recruitment_settings__updated_at')
+    )
+    return page_etag(request, *summary.values())
+
 @login_required
+@cache_control(private=True, no_cache=True)
+@condition(etag_func=application_list_etag)
 def application_list(request):
-    applications = Application.objects.filter(applicant=request.user)
+    applications = Application.objects.filter(applicant=request.user).select_related('recruitment_settings')
     return render(request, 'applications/application_list.html', {'applications': applications})
+
+@login_required
+@require_http_methods(['GET', 'HEAD'])
+def photo_rendition(request, applicant_id, rendition, filename):
+    # 본인 또는 운영진만 볼 수 있습니다
+    if rendition not in RENDITIONS or not (request.user.is_staff or request.user.pk == applicant_id):
+        raise Http404
+    applicant = get_object_or_404(
+        Applicant.objects.only('id', 'photo', 'photo_status', 'photo_digest'),
+        pk=applicant_id
+    )
+    digest = applicant.get_photo_digest()
+    format = format_for_filename(filename)
+    if not digest or format not in ('jpeg', rendition_format()) or filename != rendition_filename(digest, rendition, format):
+        raise Http404
+
+    # 파일 이름이 내용 해시이므로 한 번 받은 사진은 다시 검증할 필요가 없습니다
+    headers = {
+        'ETag': f'"{filename}"',
+        'Cache-Control': 'private, max-age=31536000, immutable',
+    }
+    if request.headers.get('If-None-Match') == headers['ETag']:
+        return HttpResponseNotModified(headers=headers)
+
+    name = ensure_rendition(applicant.photo, rendition, filename)
+    return serve_file(
+        request, applicant.photo.storage, name,
+        content_type=RENDITION_FORMATS[format][2], headers=headers, etag=headers['ETag']
+    )
+
+
+@login_required
+@require_http_methods(['GET', 'HEAD'])
+def protected_media(request, path):
+    # 업로드한 원본 사진은 본인 또는 운영진만 받을 수 있고, 그 밖의 미디어 파일은 내보내지 않습니다
+    name = posixpath.normpath(path)
+    if name != path or not name.startswith(PHOTO_UPLOAD_ROOT):
+        raise Http404
+    owners = Applicant.objects.filter(photo=name)
+    if not request.user.is_staff:
+        owners = owners.filter(pk=request.user.pk)
+    if not owners.exists():
+        raise Http404
+    # 다시 올린 사진은 다른 이름으로 저장되지만, 이름이 내용 해시는 아니므로 매번 ETag로 확인합니다
+    return serve_file(request, default_storage, name, headers={'Cache-Control': 'private, no-cache'})
+
+
+@staff_member_required
+@require_http_methods(['GET'])
+def request_metrics(request):
+    # 이 프로세스가 처리한 요청의 URL 이름별 처리 시간/쿼리 수 분포
+    return JsonResponse(metrics.registry.snapshot(), json_dumps_params={'ensure_ascii': False})
@@ -0,0 +1,35 @@
+# gunicorn 배포 프로필. 저장소 루트에서 `gunicorn`만 실행하면 이 파일을 읽습니다.
+#
+#   동기(WSGI, 기본):  GUNICORN_WORKER_CLASS=gthread gunicorn
+#   비동기(ASGI):      GUNICORN_WORKER_CLASS=uvicorn.workers.UvicornWorker gunicorn
+import multiprocessing
+import os
+
+worker_class = os.getenv('GUNICORN_WORKER_CLASS', 'gthread')
+asgi = worker_class.startswith('uvicorn')
+wsgi_app = 'piro_hire.asgi:application' if asgi else 'piro_hire.wsgi:application'
+
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:8000')
+workers = int(os.getenv('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+# gthread 워커는 스레드 수만큼만 동시에 처리합니다. uvicorn 워커는 이벤트 루프 하나로 처리하므로 무시됩니다.
+threads = int(os.getenv('GUNICORN_THREADS', 4))
+timeout = int(os.getenv('GUNICORN_TIMEOUT', 30))
+keepalive = 5
+# 마스터에서 앱을 한 번 불러오고(템플릿 미리 파싱 포함) 워커를 fork하므로 새 워커가 바로 요청을 받습니다
+preload_app = os.getenv('GUNICORN_PRELOAD', 'True') == 'True'
+# 메모리 누수가 쌓이지 않도록 일정 요청마다 워커를 다시 띄웁니다
+max_requests = 2000
+max_requests_jitter = 200
+accesslog = '-'
+
+
+def on_starting(server):
+    # 워커가 여럿인데 캐시가 워커마다 따로면 요청 제한이 워커 수만큼 늘고 로그아웃/캐시 무효화가 어긋나므로 띄우지 않습니다
+    if server.cfg.workers < 2:
+        return
+    import django
+    from django.core.management import call_command
+
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'piro_hire.settings')
+    django.setup()
+    call_command('check', deploy=True, tags=['caches'], fail_level='ERROR')
@@ -14,3 +14,7 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'piro_hire.settings')
 
 application = get_asgi_application()
+
+from applications.metrics import warm_up_templates  # noqa: E402
+
+warm_up_templates()
@@ -14,6 +14,8 @@ import os
 from pathlib import Path
 from dotenv import load_dotenv
 
+from .database import database_config
+
 load_dotenv()
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -52,13 +54,16 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'applications.middleware.RequestMetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
+    'applications.middleware.SlidingSessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'applications.middleware.RateLimitMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -67,9 +72,8 @@ ROOT_URLCONF = 'piro_hire.urls'
 
 TEMPLATES = [
     {
-        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        'BACKEND': 'applications.metrics.TimedDjangoTemplates',
         'DIRS': [os.path.join(BASE_DIR, 'templates')],
-        'APP_DIRS': True,
         'OPTIONS': {
             'context_processors': [
                 'django.template.context_processors.debug',
@@ -77,9 +81,20 @@ TEMPLATES = [
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
             ],
+            # 템플릿은 처음 읽을 때 한 번만 파싱해 프로세스에 보관합니다 (DEBUG와 관계없이).
+            # 개발 서버는 템플릿 파일이 바뀌면 캐시를 비웁니다. 로더를 지정하므로 APP_DIRS는 쓰지 않습니다.
+            'loaders': [
+                ('applications.metrics.TimedCachedLoader', [
+                    'django.template.loaders.filesystem.Loader',
+                    'django.template.loaders.app_directories.Loader',
+                ]),
+            ],
+            'debug': DEBUG,
         },
     },
 ]
+# 워커가 뜰 때 templates/ 아래 템플릿을 모두 미리 파싱합니다 (piro_hire/wsgi.py, asgi.py)
+TEMPLATE_WARMUP = os.getenv('TEMPLATE_WARMUP', str(not DEBUG)) == 'True'
 
 WSGI_APPLICATION = 'piro_hire.wsgi.application'
 
@@ -87,11 +102,9 @@ WSGI_APPLICATION = 'piro_hire.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.1/ref/settings/#databases
 
+# DATABASE_URL로 PostgreSQL 또는 SQLite를 고릅니다 (piro_hire/database.py 참고)
 DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
-    }
+    'default': database_config(BASE_DIR),
 }
 
 
@@ -113,6 +126,22 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Password hashing
+# PASSWORD_HASHER로 새 비밀번호에 쓸 해시를 고릅니다: pbkdf2(기본), scrypt, argon2(argon2-cffi 필요)
+# 나머지 해시는 기존 비밀번호 확인용으로 남아 있고, 로그인할 때 선택한 해시로 다시 저장됩니다.
+PASSWORD_HASHER = os.getenv('PASSWORD_HASHER', 'pbkdf2')
+PASSWORD_HASHERS = sorted([
+    'applications.hashers.PBKDF2PasswordHasher',
+    'applications.hashers.ScryptPasswordHasher',
+    'applications.hashers.Argon2PasswordHasher',
+], key=lambda path: PASSWORD_HASHER.lower() not in path.lower())
+# 해시 강도. 지정하지 않은 값은 Django 기본값을 씁니다.
+PASSWORD_HASHER_OPTIONS = {
+    name: int(os.getenv(f'PASSWORD_{name}'))
+    for name in ['PBKDF2_ITERATIONS', 'SCRYPT_WORK_FACTOR', 'ARGON2_TIME_COST', 'ARGON2_MEMORY_COST', 'ARGON2_PARALLELISM']
+    if os.getenv(f'PASSWORD_{name}')
+}
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/5.1/topics/i18n/
@@ -134,10 +163,30 @@ STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
 STATICFILES_DIRS = [
     os.path.join(BASE_DIR, 'static'),
 ]
+# collectstatic이 파일 이름에 내용 해시를 붙이고 gzip/brotli로 미리 압축해 둡니다 (WhiteNoise).
+# 해시가 붙은 파일은 WhiteNoise가 immutable로 10년 캐시하게 하므로 브라우저가 다시 확인하지 않습니다.
+# 매니페스트가 있어야 동작하므로 collectstatic(python manage.py build_static) 후에 켭니다.
+STATIC_MANIFEST = os.getenv('STATIC_MANIFEST', str(not DEBUG)) == 'True'
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': (
+            'whitenoise.storage.CompressedManifestStaticFilesStorage' if STATIC_MANIFEST
+            else 'django.contrib.staticfiles.storage.StaticFilesStorage'
+        ),
+    },
+}
 
 # Media files
 MEDIA_URL = 'media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
+# 미디어 파일은 Django가 권한만 확인하고 전송은 웹 서버에 맡깁니다.
+# 'nginx'(X-Accel-Redirect), 'xsendfile'(Apache mod_xsendfile 등의 X-Sendfile), 비우면 Django가 직접 보냅니다.
+MEDIA_SENDFILE = os.getenv('MEDIA_SENDFILE', '')
+# nginx에서 MEDIA_ROOT를 가리키는 internal location 경로
+MEDIA_ACCEL_REDIRECT_PREFIX = os.getenv('MEDIA_ACCEL_REDIRECT_PREFIX', '/protected-media/')
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.1/ref/settings/#default-auto-field
@@ -175,6 +224,73 @@ AUTH_USER_MODEL = 'applications.Applicant'
 # Custom authentication form
 LOGIN_FORM = 'applications.forms.CustomAuthenticationForm'
 
+# Cache
+# 세션, 로그인 사용자, 요청 제한, 모집/질문 캐시는 모든 워커가 같은 값을 봐야 합니다.
+# 워커마다 따로 갖는 메모리 캐시를 쓰면 로그아웃한 세션이 다른 워커에 남고 요청 제한이 워커 수만큼 늘어납니다.
+REDIS_URL = os.getenv('REDIS_URL', '')
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        },
+    }
+elif DEBUG:
+    # 개발 서버는 프로세스 하나로 동작하므로 메모리 캐시로 충분합니다
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        },
+    }
+else:
+    # Redis가 없으면 DB 테이블을 공유 캐시로 씁니다 (python manage.py createcachetable)
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+            'LOCATION': 'django_cache',
+        },
+    }
+
 # Session settings
+# 세션은 캐시에서 읽고 DB에도 써 두어 캐시가 비어도 유지됩니다.
+# 캐시가 DB 테이블이면 조회만 두 번 하게 되므로 DB 세션을 바로 씁니다.
+SESSION_ENGINE = (
+    'django.contrib.sessions.backends.db'
+    if CACHES['default']['BACKEND'].endswith('DatabaseCache')
+    else 'django.contrib.sessions.backends.cached_db'
+)
 SESSION_COOKIE_AGE = 3600  # 1 hour
-SESSION_SAVE_EVERY_REQUEST = True
+# 매 요청 저장하는 대신, 남은 수명이 이 값(초)보다 적을 때만 만료 시각을 갱신합니다
+# (SlidingSessionMiddleware). 기본값이면 사용자당 최대 10분에 한 번 씁니다.
+SESSION_SAVE_EVERY_REQUEST = False
+SESSION_REFRESH_THRESHOLD = int(os.getenv('SESSION_REFRESH_THRESHOLD', 3000))
+# 로그인한 사용자(request.user)를 캐시해 두는 시간(초). 지원자 정보가 저장되면 커밋 후 지워집니다.
+# 다른 워커의 캐시를 지울 수 있는 Redis에서만 켭니다. DB 캐시는 사용자를 직접 조회하는 것과 비용이 같습니다.
+AUTH_USER_CACHE_TIMEOUT = 60 if REDIS_URL else 0
+# 지원서 확인 화면의 답변 목록 조각을 캐시해 두는 시간(초). 지원서 버전이 바뀌면 새로 만듭니다.
+ANSWERS_FRAGMENT_CACHE_TIMEOUT = 60 * 60 * 24
+# 모집 기수별 질문 목록을 캐시해 두는 시간(초). 질문이 저장/삭제되면 커밋 후 지워집니다.
+QUESTION_SCHEMA_CACHE_TIMEOUT = 300
+# 답변이 마지막으로 바뀌고 이 시간(초)이 지나면 index_applications 워커가 검색 문서를 다시 만듭니다
+SEARCH_INDEX_DELAY = int(os.getenv('SEARCH_INDEX_DELAY', 5))
+
+# Request metrics (RequestMetricsMiddleware)
+# 이보다 오래 걸리거나(ms) 쿼리가 많은 요청은 실행된 SQL과 함께 applications.metrics 로거에 남깁니다.
+REQUEST_METRICS_SLOW_MS = int(os.getenv('REQUEST_METRICS_SLOW_MS', 500))
+REQUEST_METRICS_SLOW_QUERIES = int(os.getenv('REQUEST_METRICS_SLOW_QUERIES', 50))
+
+# Rate limiting (applications.ratelimit)
+# 규칙은 '키:용량/기간' 형식입니다. 키는 ip, user, email 중 하나이고, 용량만큼 연속 요청을 허용한 뒤
+# 기간/용량마다 하나씩 다시 허용합니다. 여기에는 데코레이터를 붙일 수 없는 뷰(URL 이름)의 POST 제한을 적습니다.
+RATE_LIMITS = {
+    'login': ['ip:20/10m', 'email:5/10m'],
+    'admin:login': ['ip:20/10m', 'email:5/10m'],
+}
+# 프록시(nginx 등) 뒤에서 실행할 때만 켭니다. 켜면 X-Forwarded-For의 첫 주소로 IP를 셉니다.
+RATE_LIMIT_TRUST_X_FORWARDED_FOR = os.getenv('RATE_LIMIT_TRUST_X_FORWARDED_FOR', 'False') == 'True'
+# 이 시간(초) 안에 만든 인증 코드가 아직 유효하면 재전송할 때 새 코드를 만들지 않습니다
+VERIFICATION_RESEND_COOLDOWN = 600
+
+# Applicant photos
+# 화면별 사진(썸네일/상세/인쇄)을 저장할 형식: jpeg, webp, avif (Pillow가 지원하지 않으면 jpeg)
+PHOTO_RENDITION_FORMAT = os.getenv('PHOTO_RENDITION_FORMAT', 'jpeg')
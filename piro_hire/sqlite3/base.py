@@ -0,0 +1,25 @@
+from django.db.backends.sqlite3 import base
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """
+    동시에 여러 요청이 쓸 때 'database is locked' 오류가 나지 않도록 조정한 SQLite 백엔드입니다.
+
+    - WAL: 읽기와 쓰기가 서로를 막지 않습니다.
+    - synchronous=NORMAL: WAL에서는 커밋마다 fsync하지 않아도 DB가 깨지지 않습니다.
+    - BEGIN IMMEDIATE: 트랜잭션을 시작할 때 쓰기 잠금을 잡습니다. 읽기로 시작한 트랜잭션이
+      쓰기로 바뀌는 순간 바로 실패하는 대신, OPTIONS의 timeout 동안 차례를 기다립니다.
+    """
+    PRAGMAS = {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+    }
+
+    def get_new_connection(self, conn_params):
+        conn = super().get_new_connection(conn_params)
+        for name, value in self.PRAGMAS.items():
+            conn.execute(f'PRAGMA {name} = {value}')
+        return conn
+
+    def _start_transaction_under_autocommit(self):
+        self.cursor().execute('BEGIN IMMEDIATE')
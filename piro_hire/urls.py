@@ -17,10 +17,10 @@ Including another URLconf
 from django.contrib import admin
 from django.urls import path, include
 from django.conf import settings
-from django.conf.urls.static import static
 from django.views.generic import RedirectView
 from django.contrib.auth import views as auth_views
 from applications.forms import CustomAuthenticationForm
+from applications.views import protected_media
 
 urlpatterns = [
     path('admin/', admin.site.urls),
@@ -29,4 +29,6 @@ urlpatterns = [
         authentication_form=CustomAuthenticationForm
     ), name='login'),
     path('accounts/logout/', auth_views.LogoutView.as_view(), name='logout'),
-] + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+    # 미디어 파일은 권한을 확인한 뒤 보냅니다 (MEDIA_SENDFILE이면 웹 서버가 전송)
+    path(f'{settings.MEDIA_URL.strip("/")}/<path:path>', protected_media, name='protected_media'),
+]
@@ -14,3 +14,7 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'piro_hire.settings')
 
 application = get_wsgi_application()
+
+from applications.metrics import warm_up_templates  # noqa: E402
+
+warm_up_templates()
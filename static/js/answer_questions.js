@@ -0,0 +1,223 @@
+// 글자 수 카운트 및 유효성 검사
+function updateCharCount(textarea) {
+    const currentLength = textarea.value.length;
+    const maxLength = parseInt(textarea.getAttribute('maxlength'));
+    const countWrapper = textarea.parentElement.querySelector('.char-count-wrapper');
+    const currentCount = countWrapper.querySelector('.current-count');
+
+    currentCount.textContent = currentLength;
+
+    if (currentLength > maxLength) {
+        countWrapper.classList.add('text-danger');
+        textarea.classList.add('is-invalid');
+    } else {
+        countWrapper.classList.remove('text-danger');
+        textarea.classList.remove('is-invalid');
+    }
+}
+
+// 모든 textarea에 이벤트 리스너 추가
+document.addEventListener('DOMContentLoaded', function() {
+    const textareas = document.querySelectorAll('textarea');
+    textareas.forEach(textarea => {
+        // 초기 글자 수 표시
+        updateCharCount(textarea);
+
+        // 입력할 때마다 글자 수 업데이트
+        textarea.addEventListener('input', function() {
+            updateCharCount(this);
+        });
+
+        // 붙여넣기 시에도 글자 수 업데이트
+        textarea.addEventListener('paste', function() {
+            setTimeout(() => updateCharCount(this), 0);
+        });
+    });
+});
+
+function confirmSave(type) {
+    const form = document.getElementById('answerForm');
+    const textareas = form.querySelectorAll('textarea');
+    let hasExceeded = false;
+
+    // 글자 수 초과 검사
+    textareas.forEach(textarea => {
+        const currentLength = textarea.value.length;
+        const maxLength = parseInt(textarea.getAttribute('maxlength'));
+        if (currentLength > maxLength) {
+            hasExceeded = true;
+        }
+    });
+
+    if (hasExceeded) {
+        alert('글자 수 제한을 초과한 항목이 있습니다. 수정 후 다시 시도해주세요.');
+        return false;
+    }
+
+    if (type === 'submit') {
+        const required = Array.from(form.querySelectorAll('[required]'));
+        const empty = required.some(field => !field.value.trim());
+
+        if (empty) {
+            alert('모든 필수 항목을 작성해주세요.');
+            return false;
+        }
+
+        // 면접 시간 선택 확인
+        const interviewTimes = Array.from(form.querySelectorAll('input[type="checkbox"]'));
+        const selectedTimes = interviewTimes.filter(checkbox => checkbox.checked);
+
+        if (selectedTimes.length === 0) {
+            alert('면접 가능 시간을 최소 한 개 이상 선택해주세요.');
+            return false;
+        }
+
+        return confirm('최종 제출하시겠습니까?\n제출 후에는 수정이 불가능합니다.');
+    }
+
+    return true;
+}
+
+// 변경된 답변만 몇 초 간격으로 자동 저장합니다
+const AUTOSAVE_DELAY = 3000;
+const autosaveUrl = document.getElementById('answerForm').dataset.autosaveUrl;
+const answerHashes = JSON.parse(document.getElementById('answer-hashes').textContent);
+const dirtyAnswers = new Set();
+const dirtyInterview = new Set();
+let autosaveTimer = null;
+let autosaveInFlight = false;
+let formSubmitting = false;
+
+function scheduleAutosave() {
+    clearTimeout(autosaveTimer);
+    autosaveTimer = setTimeout(autosave, AUTOSAVE_DELAY);
+}
+
+// 자동 저장 결과를 폼 아래에 보여줍니다. 실패하면 빨간 글씨로 남겨 저장되지 않았음을 알립니다.
+function showAutosaveStatus(message, isError) {
+    const status = document.getElementById('autosaveStatus');
+    if (!status) {
+        return;
+    }
+    status.textContent = message;
+    status.classList.toggle('text-danger', isError);
+    status.classList.toggle('text-muted', !isError);
+}
+
+function autosave(options = {}) {
+    // 페이지를 떠날 때는 진행 중인 저장을 기다릴 수 없으므로 바로 보냅니다
+    if (autosaveInFlight && !options.keepalive) {
+        scheduleAutosave();
+        return;
+    }
+    if (dirtyAnswers.size === 0 && dirtyInterview.size === 0) {
+        return;
+    }
+
+    const form = document.getElementById('answerForm');
+    const sentAnswers = Array.from(dirtyAnswers);
+    const sentInterview = Array.from(dirtyInterview);
+    const payload = {answers: {}, interview: {}};
+    sentAnswers.forEach(name => {
+        const questionId = name.split('_')[1];
+        payload.answers[questionId] = {text: form.elements[name].value, base: answerHashes[questionId] || null};
+    });
+    sentInterview.forEach(name => {
+        payload.interview[name] = form.elements[name].checked;
+    });
+    dirtyAnswers.clear();
+    dirtyInterview.clear();
+
+    // 전송한 내용을 다시 변경 목록에 넣어 다음 저장 때 재시도합니다
+    function requeue() {
+        sentAnswers.forEach(name => dirtyAnswers.add(name));
+        sentInterview.forEach(name => dirtyInterview.add(name));
+    }
+
+    autosaveInFlight = true;
+    fetch(autosaveUrl, {
+        method: 'POST',
+        body: JSON.stringify(payload),
+        // 페이지를 닫거나 이동해도 요청이 취소되지 않도록 합니다
+        keepalive: Boolean(options.keepalive),
+        headers: {
+            'Content-Type': 'application/json',
+            'X-CSRFToken': form.elements['csrfmiddlewaretoken'].value,
+            'X-Requested-With': 'XMLHttpRequest'
+        }
+    })
+    .then(response => {
+        if (response.status === 204) {
+            return {status: 'success'};
+        }
+        return response.json()
+            .catch(() => ({status: 'error', message: `자동 저장에 실패했습니다 (${response.status}).`}))
+            .then(data => {
+                if (!response.ok && data.status === 'success') {
+                    data.status = 'error';
+                }
+                data.retry = response.status >= 500;
+                return data;
+            });
+    })
+    .then(data => {
+        Object.assign(answerHashes, data.saved || {});
+        if (data.version !== undefined) {
+            // 폼으로 저장/제출할 때 이 창의 자동 저장을 다른 창의 수정으로 오인하지 않도록 합니다
+            form.elements['version'].value = data.version;
+        }
+        if (data.status === 'success') {
+            showAutosaveStatus('자동 저장됨 ' + new Date().toLocaleTimeString(), false);
+            console.log('Auto-saved at ' + new Date().toLocaleTimeString());
+        } else if (data.status === 'conflict') {
+            showAutosaveStatus('다른 창에서 수정된 답변이 있어 자동 저장하지 못했습니다.', true);
+            alert('다른 창에서 수정된 답변이 있습니다. 페이지를 새로고침한 뒤 다시 작성해주세요.');
+        } else {
+            requeue();
+            showAutosaveStatus(data.message || '자동 저장에 실패했습니다.', true);
+            console.error('Auto-save failed:', data.message);
+            if (data.retry) {
+                scheduleAutosave();
+            }
+        }
+    })
+    .catch(error => {
+        // 네트워크 오류는 잠시 뒤 다시 시도합니다
+        requeue();
+        showAutosaveStatus('자동 저장에 실패했습니다. 연결을 확인해주세요.', true);
+        console.error('Auto-save failed:', error);
+        scheduleAutosave();
+    })
+    .finally(() => {
+        autosaveInFlight = false;
+    });
+}
+
+document.addEventListener('DOMContentLoaded', function() {
+    const form = document.getElementById('answerForm');
+    form.addEventListener('submit', function() {
+        // 폼 전송에 모든 내용이 담기므로, 페이지를 떠날 때 자동 저장을 따로 보내지 않습니다
+        formSubmitting = true;
+        clearTimeout(autosaveTimer);
+    });
+    form.querySelectorAll('textarea').forEach(textarea => {
+        textarea.addEventListener('input', function() {
+            dirtyAnswers.add(this.name);
+            scheduleAutosave();
+        });
+    });
+    form.querySelectorAll('input[type="checkbox"]').forEach(checkbox => {
+        checkbox.addEventListener('change', function() {
+            dirtyInterview.add(this.name);
+            scheduleAutosave();
+        });
+    });
+});
+
+// 페이지를 떠나기 전에 남은 변경 사항을 저장합니다
+window.addEventListener('beforeunload', () => {
+    clearTimeout(autosaveTimer);
+    if (!formSubmitting) {
+        autosave({keepalive: true});
+    }
+});